@@ -0,0 +1,79 @@
+"""
+Benchmark: compiled grade-band lookup vs the original linear scan
+Run: python benchmarks/bench_assign_grade.py
+"""
+
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gpa_batch import assign_grades  # noqa: E402
+from gpa_core import GRADE_TABLE, assign_grade  # noqa: E402
+
+
+# The original inclusive integer ranges: each band stopped one below the next band's min
+LINEAR_GRADE_TABLE = [
+    {**row, "max": upper - 1}
+    for row, upper in zip(GRADE_TABLE, [101] + [row["min"] for row in GRADE_TABLE[:-1]])
+]
+
+
+def linear_assign_grade(percentage):
+    """The original linear scan over GRADE_TABLE (integer bands, with gaps)"""
+    for grade_row in LINEAR_GRADE_TABLE:
+        if grade_row["min"] <= percentage <= grade_row["max"]:
+            return grade_row["grade"], grade_row["point"]
+    return "F", 0.0
+
+
+def check_lookup():
+    # Every 0.01% step from 0 to 100: scalar and array paths agree everywhere
+    percentages = np.arange(0, 10001) / 100
+    grades, points = assign_grades(percentages)
+    for percentage, grade, point in zip(percentages, grades, points):
+        assert assign_grade(float(percentage)) == (grade, point), percentage
+
+    # Gap-free: fractional percentages take the band below the next boundary
+    assert assign_grade(79.5) == ("A−", 3.7)
+    assert assign_grade(74.2) == ("B+", 3.3)
+    assert assign_grade(49.99) == ("F", 0.0)
+
+    # Out of range and NaN: both paths fall back to F below 0 and for NaN, and stay A above 100
+    edge_cases = np.array([np.nan, -0.01, -5.0, 100.01, 250.0])
+    grades, points = assign_grades(edge_cases)
+    for percentage, grade, point in zip(edge_cases, grades, points):
+        assert assign_grade(float(percentage)) == (grade, point), percentage
+    assert assign_grade(float("nan")) == ("F", 0.0)
+    assert assign_grade(-5.0) == ("F", 0.0)
+    assert assign_grade(250.0) == ("A", 4.0)
+
+    # Integer percentages (no gaps in the old table) are unchanged
+    for percentage in range(0, 101):
+        assert assign_grade(percentage) == linear_assign_grade(percentage), percentage
+
+    print("lookup: scalar and array paths agree on 0-100% in 0.01 steps, NaN and out-of-range values, no gaps")
+
+
+def main():
+    check_lookup()
+
+    rng = np.random.default_rng(0)
+    percentages = np.round(rng.uniform(0, 100, 100_000) * 2) / 2
+    as_list = percentages.tolist()
+
+    linear = timeit.timeit(lambda: [linear_assign_grade(p) for p in as_list], number=5) / 5
+    bisect = timeit.timeit(lambda: [assign_grade(p) for p in as_list], number=5) / 5
+    array = timeit.timeit(lambda: assign_grades(percentages), number=5) / 5
+
+    print(f"{len(as_list):,} percentages:")
+    print(f"  linear scan  {linear * 1000:8.2f} ms")
+    print(f"  bisect       {bisect * 1000:8.2f} ms ({linear / bisect:5.1f}x)")
+    print(f"  array        {array * 1000:8.2f} ms ({linear / array:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
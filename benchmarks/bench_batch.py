@@ -0,0 +1,50 @@
+"""
+Benchmark: vectorized cohort engine vs per-student scalar functions
+(equivalence with the scalar functions: tests/test_batch.py)
+Run: python benchmarks/bench_batch.py
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+from conftest import synthetic_matrix, to_semester_marks  # noqa: E402
+from gpa_batch import SEMESTER_NAMES, calculate_cohort_gpa  # noqa: E402
+from gpa_core import calculate_cumulative_gpa, calculate_semester_gpa  # noqa: E402
+
+
+def scalar_cohort(cohort):
+    for all_semester_marks in cohort:
+        for semester_name in SEMESTER_NAMES:
+            calculate_semester_gpa(all_semester_marks[semester_name], semester_name)
+        calculate_cumulative_gpa(all_semester_marks)
+
+
+def main():
+    for n_students in (10_000, 1_000_000):
+        matrix = synthetic_matrix(n_students)
+
+        start = time.perf_counter()
+        calculate_cohort_gpa(matrix)
+        vectorized = time.perf_counter() - start
+
+        # The scalar path is timed on at most 10k students and extrapolated
+        sample = min(n_students, 10_000)
+        cohort = [to_semester_marks(row) for row in matrix[:sample]]
+        start = time.perf_counter()
+        scalar_cohort(cohort)
+        scalar = (time.perf_counter() - start) * n_students / sample
+
+        print(
+            f"{n_students:>9,} students: scalar {scalar:8.3f}s"
+            f"{' (extrapolated)' if sample < n_students else ''}"
+            f" | vectorized {vectorized:7.3f}s | speedup {scalar / vectorized:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: full-page rerun cost of the Form vs Grid marks entry modes
+Every component of the current semester is filled, as on a finished transcript.
+Run: python benchmarks/bench_entry_modes.py
+"""
+
+import os
+import statistics
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "gpa_calculator_app.py")
+sys.path.insert(0, ROOT)
+
+from gpa_core import CURRICULUM_INDEX, build_running_totals  # noqa: E402
+
+
+def filled_marks():
+    """Every component of every semester at 70% of full marks"""
+    return {
+        name: {c.key: c.full_marks * 0.7 for c in semester.components}
+        for name, semester in CURRICULUM_INDEX.semesters.items()
+    }
+
+
+def count_elements(node):
+    children = getattr(node, "children", None)
+    if not children:
+        return 1
+    return 1 + sum(count_elements(child) for child in children.values())
+
+
+def time_reruns(entry_mode, n_runs=10):
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    semester_marks = filled_marks()
+    at.session_state["semester_marks"] = semester_marks
+    at.session_state["running_totals"] = build_running_totals(semester_marks)
+    at.session_state["entry_mode"] = entry_mode
+    at.run()
+
+    timings = []
+    for _ in range(n_runs):
+        start = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - start)
+
+    assert not at.exception, at.exception
+    return statistics.median(timings), count_elements(at._tree)
+
+
+def main():
+    results = {mode: time_reruns(mode) for mode in ("Form", "Grid")}
+
+    for mode, (rerun, elements) in results.items():
+        print(f"{mode:>4}: rerun {rerun * 1000:7.1f} ms (median) | {elements:4d} page elements")
+
+    form_rerun, form_elements = results["Form"]
+    grid_rerun, grid_elements = results["Grid"]
+    print(f"Grid vs Form: {form_rerun / grid_rerun:.1f}x faster rerun, {form_elements / grid_elements:.1f}x fewer elements")
+    print("Form reruns on every edited mark; Grid reruns once per Save Marks.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Benchmark: per-rerun cost of the export sidebar on a fully filled transcript
+Before: every rerun regraded every component, built a DataFrame, wrote CSV
+and dumped JSON. After: a rerun only snapshots the marks; payloads are
+built on click and memoized on content (same bytes: tests/test_export.py).
+Run: python benchmarks/bench_export.py
+"""
+
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+from bench_parallel import synthetic_cohort  # noqa: E402
+from conftest import eager_export  # noqa: E402
+from gpa_export import export_csv, export_json, export_parquet, export_rows, freeze_marks  # noqa: E402
+
+
+def main():
+    _, semester_marks = next(synthetic_cohort(1))
+
+    eager = min(timeit.repeat(lambda: eager_export(semester_marks), number=100, repeat=5)) / 100
+    lazy = min(timeit.repeat(lambda: freeze_marks(semester_marks), number=1000, repeat=5)) / 1000
+
+    def on_click():
+        export_rows.cache_clear(), export_csv.cache_clear()
+        export_json.cache_clear(), export_parquet.cache_clear()
+        frozen = freeze_marks(semester_marks)
+        export_csv(frozen), export_json(frozen), export_parquet(frozen)
+
+    first_click = min(timeit.repeat(on_click, number=20, repeat=5)) / 20
+
+    print(f"per rerun: eager {eager * 1000:7.3f} ms | lazy snapshot {lazy * 1000:7.3f} ms"
+          f" | {eager / lazy:,.0f}x less, {(eager - lazy) * 1000:.2f} ms saved per rerun")
+    print(f"first click (all three formats, cold memo): {first_click * 1000:.2f} ms; repeat clicks are memo hits")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Benchmark: cold-start import time of the headless core vs the Streamlit app module
+Each measurement is a fresh interpreter, so nothing is cached in-process.
+Run: python benchmarks/bench_import_time.py
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = {
+    "interpreter only": "pass",
+    "gpa_core": "import gpa_core",
+    "gpa_cli": "import gpa_cli",
+    "gpa_calculator_app": "import gpa_calculator_app",
+}
+
+
+def cold_start(statement, n_runs=7):
+    timings = []
+    for _ in range(n_runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", statement],
+            cwd=ROOT, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    results = {name: cold_start(statement) for name, statement in TARGETS.items()}
+    for name, seconds in results.items():
+        print(f"{name:<20} {seconds * 1000:8.1f} ms")
+    print(f"gpa_core imports {results['gpa_calculator_app'] / results['gpa_core']:.1f}x faster than the app module")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark: memory per 100k students, semester_marks dicts vs compact marks rows
+Run: python benchmarks/bench_memory.py [n_students]
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_parallel import synthetic_cohort  # noqa: E402
+from gpa_compact import marks_row, row_totals, rows_matrix  # noqa: E402
+from gpa_core import build_running_totals  # noqa: E402
+
+
+def allocated(build):
+    """(result, bytes still allocated by it)"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    n_students = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    cohort, dict_bytes = allocated(lambda: [marks for _, marks in synthetic_cohort(n_students)])
+    rows, row_bytes = allocated(lambda: [marks_row(marks) for marks in cohort])
+    matrix, matrix_bytes = allocated(lambda: rows_matrix(rows).astype("float32"))
+
+    print(f"{n_students:,} students:")
+    print(f"  semester_marks dicts  {dict_bytes / 2**20:8.1f} MB | {dict_bytes / n_students:6.0f} B/student")
+    print(f"  array('f') rows       {row_bytes / 2**20:8.1f} MB | {row_bytes / n_students:6.0f} B/student | "
+          f"{dict_bytes / row_bytes:4.1f}x smaller")
+    print(f"  float32 matrix        {matrix_bytes / 2**20:8.1f} MB | {matrix_bytes / n_students:6.0f} B/student | "
+          f"{dict_bytes / matrix_bytes:4.1f}x smaller")
+
+    sample = min(n_students, 20_000)
+    start = time.perf_counter()
+    for marks in cohort[:sample]:
+        build_running_totals(marks)
+    dicts = time.perf_counter() - start
+    start = time.perf_counter()
+    for row in rows[:sample]:
+        row_totals(row)
+    compact = time.perf_counter() - start
+    print(f"grading {sample:,} students: dicts {dicts:.2f}s | rows {compact:.2f}s | {dicts / compact:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark: Monte Carlo CGPA projection, 100k simulations
+Compares the band-probability sampler against drawing every mark and grading it
+(vectorized, and a pure-Python loop), and checks the distributions agree.
+Run: python benchmarks/bench_montecarlo.py
+"""
+
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gpa_core import (  # noqa: E402
+    CURRICULUM_INDEX, POINT_SCALE, assign_grade, build_running_totals, calculate_percentage,
+    scaled_weighted_point,
+)
+from gpa_montecarlo import PERCENTILES, count_outcomes, fit_history, projection_summary, simulate_cgpa  # noqa: E402
+from gpa_target import MARKS_STEP, remaining_components  # noqa: E402
+
+N_SIMULATIONS = 100_000
+
+
+def simulate_by_marks(totals, semester_marks, mean, std, n_simulations, seed=1):
+    """Reference: draw every mark, round to the input step, grade through the bands"""
+    components = remaining_components(semester_marks)
+    full_marks = np.array([component.full_marks for component in components], dtype=float)
+    credits = np.array([component.credit for component in components], dtype=np.int64)
+    band_mins = np.array(CURRICULUM_INDEX.band_mins, dtype=float)
+    band_points = np.array([round(point * POINT_SCALE) for _, point in CURRICULUM_INDEX.band_results], dtype=np.int64)
+
+    percentages = np.clip(np.random.default_rng(seed).normal(mean, std, (n_simulations, len(components))), 0, 100)
+    marks = np.round(percentages * full_marks / 100 / MARKS_STEP) * MARKS_STEP
+    band = np.maximum(np.searchsorted(band_mins, marks / full_marks * 100, side="right") - 1, 0)
+    return totals["weighted"] + band_points[band] @ credits
+
+
+def simulate_loop(totals, semester_marks, mean, std, n_simulations, seed=1):
+    """Reference: the same draws one simulation at a time in Python"""
+    rng = random.Random(seed)
+    components = remaining_components(semester_marks)
+    results = []
+    for _ in range(n_simulations):
+        weighted = totals["weighted"]
+        for component in components:
+            percentage = min(max(rng.gauss(mean, std), 0), 100)
+            marks = round(percentage * component.full_marks / 100 / MARKS_STEP) * MARKS_STEP
+            _, grade_point = assign_grade(calculate_percentage(marks, component.full_marks))
+            weighted += scaled_weighted_point(grade_point, component.credit)
+        results.append(weighted)
+    return np.array(results)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    # First semester filled in, three semesters still open
+    semester_marks = {name: {} for name in CURRICULUM_INDEX.semesters}
+    rng = random.Random(0)
+    for component in CURRICULUM_INDEX.semesters["Year 1 - Part I"].graded:
+        semester_marks[component.semester][component.key] = rng.randint(component.full_marks, component.full_marks * 2) / 2
+    totals = build_running_totals(semester_marks)
+    mean, std = fit_history(semester_marks)
+    n_open = len(remaining_components(semester_marks))
+    print(f"{n_open} open components, marks ~ N({mean:.1f}%, {std:.1f}%), {N_SIMULATIONS:,} simulations")
+
+    simulate_cgpa(totals, semester_marks, mean, std)  # warm up
+    (weighted, credits), sampler = timed(simulate_cgpa, totals, semester_marks, mean, std)
+    reference, by_marks = timed(simulate_by_marks, totals, semester_marks, mean, std, N_SIMULATIONS)
+    _, loop = timed(simulate_loop, totals, semester_marks, mean, std, 2_000)
+
+    # The compact counts sessions cache give exactly what the raw simulations give
+    outcomes = count_outcomes(weighted, credits)
+    summary = projection_summary(outcomes, 3.0)
+    cgpa = weighted / POINT_SCALE / credits
+    assert summary["percentiles"] == dict(zip(PERCENTILES, np.percentile(cgpa, PERCENTILES).round(2).tolist()))
+    for threshold in np.arange(0, 4.01, 0.01):
+        assert projection_summary(outcomes, threshold)["p_above"] == np.mean(weighted >= round(threshold * POINT_SCALE) * credits)
+    print(f"compact summary: {outcomes.values.nbytes + outcomes.counts.nbytes:,} bytes vs {weighted.nbytes:,} bytes "
+          f"for the raw simulations; identical percentiles and P(>= x) for every threshold")
+
+    expected = projection_summary(count_outcomes(reference, credits), 3.0)
+    for p, value in summary["percentiles"].items():
+        assert abs(value - expected["percentiles"][p]) <= 0.02, (p, value, expected["percentiles"][p])
+    assert abs(summary["p_above"] - expected["p_above"]) <= 0.01, (summary["p_above"], expected["p_above"])
+    print(f"distribution matches grading drawn marks: percentiles {summary['percentiles']}, "
+          f"P(>= 3.00) {summary['p_above']:.3f} vs {expected['p_above']:.3f}")
+
+    print(f"  band sampler      {sampler * 1000:7.1f} ms")
+    print(f"  marks, vectorized {by_marks * 1000:7.1f} ms | {by_marks / sampler:5.1f}x slower")
+    print(f"  marks, Python     {loop / 2_000 * N_SIMULATIONS * 1000:7.1f} ms (extrapolated) | "
+          f"{loop / 2_000 * N_SIMULATIONS / sampler:5.0f}x slower")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark: process-pool cohort grading scaling from 1 to N cores
+Run: python benchmarks/bench_parallel.py [n_students]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gpa_core import CURRICULUM_INDEX  # noqa: E402
+from gpa_parallel import grade_parallel  # noqa: E402
+from gpa_stream import grade_record  # noqa: E402
+
+
+def synthetic_cohort(n_students, seed=0):
+    """(student_id, semester_marks) records with every component filled"""
+    rng = random.Random(seed)
+    for i in range(n_students):
+        semester_marks = {name: {} for name in CURRICULUM_INDEX.semesters}
+        for component in CURRICULUM_INDEX.components:
+            semester_marks[component.semester][component.key] = rng.randint(0, component.full_marks * 2) / 2
+        yield f"S{i:07d}", semester_marks
+
+
+def main():
+    n_students = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    cohort = list(synthetic_cohort(n_students))
+
+    start = time.perf_counter()
+    expected = [grade_record(sid, marks) for sid, marks in cohort]
+    serial = time.perf_counter() - start
+    print(f"{n_students:,} students, {os.cpu_count()} CPUs")
+    print(f"  serial      {serial:7.2f}s")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        results = list(grade_parallel(cohort, workers=workers))
+        elapsed = time.perf_counter() - start
+        assert results == expected, "parallel results must match serial order and values"
+        print(f"  {workers:2d} workers  {elapsed:7.2f}s | {serial / elapsed:5.2f}x vs serial")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
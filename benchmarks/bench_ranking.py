@@ -0,0 +1,78 @@
+"""
+Benchmark: cohort ranking index update and query latency at 100k students
+Compares the Fenwick-tree RankingIndex against re-sorting the cohort's CGPAs
+after every change, and checks both give the same ranks.
+Run: python benchmarks/bench_ranking.py [n_students]
+"""
+
+import os
+import random
+import sys
+import time
+from bisect import bisect_right
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gpa_ranking import RankingIndex  # noqa: E402
+
+
+def random_cgpa(rng):
+    return round(min(max(rng.gauss(3.0, 0.45), 0.0), 4.0), 2)
+
+
+def resort_rank(cgpas, student_id):
+    """The full-scan approach: sort every CGPA, then count the ones above"""
+    ordered = sorted(cgpas.values())
+    return len(ordered) - bisect_right(ordered, cgpas[student_id]) + 1
+
+
+def per_op(func, n):
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main():
+    n_students = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(0)
+    cgpas = {f"S{i:07d}": random_cgpa(rng) for i in range(n_students)}
+
+    ranking = RankingIndex()
+    start = time.perf_counter()
+    for student_id, cgpa in cgpas.items():
+        ranking.update(student_id, cgpa)
+    print(f"{n_students:,} students indexed in {time.perf_counter() - start:.2f}s")
+
+    # Every update is one student's mark changing
+    n_ops = 100_000
+    students = list(cgpas)
+    edits = [(rng.choice(students), random_cgpa(rng)) for _ in range(n_ops)]
+
+    def apply_edits():
+        for student_id, cgpa in edits:
+            ranking.update(student_id, cgpa)
+            cgpas[student_id] = cgpa
+
+    update = per_op(apply_edits, n_ops)
+    queried = [rng.choice(students) for _ in range(n_ops)]
+    rank = per_op(lambda: [ranking.rank(student_id) for student_id in queried], n_ops)
+    percentile = per_op(lambda: [ranking.percentile(student_id) for student_id in queried], n_ops)
+    top = per_op(lambda: [ranking.top(10) for _ in range(1_000)], 1_000)
+
+    n_resort = 20
+    resort = per_op(lambda: [resort_rank(cgpas, student_id) for student_id in queried[:n_resort]], n_resort)
+    for student_id in queried[:200]:
+        assert ranking.rank(student_id)[0] == resort_rank(cgpas, student_id), student_id
+    expected_top = sorted(cgpas.items(), key=lambda item: (-item[1], item[0]))[:10]
+    assert ranking.top(10) == expected_top
+    print("equivalence: ranks and top-10 match a full sort")
+
+    print(f"  update (one student's CGPA changes) {update:8.2f} us")
+    print(f"  rank query                          {rank:8.2f} us")
+    print(f"  percentile query                    {percentile:8.2f} us")
+    print(f"  top-10 query                        {top:8.2f} us")
+    print(f"  re-sort cohort per change + rank    {resort:8.0f} us | {resort / (update + rank):,.0f}x slower")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark: program registry startup and first-use cost as programs are added
+Generates N synthetic 8-semester program files, then times:
+- startup: list_programs() (file names only), against parsing every file up front
+- first use of one program: parsing its file vs loading its on-disk snapshot
+Run: python benchmarks/bench_registry.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import gpa_registry  # noqa: E402
+
+PROGRAM_COUNTS = [1, 10, 100, 1000]
+
+
+def write_programs(directory, count):
+    """count program files of 8 semesters x 8 subjects (theory + practical)"""
+    for n in range(count):
+        semesters = {
+            f"Year {year} - Part {part}": [
+                {"code": f"P{n} {year}{i:02d}", "name": f"Subject {i}", "type": component_type,
+                 "credit": credit, "full_marks": full_marks}
+                for i in range(8)
+                for component_type, credit, full_marks in (("L+T", 3, 100), ("P", 1, 50))
+            ]
+            for year in range(1, 5) for part in ("I", "II")
+        }
+        with open(os.path.join(directory, f"program_{n:04d}.json"), "w", encoding="utf-8") as f:
+            json.dump({"name": f"Program {n}", "semesters": semesters}, f)
+
+
+def best_of(func, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    for count in PROGRAM_COUNTS:
+        with tempfile.TemporaryDirectory() as programs, tempfile.TemporaryDirectory() as cache:
+            write_programs(programs, count)
+            os.environ.update(GPA_PROGRAMS_DIR=programs, GPA_CACHE_DIR=cache)
+            path = gpa_registry.program_files()["program_0000"]
+
+            listing = best_of(gpa_registry.list_programs)
+            parse_all = best_of(lambda: [gpa_registry._parse_file(p) for p in gpa_registry.program_files().values()], 1)
+            gpa_registry._load_parsed(path)
+            parse = best_of(lambda: gpa_registry._parse_file(path))
+            snapshot = best_of(lambda: gpa_registry._load_parsed(path))
+
+        print(
+            f"{count:>5} programs: list {listing * 1000:6.2f} ms (eager parse of all: {parse_all * 1000:8.1f} ms) | "
+            f"first use: parse {parse * 1000:5.2f} ms, snapshot {snapshot * 1000:5.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
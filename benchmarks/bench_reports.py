@@ -0,0 +1,130 @@
+"""
+Benchmark: batch grade sheet generation throughput for 10k transcripts
+Compares gpa_reports (chunked vectorized grading, precompiled templates,
+workers writing their own files) against rendering each sheet from the
+scalar functions, and checks both produce identical HTML. Rendering is
+timed on its own and end to end (one file per student, plus index.csv).
+Run: python benchmarks/bench_reports.py [n_students]
+"""
+
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from html import escape
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_parallel import synthetic_cohort  # noqa: E402
+from gpa_core import CURRICULUM_INDEX, assign_grade, calculate_percentage, grade_results  # noqa: E402
+from gpa_registry import get_program  # noqa: E402
+from gpa_reports import (  # noqa: E402
+    BREAKDOWN_ROW, COMPONENT_HEADER, INDEX_FILE, REPORT_CHUNK_SIZE, SHEET_TEMPLATE,
+    compile_templates, generate_reports, render_chunk, report_filename,
+)
+
+
+def in_progress_cohort(n_students, seed=0):
+    """Synthetic students, each through a random number of semesters"""
+    rng = random.Random(seed)
+    semesters = list(CURRICULUM_INDEX.semesters)
+    for student_id, semester_marks in synthetic_cohort(n_students, seed):
+        done = rng.randint(1, len(semesters))
+        yield student_id, {name: semester_marks[name] for name in semesters[:done]}
+
+
+def scalar_sheet(student_id, semester_marks, program="civil"):
+    """One student at a time: scalar grading, every row formatted from scratch"""
+    results = grade_results(semester_marks)
+    breakdown = "".join(
+        BREAKDOWN_ROW.format(escape(row["semester"]), row["gpa"], row["credits"], row["weighted_points"])
+        for row in results["semesters"]
+    )
+    sections = ""
+    for semester_name, semester in CURRICULUM_INDEX.semesters.items():
+        marks_data = semester_marks.get(semester_name)
+        if not marks_data:
+            continue
+        sections += f"<section>\n<h3>{escape(semester_name)}</h3>\n<table>\n{COMPONENT_HEADER}"
+        for component in semester.components:
+            if component.key not in marks_data:
+                continue
+            marks = marks_data[component.key]
+            grade, _ = assign_grade(calculate_percentage(marks, component.full_marks))
+            sections += (
+                f"<tr><td>{escape(component.code)}</td><td>{escape(component.name)}</td>"
+                f'<td>{escape(component.type)}</td><td class="num">{component.credit:g}</td><td class="num">'
+                f"{float(marks):g} / {component.full_marks:g}</td><td>{grade}</td></tr>\n"
+            )
+        sections += "</table>\n</section>\n"
+
+    total = CURRICULUM_INDEX.total_credits
+    return SHEET_TEMPLATE.substitute(
+        student_id=escape(student_id),
+        program_name=escape(get_program(program).name),
+        cgpa=f"{results['cgpa']:.2f}",
+        credits=f"{results['credits']:.1f}",
+        total_credits=f"{total:.1f}",
+        progress=f"{results['credits'] / total * 100:.0f}",
+        breakdown_rows=breakdown,
+        semester_sections=sections,
+    )
+
+
+def main():
+    n_students = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    cohort = list(in_progress_cohort(n_students))
+    print(f"{n_students:,} grade sheets, {os.cpu_count()} CPUs")
+
+    start = time.perf_counter()
+    for student_id, semester_marks in cohort:
+        scalar_sheet(student_id, semester_marks)
+    scalar_render = time.perf_counter() - start
+    start = time.perf_counter()
+    templates = compile_templates()
+    for i in range(0, n_students, REPORT_CHUNK_SIZE):
+        for _ in render_chunk(cohort[i:i + REPORT_CHUNK_SIZE], templates):
+            pass
+    batch_render = time.perf_counter() - start
+    print(f"  render only: scalar {n_students / scalar_render:8,.0f} sheets/s | "
+          f"chunked + precompiled {n_students / batch_render:8,.0f} sheets/s | {scalar_render / batch_render:4.1f}x")
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+        for student_id, semester_marks in cohort:
+            with open(os.path.join(output_dir, report_filename(student_id)), "w", encoding="utf-8") as f:
+                f.write(scalar_sheet(student_id, semester_marks))
+        scalar = time.perf_counter() - start
+        expected = {}
+        for student_id, _ in cohort[::max(n_students // 500, 1)]:
+            with open(os.path.join(output_dir, report_filename(student_id)), encoding="utf-8") as f:
+                expected[student_id] = f.read()
+
+    print(f"  to disk: scalar, one student at a time  {scalar:6.2f}s | {n_students / scalar:8,.0f} sheets/s")
+
+    workers = 1
+    while True:
+        with tempfile.TemporaryDirectory() as output_dir:
+            start = time.perf_counter()
+            count = generate_reports(iter(cohort), output_dir, workers=workers)
+            elapsed = time.perf_counter() - start
+            assert count == n_students
+
+            for student_id, html in expected.items():
+                with open(os.path.join(output_dir, report_filename(student_id)), encoding="utf-8") as f:
+                    assert f.read() == html, student_id
+            with open(os.path.join(output_dir, INDEX_FILE), encoding="utf-8", newline="") as f:
+                assert [row[0] for row in list(csv.reader(f))[1:]] == [sid for sid, _ in cohort]
+
+        print(f"  to disk: gpa_reports, {workers} worker(s)       {elapsed:6.2f}s | {n_students / elapsed:8,.0f} sheets/s "
+              f"| {scalar / elapsed:4.1f}x")
+        if workers >= (os.cpu_count() or 1):
+            break
+        workers = min(workers * 2, os.cpu_count())
+    print(f"equivalence: {len(expected)} sampled sheets identical to the scalar rendering; index.csv in input order")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark: incremental running totals vs full GPA recompute per edit
+(equivalence with a full recompute: tests/test_running_totals.py)
+Run: python benchmarks/bench_running_totals.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gpa_core import (  # noqa: E402
+    CURRICULUM_INDEX, apply_mark_change, build_running_totals, calculate_cumulative_gpa,
+    calculate_semester_gpa, totals_gpa,
+)
+
+
+def random_edits(n_edits, seed=0):
+    """(semester, key, marks) edits in 0.5 steps over every component"""
+    rng = random.Random(seed)
+    components = CURRICULUM_INDEX.components
+    for _ in range(n_edits):
+        component = rng.choice(components)
+        yield component.semester, component.key, rng.randint(0, component.full_marks * 2) / 2
+
+
+def main():
+    edits = list(random_edits(10_000))
+
+    # What a rerun used to pay: current semester + breakdown table + CGPA
+    semester_marks = {name: {} for name in CURRICULUM_INDEX.semesters}
+    start = time.perf_counter()
+    for semester_name, key, marks in edits:
+        semester_marks[semester_name][key] = marks
+        calculate_semester_gpa(semester_marks[semester_name], semester_name)
+        for name in CURRICULUM_INDEX.semesters:
+            calculate_semester_gpa(semester_marks[name], name)
+        calculate_cumulative_gpa(semester_marks)
+    full = (time.perf_counter() - start) / len(edits)
+
+    semester_marks = {name: {} for name in CURRICULUM_INDEX.semesters}
+    totals = build_running_totals(semester_marks)
+    start = time.perf_counter()
+    for semester_name, key, marks in edits:
+        apply_mark_change(totals, semester_name, key, semester_marks[semester_name].get(key), marks)
+        semester_marks[semester_name][key] = marks
+        totals_gpa(totals["semesters"][semester_name])
+        for name in CURRICULUM_INDEX.semesters:
+            totals_gpa(totals["semesters"][name])
+        totals_gpa(totals)
+    incremental = (time.perf_counter() - start) / len(edits)
+
+    print(f"per edit: full recompute {full * 1e6:7.1f} us | running totals {incremental * 1e6:6.1f} us"
+          f" | {full / incremental:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark: per-session footprint and bounded memory with idle-session spill
+Builds N app-like session states (every mark filled, running totals, a
+Monte Carlo projection and one widget value per marks input), then
+reports the footprint, the resident total with and without a budget, the
+spill / restore latency, and checks restored sessions are unchanged.
+Run: python benchmarks/bench_sessions.py [n_sessions]
+"""
+
+import copy
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_parallel import synthetic_cohort  # noqa: E402
+from gpa_core import CURRICULUM_INDEX, build_running_totals  # noqa: E402
+from gpa_montecarlo import count_outcomes, fit_history, simulate_cgpa  # noqa: E402
+from gpa_sessions import SessionMemoryManager  # noqa: E402
+
+BUDGET_MB = 8
+
+
+class FakeSessionState(dict):
+    """dict with the st.session_state methods the manager uses"""
+
+    def to_dict(self):
+        return dict(self)
+
+
+def session_state(semester_marks):
+    # Half the components open, so the projection has work to do
+    for component in CURRICULUM_INDEX.components[::2]:
+        semester_marks[component.semester].pop(component.key, None)
+    totals = build_running_totals(semester_marks)
+    state = FakeSessionState(
+        semester_marks=semester_marks,
+        program_marks={},
+        running_totals=totals,
+        projection={"key": "k", "result": count_outcomes(*simulate_cgpa(totals, semester_marks, *fit_history(semester_marks)))},
+    )
+    for component in CURRICULUM_INDEX.components:
+        state[f"input_{component.key}"] = float(semester_marks[component.semester].get(component.key, 0.0))
+    return state
+
+
+def main():
+    n_sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    sessions = [session_state(marks) for _, marks in synthetic_cohort(n_sessions, seed=7)]
+    originals = [copy.deepcopy({k: s[k] for k in ("semester_marks", "running_totals")}) for s in sessions]
+
+    with tempfile.TemporaryDirectory() as spill_dir:
+        unbounded = SessionMemoryManager(budget_bytes=2**60, idle_seconds=0, spill_dir=spill_dir)
+        for i, state in enumerate(sessions):
+            unbounded.begin(state, f"unbounded-{i}")
+            unbounded.end(state)
+        total = unbounded.stats()["resident_bytes"]
+        for state in sessions:
+            del state["_memory"]
+        print(f"{n_sessions} sessions: {total / n_sessions / 1024:7.1f} KB/session | "
+              f"{total / 2**20:7.1f} MB resident without a budget")
+
+        manager = SessionMemoryManager(budget_bytes=BUDGET_MB * 2**20, idle_seconds=0, spill_dir=spill_dir)
+        start = time.perf_counter()
+        for i, state in enumerate(sessions):
+            manager.begin(state, i)
+            manager.end(state)
+        elapsed = time.perf_counter() - start
+        stats = manager.stats()
+        print(f"  budget {BUDGET_MB} MB: {stats['resident_bytes'] / 2**20:7.1f} MB resident | "
+              f"{stats['spilled']} sessions spilled | {elapsed / n_sessions * 1000:.2f} ms per rerun (measure + spill)")
+
+        # Every spilled session comes back on its next rerun, unchanged
+        start = time.perf_counter()
+        for i, state in enumerate(sessions):
+            manager.begin(state, i)
+            assert {k: state[k] for k in ("semester_marks", "running_totals")} == originals[i], i
+        restore = (time.perf_counter() - start) / max(stats["spilled"], 1)
+        print(f"  restore on next rerun: {restore * 1000:.2f} ms per spilled session; all sessions unchanged")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: streaming grader peak memory and throughput vs input size
+Each size runs 'gpa stream' in a fresh process and reports its peak RSS.
+Run: python benchmarks/bench_stream.py [max_rows]
+"""
+
+import csv
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from gpa_core import CURRICULUM_INDEX  # noqa: E402
+
+
+def write_dump(path, n_rows, seed=0):
+    """Export-layout CSV with a Student ID column, every component of each student"""
+    rng = random.Random(seed)
+    components = CURRICULUM_INDEX.components
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Student ID", "Semester", "Course Code", "Subject", "Component",
+                         "Credit", "Full Marks", "Marks Obtained", "Percentage", "Grade", "Grade Point"])
+        for row in range(n_rows):
+            component = components[row % len(components)]
+            marks = rng.randint(0, component.full_marks * 2) / 2
+            writer.writerow([f"S{row // len(components):09d}", component.semester, component.code, component.name,
+                             component.type, component.credit, component.full_marks, marks, "", "", ""])
+
+
+def run_stream(input_path, output_path):
+    """(seconds, peak RSS in MB) of one 'gpa stream' run in a child process"""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, os.path.join(ROOT, "gpa_cli.py"), "stream", input_path, "-o", output_path],
+        check=True, stderr=subprocess.DEVNULL,
+    )
+    elapsed = time.perf_counter() - start
+    # ru_maxrss of children is the max over all children so far; sizes run in increasing order
+    return elapsed, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+
+
+def main():
+    max_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    sizes = [1_000]
+    while sizes[-1] * 10 <= max_rows:
+        sizes.append(sizes[-1] * 10)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = os.path.join(tmp, "marks.csv")
+        output_path = os.path.join(tmp, "results.csv")
+        for n_rows in sizes:
+            write_dump(input_path, n_rows)
+            elapsed, peak_mb = run_stream(input_path, output_path)
+            size_mb = os.path.getsize(input_path) / 1024 / 1024
+            print(f"{n_rows:>11,} rows ({size_mb:7.1f} MB): {elapsed:7.2f}s"
+                  f" | {n_rows / elapsed:9,.0f} rows/s | peak RSS {peak_mb:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Benchmark: target-CGPA solver (DP over grade points) vs brute force over grade bands
+Times queries with all four semesters still open, where brute force is out of
+reach (agreement with brute force on small cases: tests/test_target.py).
+Run: python benchmarks/bench_target.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gpa_core import CURRICULUM_INDEX, build_running_totals  # noqa: E402
+from gpa_target import band_options, remaining_components, solve_target  # noqa: E402
+
+
+def main():
+    semester_marks = {name: {} for name in CURRICULUM_INDEX.semesters}
+    totals = build_running_totals(semester_marks)
+    n_open = len(remaining_components(semester_marks))
+    n_bands = len(band_options(CURRICULUM_INDEX.components[0]))
+    print(f"all semesters open: {n_open} components x {n_bands} bands (brute force: {n_bands ** n_open:.1e} combinations)")
+
+    for target in (2.5, 3.0, 3.6, 4.0):
+        timings = []
+        for _ in range(20):
+            start = time.perf_counter()
+            result = solve_target(totals, semester_marks, target)
+            timings.append(time.perf_counter() - start)
+        print(
+            f"  target {target:.2f}: {min(timings) * 1000:6.2f} ms | "
+            f"{result['total_marks']:7.1f} marks, projected CGPA {result['projected_cgpa']:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+"""
+Load test: the Streamlit app under many concurrent sessions
+Starts `streamlit run gpa_calculator_app.py` on a free local port, then drives
+simulated students over the app's websocket (/_stcore/stream) the way the
+browser does: protobuf BackMsg rerun requests carrying the session's widget
+states. Each student opens the page, fills marks in the current semester,
+switches semesters with the sidebar buttons (render_semester_selector) and
+fills more marks, then downloads the CSV / JSON / Parquet exports.
+
+Concurrency grows level by level. For each level it reports rerun latency
+percentiles (request sent -> script finished), reruns/s, export download
+latency and the server's RSS, then names the saturation point: the level
+after which throughput stops growing and requests only queue.
+
+Needs the app extra (streamlit, and the websockets client it ships with).
+The client runs on the same machine, so with few CPUs it competes with the
+server; for results-day numbers, give the server its own cores.
+Run: python benchmarks/load_test_app.py [--levels 1,5,10,25,50,100] [--semesters 2] [--marks 4] [--think 0]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from websockets.asyncio.client import connect
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "gpa_calculator_app.py")
+
+WIDGET_TYPES = ("button", "download_button", "number_input", "radio", "selectbox", "text_input")
+FINISHED = {ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY}
+EXPORT_PREFIX = "📥 Download as"
+MARKS_PREFIX = "Marks for "  # the marks inputs; the target planner and projection have number inputs too
+
+# ==================== SERVER ====================
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, show_log=False):
+    command = [
+        sys.executable, "-m", "streamlit", "run", APP,
+        "--server.port", str(port), "--server.address", "127.0.0.1", "--server.headless", "true",
+        "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false",
+    ]
+    server = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=None if show_log else subprocess.DEVNULL)
+    for _ in range(300):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return server
+        except OSError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError("streamlit server did not start")
+
+
+def rss_mb(pid):
+    """Resident set size of a process, from /proc (None where /proc is unavailable)"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+
+
+async def http_get(port, path):
+    """GET path and return the body (HTTP/1.0-style: the server closes the connection)"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\nConnection: close\r\n\r\n".encode())
+        await writer.drain()
+        response = await reader.read()
+    finally:
+        writer.close()
+    status = int(response.split(b" ", 2)[1])
+    if status != 200:
+        raise RuntimeError(f"GET {path}: HTTP {status}")
+    return response.partition(b"\r\n\r\n")[2]
+
+# ==================== SIMULATED SESSION ====================
+
+class BrowserSession:
+    """One browser tab: keeps its widget states and replays them on every rerun, like the frontend"""
+
+    def __init__(self, ws, port, timeout):
+        self.ws = ws
+        self.port = port
+        self.timeout = timeout
+        self.session_id = None
+        self.widgets = {}        # label -> (element type, proto) from the latest run
+        self.widget_states = {}  # widget id -> WidgetState sent with every rerun
+        self.errors = 0
+
+    async def _next_message(self):
+        msg = ForwardMsg()
+        msg.ParseFromString(await asyncio.wait_for(self.ws.recv(), self.timeout))
+        return msg
+
+    async def rerun(self, trigger_id=None):
+        """Request a rerun and wait for the final script run to finish; returns seconds"""
+        request = BackMsg()
+        request.rerun_script.query_string = ""
+        request.rerun_script.page_script_hash = ""
+        request.rerun_script.widget_states.widgets.extend(self.widget_states.values())
+        if trigger_id is not None:
+            request.rerun_script.widget_states.widgets.append(WidgetState(id=trigger_id, trigger_value=True))
+
+        start = time.perf_counter()
+        await self.ws.send(request.SerializeToString())
+        while True:
+            msg = await self._next_message()
+            kind = msg.WhichOneof("type")
+            if kind == "new_session":
+                # Every script run (including st.rerun() restarts) begins here
+                self.session_id = msg.new_session.initialize.session_id
+                self.widgets = {}
+            elif kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                element = msg.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type == "exception":
+                    self.errors += 1
+                elif element_type in WIDGET_TYPES:
+                    widget = getattr(element, element_type)
+                    self.widgets[widget.label] = (element_type, widget)
+            elif kind == "script_finished":
+                if msg.script_finished in FINISHED:
+                    break
+                if msg.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    raise RuntimeError("app failed to compile")
+        elapsed = time.perf_counter() - start
+
+        # The frontend forgets widgets that were not rendered in the last run
+        live_ids = {widget.id for _, widget in self.widgets.values()}
+        self.widget_states = {wid: state for wid, state in self.widget_states.items() if wid in live_ids}
+        return elapsed
+
+    async def set_number(self, widget, value):
+        self.widget_states[widget.id] = WidgetState(id=widget.id, double_value=value)
+        return await self.rerun()
+
+    async def download(self, widget):
+        """Fetch a deferred download the way the frontend does; returns (seconds, bytes)"""
+        request, request_id = BackMsg(), uuid.uuid4().hex
+        request.backend_operation_request.request_id = request_id
+        request.backend_operation_request.session_id = self.session_id
+        request.backend_operation_request.deferred_file.file_id = widget.deferred_file_id
+
+        start = time.perf_counter()
+        await self.ws.send(request.SerializeToString())
+        while True:
+            msg = await self._next_message()
+            response = msg.backend_operation_response
+            if msg.WhichOneof("type") == "backend_operation_response" and response.request_id == request_id:
+                break
+        if response.error_msg:
+            raise RuntimeError(f"download failed: {response.error_msg}")
+        body = await http_get(self.port, response.deferred_file.url)
+        return time.perf_counter() - start, len(body)
+
+# ==================== STUDENT FLOW ====================
+
+def marks_inputs(session):
+    return [
+        widget for label, (element_type, widget) in session.widgets.items()
+        if element_type == "number_input" and label.startswith(MARKS_PREFIX)
+    ]
+
+
+async def pause(rng, think):
+    if think > 0:
+        await asyncio.sleep(rng.uniform(0, think))
+
+
+async def fill_marks(session, rng, n_marks, timings, think):
+    inputs = marks_inputs(session)
+    for widget in rng.sample(inputs, min(n_marks, len(inputs))):
+        # 40-100% of full marks, on the input's 0.5 step
+        marks = round(rng.uniform(0.4, 1.0) * widget.max * 2) / 2
+        await pause(rng, think)
+        timings["marks"].append(await session.set_number(widget, marks))
+
+
+async def student(port, seed, args, timings):
+    """One student's visit: open, fill marks, switch semesters, download every export"""
+    rng = random.Random(seed)
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    async with connect(url, subprotocols=["streamlit"], max_size=None, open_timeout=args.timeout) as ws:
+        session = BrowserSession(ws, port, args.timeout)
+        timings["open"].append(await session.rerun())
+        await fill_marks(session, rng, args.marks, timings, args.think)
+
+        semester_buttons = [
+            widget for label, (element_type, widget) in session.widgets.items()
+            if element_type == "button" and label.startswith("📖 ")
+        ]
+        for button in rng.sample(semester_buttons, min(args.semesters - 1, len(semester_buttons))):
+            await pause(rng, args.think)
+            timings["semester"].append(await session.rerun(trigger_id=button.id))
+            await fill_marks(session, rng, args.marks, timings, args.think)
+
+        exports = [
+            label for label, (element_type, _) in session.widgets.items()
+            if element_type == "download_button" and label.startswith(EXPORT_PREFIX)
+        ]
+        for label in exports:
+            # Deferred files are re-registered on every run: use this run's button
+            _, widget = session.widgets[label]
+            await pause(rng, args.think)
+            try:
+                elapsed, size = await session.download(widget)
+                assert size > 0, label
+                timings["download"].append(elapsed)
+            except RuntimeError:
+                # A generated export can be pruned by another session's cleanup before it is fetched
+                timings["download_errors"] += 1
+            if not widget.ignore_rerun:
+                timings["export"].append(await session.rerun(trigger_id=widget.id))
+        timings["errors"] += session.errors
+
+# ==================== REPORT ====================
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))] if values else float("nan")
+
+
+async def run_level(port, server_pid, n_sessions, args, seed):
+    """Run n_sessions students at once; returns the level's stats"""
+    timings = {"open": [], "marks": [], "semester": [], "export": [], "download": [], "download_errors": 0, "errors": 0}
+    peak = [rss_mb(server_pid) or 0.0]
+
+    async def sample_memory():
+        while True:
+            peak[0] = max(peak[0], rss_mb(server_pid) or 0.0)
+            await asyncio.sleep(0.2)
+
+    sampler = asyncio.create_task(sample_memory())
+    start = time.perf_counter()
+    outcomes = await asyncio.gather(
+        *(student(port, seed + i, args, timings) for i in range(n_sessions)), return_exceptions=True
+    )
+    elapsed = time.perf_counter() - start
+    sampler.cancel()
+
+    failed = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+    reruns = timings["open"] + timings["marks"] + timings["semester"] + timings["export"]
+    return {
+        "sessions": n_sessions,
+        "elapsed": elapsed,
+        "reruns": len(reruns),
+        "throughput": len(reruns) / elapsed,
+        "p50": statistics.median(reruns) if reruns else float("nan"),
+        "p95": percentile(reruns, 0.95),
+        "p99": percentile(reruns, 0.99),
+        "by_action": {action: statistics.median(timings[action]) for action in ("open", "marks", "semester", "export") if timings[action]},
+        "download_p95": percentile(timings["download"], 0.95),
+        "download_errors": timings["download_errors"],
+        "rss": rss_mb(server_pid),
+        "peak_rss": peak[0],
+        "errors": timings["errors"] + len(failed),
+        "first_failure": failed[0] if failed else None,
+    }
+
+
+def print_level(stats):
+    print(
+        f"{stats['sessions']:>5} sessions | {stats['throughput']:7.1f} reruns/s | "
+        f"p50 {stats['p50'] * 1000:7.1f} | p95 {stats['p95'] * 1000:7.1f} | p99 {stats['p99'] * 1000:7.1f} ms | "
+        f"downloads p95 {stats['download_p95'] * 1000:7.1f} ms ({stats['download_errors']} failed) | RSS {stats['rss'] or 0:6.0f} MB (peak {stats['peak_rss']:.0f}) | "
+        f"errors {stats['errors']}"
+    )
+    by_action = " | ".join(f"{action} {seconds * 1000:.1f}" for action, seconds in stats["by_action"].items())
+    print(f"      median ms by action: {by_action}")
+    if stats["first_failure"] is not None:
+        print(f"      first failure: {stats['first_failure']!r}")
+
+
+def saturation_point(levels):
+    """The last level before throughput stops growing by at least 10%"""
+    for current, following in zip(levels, levels[1:]):
+        if following["throughput"] < current["throughput"] * 1.1:
+            return current
+    return None
+
+
+async def main_async(args, port, server_pid):
+    print(f"{os.cpu_count()} CPUs | each student: open, {args.marks} marks x {args.semesters} semesters, "
+          f"{args.semesters - 1} semester switches, every export | think time up to {args.think}s")
+    # Warm-up: imports, cache_resource views and the first script compile
+    await run_level(port, server_pid, 1, args, seed=0)
+
+    results = []
+    for n_sessions in args.levels:
+        stats = await run_level(port, server_pid, n_sessions, args, seed=len(results) * 100_000)
+        print_level(stats)
+        results.append(stats)
+
+    saturated = saturation_point(results)
+    if saturated is None:
+        print(f"saturation: not reached; throughput still growing at {results[-1]['sessions']} sessions")
+    else:
+        print(f"saturation: ~{saturated['sessions']} concurrent sessions ({saturated['throughput']:.1f} reruns/s, "
+              f"p95 {saturated['p95'] * 1000:.0f} ms); beyond it reruns only queue")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--levels", default="1,5,10,25,50,100",
+                        type=lambda text: [int(n) for n in text.split(",")], help="concurrent sessions per level")
+    parser.add_argument("--semesters", type=int, default=2, help="semesters each student visits")
+    parser.add_argument("--marks", type=int, default=4, help="marks entered per semester visited")
+    parser.add_argument("--think", type=float, default=0.0, help="max random pause between actions, seconds")
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds to wait for one rerun")
+    parser.add_argument("--server-log", action="store_true", help="show the streamlit server's log")
+    args = parser.parse_args()
+
+    port = free_port()
+    server = start_server(port, args.server_log)
+    try:
+        asyncio.run(main_async(args, port, server.pid))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
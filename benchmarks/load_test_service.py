@@ -0,0 +1,127 @@
+"""
+Load test: HTTP grading service, requests/sec and latency percentiles
+Starts `gpa serve` on a free local port, then drives it from asyncio
+keep-alive connections (raw HTTP/1.1, no client library needed).
+Run: python benchmarks/load_test_service.py [--concurrency 32] [--requests 5000] [--batch-size 500]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_parallel import synthetic_cohort  # noqa: E402
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def request(reader, writer, path, body):
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) != b"\r\n":
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def run_load(port, path, bodies, concurrency):
+    """Send every body over `concurrency` connections; returns (elapsed seconds, latencies)"""
+    queue = asyncio.Queue()
+    for body in bodies:
+        queue.put_nowait(body)
+    latencies = []
+
+    async def client():
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            while not queue.empty():
+                body = queue.get_nowait()
+                start = time.perf_counter()
+                status = await request(reader, writer, path, body)
+                latencies.append(time.perf_counter() - start)
+                assert status == 200, status
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return time.perf_counter() - start, latencies
+
+
+def report(label, elapsed, latencies, students_per_request=1):
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    rps = len(latencies) / elapsed
+    print(f"  {label:<28} {rps:8.0f} req/s | {rps * students_per_request:8.0f} students/s | "
+          f"p50 {p50 * 1000:7.1f} ms | p99 {p99 * 1000:7.1f} ms")
+
+
+async def main_async(args, port):
+    cohort = [marks for _, marks in synthetic_cohort(max(args.requests, args.batch_size), seed=5)]
+    singles = [json.dumps(marks).encode() for marks in cohort[:args.requests]]
+    batch = json.dumps([
+        {"student_id": f"S{i}", "semester_marks": marks} for i, marks in enumerate(cohort[:args.batch_size])
+    ]).encode()
+
+    print(f"{args.concurrency} connections, {os.cpu_count()} CPUs")
+    report("POST /grade", *await run_load(port, "/grade", singles, args.concurrency))
+
+    n_batches = max(args.requests // args.batch_size, 4)
+    report(f"POST /grade/batch ({args.batch_size})",
+           *await run_load(port, "/grade/batch", [batch] * n_batches, min(args.concurrency, n_batches)),
+           students_per_request=args.batch_size)
+
+    # Singles while batches are being graded: the event loop must stay responsive
+    mixed = asyncio.create_task(run_load(port, "/grade/batch", [batch] * n_batches, 2))
+    report("POST /grade during batches", *await run_load(port, "/grade", singles, args.concurrency))
+    await mixed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--workers", type=int, help="service batch workers (default: all CPUs)")
+    args = parser.parse_args()
+
+    port = free_port()
+    command = [sys.executable, os.path.join(ROOT, "gpa_cli.py"), "serve", "--port", str(port)]
+    if args.workers:
+        command += ["--workers", str(args.workers)]
+    server = subprocess.Popen(command, cwd=ROOT)
+    try:
+        for _ in range(100):
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                break
+            except OSError:
+                time.sleep(0.1)
+        asyncio.run(main_async(args, port))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
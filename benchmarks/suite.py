@@ -0,0 +1,153 @@
+"""
+Benchmark suite: grading functions and full Streamlit reruns
+Results are saved as a JSON baseline that later runs compare against.
+
+Run:
+    python benchmarks/suite.py --save baseline.json
+    python benchmarks/suite.py --compare baseline.json [--threshold 0.25]
+    python benchmarks/suite.py --quick            # skip the 100k cohort and app reruns
+A comparison exits with status 1 when any benchmark is slower than the
+baseline by more than the threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_parallel import synthetic_cohort  # noqa: E402
+from gpa_core import (  # noqa: E402
+    assign_grade, calculate_cumulative_gpa, calculate_percentage, calculate_semester_gpa,
+)
+
+# ==================== GRADING BENCHMARKS ====================
+
+def _per_call(func, repeat=7):
+    """Best-of-repeat seconds per call of func()"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def grading_benchmarks(cohort_sizes):
+    _, student = next(synthetic_cohort(1))
+    semester_name, marks_data = next(iter(student.items()))
+
+    results = {
+        "calculate_percentage": _per_call(lambda: calculate_percentage(67.5, 100)),
+        "assign_grade": _per_call(lambda: assign_grade(67.5)),
+        "calculate_semester_gpa/1": _per_call(lambda: calculate_semester_gpa(marks_data, semester_name)),
+        "calculate_cumulative_gpa/1": _per_call(lambda: calculate_cumulative_gpa(student)),
+    }
+
+    for n_students in cohort_sizes:
+        cohort = [marks for _, marks in synthetic_cohort(n_students)]
+
+        def semester_cohort():
+            for all_semester_marks in cohort:
+                for name, data in all_semester_marks.items():
+                    calculate_semester_gpa(data, name)
+
+        def cumulative_cohort():
+            for all_semester_marks in cohort:
+                calculate_cumulative_gpa(all_semester_marks)
+
+        results[f"calculate_semester_gpa/{n_students}"] = _per_call(semester_cohort, repeat=3)
+        results[f"calculate_cumulative_gpa/{n_students}"] = _per_call(cumulative_cohort, repeat=3)
+
+    return results
+
+# ==================== APP RERUN BENCHMARKS ====================
+
+def app_benchmarks(n_runs=10):
+    from streamlit.testing.v1 import AppTest
+
+    from gpa_core import build_running_totals
+
+    _, semester_marks = next(synthetic_cohort(1))
+    results = {}
+
+    for entry_mode in ("Form", "Grid"):
+        at = AppTest.from_file(os.path.join(ROOT, "gpa_calculator_app.py"), default_timeout=60)
+        at.session_state["semester_marks"] = semester_marks
+        at.session_state["running_totals"] = build_running_totals(semester_marks)
+        at.session_state["entry_mode"] = entry_mode
+        at.run()
+
+        timings = []
+        for _ in range(n_runs):
+            start = time.perf_counter()
+            at.run()
+            timings.append(time.perf_counter() - start)
+
+        if at.exception:
+            raise RuntimeError(f"app raised during rerun: {at.exception}")
+        results[f"app_rerun/{entry_mode.lower()}"] = statistics.median(timings)
+
+    return results
+
+# ==================== BASELINE ====================
+
+def compare(results, baseline, threshold):
+    """Print a comparison table; return the names that regressed"""
+    regressions = []
+    print(f"{'benchmark':<36} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, seconds in results.items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<36} {'-':>12} {seconds * 1e6:>10.1f}us {'new':>8}")
+            continue
+        change = seconds / before - 1
+        flag = " REGRESSION" if change > threshold else ""
+        if flag:
+            regressions.append(name)
+        print(f"{name:<36} {before * 1e6:>10.1f}us {seconds * 1e6:>10.1f}us {change:>+7.0%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--save", metavar="PATH", help="write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown before flagging (default: 0.25)")
+    parser.add_argument("--quick", action="store_true", help="small cohorts only, no app reruns")
+    args = parser.parse_args(argv)
+
+    results = grading_benchmarks([1_000] if args.quick else [1_000, 10_000, 100_000])
+    if not args.quick:
+        results.update(app_benchmarks())
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+    else:
+        regressions = []
+        for name, seconds in results.items():
+            print(f"{name:<36} {seconds * 1e6:>12.1f}us")
+
+    if args.save:
+        baseline = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "results": results,
+        }
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2)
+
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
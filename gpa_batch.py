@@ -0,0 +1,140 @@
+"""
+GPA Calculator - Vectorized Cohort Engine
+Grades a whole cohort at once from a students x components marks matrix
+(NaN = exam not taken yet)
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from gpa_core import CURRICULUM_INDEX, FALLBACK_GRADE, POINT_SCALE
+
+# ==================== COMPONENT COLUMNS ====================
+# One matrix column per curriculum component, in curriculum (component id) order
+
+CohortLayout = namedtuple("CohortLayout", [
+    "semester_names",
+    "component_columns",       # (semester, "CODE_TYPE") per column
+    "column_of",               # semester -> {"CODE_TYPE": column}
+    "column_full_marks",
+    "graded_columns",          # credit-bearing columns only (count towards GPA)
+    "graded_credits",          # in exact 1/POINT_SCALE units, like the points, so fractional credits stay exact
+    "graded_semester_onehot",  # graded column x semester one-hot, for per-semester sums in one matmul
+    "band_mins",
+    "band_grades",             # index 0 is the "below every band" fallback (FALLBACK_GRADE)
+    "band_points",
+    "band_scaled_points",
+])
+
+
+def cohort_layout(index):
+    """Matrix layout and grade-band arrays for a compiled curriculum (build once per program)"""
+    semester_names = list(index.semesters)
+    column_semester = np.array([semester_names.index(c.semester) for c in index.components], dtype=np.int64)
+    column_credits = np.asarray(index.credits)
+    graded_columns = np.flatnonzero(column_credits > 0)
+    return CohortLayout(
+        semester_names=semester_names,
+        component_columns=[(c.semester, c.key) for c in index.components],
+        column_of={name: {c.key: c.id for c in semester.components} for name, semester in index.semesters.items()},
+        column_full_marks=np.asarray(index.full_marks),
+        graded_columns=graded_columns,
+        graded_credits=np.rint(column_credits[graded_columns] * POINT_SCALE).astype(np.int64),
+        graded_semester_onehot=(
+            column_semester[graded_columns, None] == np.arange(len(semester_names))
+        ).astype(np.int64),
+        band_mins=np.array(index.band_mins, dtype=float),
+        band_grades=np.array([FALLBACK_GRADE[0]] + [grade for grade, _ in index.band_results]),
+        band_points=np.array([FALLBACK_GRADE[1]] + [point for _, point in index.band_results]),
+        band_scaled_points=np.array([0] + [round(point * POINT_SCALE) for _, point in index.band_results], dtype=np.int64),
+    )
+
+
+CIVIL_LAYOUT = cohort_layout(CURRICULUM_INDEX)
+
+SEMESTER_NAMES = CIVIL_LAYOUT.semester_names
+COMPONENT_COLUMNS = CIVIL_LAYOUT.component_columns
+COLUMN_FULL_MARKS = CIVIL_LAYOUT.column_full_marks
+GRADED_COLUMNS = CIVIL_LAYOUT.graded_columns
+GRADED_CREDITS = CIVIL_LAYOUT.graded_credits
+GRADED_SEMESTER_ONEHOT = CIVIL_LAYOUT.graded_semester_onehot
+
+# ==================== CONVERSION ====================
+
+def marks_matrix(cohort_marks, layout=CIVIL_LAYOUT):
+    """Build a students x components matrix from per-student semester_marks dicts"""
+    # Fill plain lists (only the marks each student has), then convert once
+    blank = [np.nan] * len(layout.component_columns)
+    rows = []
+    for all_semester_marks in cohort_marks:
+        row = blank.copy()
+        for semester_name, marks_data in all_semester_marks.items():
+            column_of = layout.column_of.get(semester_name, {})
+            for key, marks in marks_data.items():
+                col = column_of.get(key)
+                if col is not None and marks is not None:
+                    row[col] = marks
+        rows.append(row)
+
+    return np.array(rows, dtype=float).reshape(len(rows), len(blank))
+
+# ==================== VECTORIZED CALCULATION ====================
+
+def _grade_band_index(percentages, band_mins):
+    """Lookup index into a layout's band_grades / band_points for every percentage"""
+    percentages = np.asarray(percentages, dtype=float)
+    index = np.searchsorted(band_mins, percentages, side="right")
+    # NaN sorts past every band; treat it like the scalar fallback
+    return np.where(np.isnan(percentages), 0, index)
+
+
+def assign_grades(percentages, layout=CIVIL_LAYOUT):
+    """Vectorized assign_grade: (grades, grade points) arrays for an array of percentages"""
+    index = _grade_band_index(percentages, layout.band_mins)
+    return layout.band_grades[index], layout.band_points[index]
+
+
+def _round_gpa(values):
+    """Python round(x, 2) applied elementwise, so results match the scalar functions bit for bit"""
+    unique, inverse = np.unique(values, return_inverse=True)
+    rounded = np.array([round(float(value), 2) for value in unique])
+    return rounded[inverse].reshape(values.shape)
+
+
+def calculate_cohort_gpa(matrix, layout=CIVIL_LAYOUT):
+    """
+    Semester GPA and CGPA for every student in a marks matrix laid out by layout (default: civil).
+    Same rules as calculate_semester_gpa / calculate_cumulative_gpa:
+    - Zero-credit components are skipped
+    - NaN (not taken) components are skipped
+    - Zero marks are valid (F grade)
+    Weighted points are summed as exact scaled integers, like the scalar functions.
+    """
+    matrix = np.asarray(matrix, dtype=float)
+
+    graded = matrix[:, layout.graded_columns]
+    taken = ~np.isnan(graded)
+    index = _grade_band_index(graded / layout.column_full_marks[layout.graded_columns] * 100, layout.band_mins)
+
+    weighted = np.where(taken, layout.band_scaled_points[index] * layout.graded_credits, 0)
+    credits = np.where(taken, layout.graded_credits, 0)
+
+    # Points and credits are both scaled: one correctly rounded division per total, as the scalar functions do
+    semester_weighted = (weighted @ layout.graded_semester_onehot) / POINT_SCALE**2
+    semester_credits = (credits @ layout.graded_semester_onehot) / POINT_SCALE
+    total_weighted = weighted.sum(axis=1) / POINT_SCALE**2
+    total_credits = credits.sum(axis=1) / POINT_SCALE
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        semester_gpa = np.where(semester_credits > 0, semester_weighted / semester_credits, 0.0)
+        cgpa = np.where(total_credits > 0, total_weighted / total_credits, 0.0)
+
+    return {
+        "semester_gpa": _round_gpa(semester_gpa),
+        "semester_weighted": semester_weighted,
+        "semester_credits": semester_credits,
+        "cgpa": _round_gpa(cgpa),
+        "weighted": total_weighted,
+        "credits": total_credits,
+    }
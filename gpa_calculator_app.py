@@ -1,205 +1,248 @@
 """
 GPA Calculator - Streamlit Application
-Civil Engineering Program (Pre-populated Subjects)
+Engineering Programs (Pre-populated Subjects, Civil Engineering built in)
 Credit-Weighted, Grade-Based System
 """
 
 import streamlit as st
-import pandas as pd
 from datetime import datetime
-import json
+import os
+
+import gpa_core
+import gpa_montecarlo
+import gpa_profiling
+import gpa_target
+from gpa_export import export_csv, export_json, export_parquet, freeze_marks
+from gpa_profiling import timed
+from gpa_ranking import AnonymousEntry, RankingIndex
+from gpa_sessions import SessionMemoryManager
+from gpa_registry import DEFAULT_PROGRAM, get_program, list_programs, program_label
+from gpa_store import MarksStore
+
+# Calc calls used by the UI, timed when profiling is enabled
+apply_mark_change = timed(gpa_core.apply_mark_change)
+assign_grade = timed(gpa_core.assign_grade)
+build_running_totals = timed(gpa_core.build_running_totals)
+calculate_percentage = timed(gpa_core.calculate_percentage)
+totals_gpa = timed(gpa_core.totals_gpa)
+simulate_cgpa = timed(gpa_montecarlo.simulate_cgpa)
+solve_target = timed(gpa_target.solve_target)
 
-# Page configuration
-st.set_page_config(
-    page_title="GPA Calculator - Civil Engineering",
-    page_icon="🎓",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# ==================== GRADE TABLE (FIXED, DISCRETE) ====================
-GRADE_TABLE = [
-    {"min": 80, "max": 100, "grade": "A", "point": 4.0},
-    {"min": 75, "max": 79, "grade": "A−", "point": 3.7},
-    {"min": 70, "max": 74, "grade": "B+", "point": 3.3},
-    {"min": 65, "max": 69, "grade": "B", "point": 3.0},
-    {"min": 60, "max": 64, "grade": "B−", "point": 2.7},
-    {"min": 55, "max": 59, "grade": "C+", "point": 2.3},
-    {"min": 50, "max": 54, "grade": "C", "point": 2.0},
-    {"min": 0, "max": 49, "grade": "F", "point": 0.0}
-]
-
-# ==================== CIVIL ENGINEERING CURRICULUM ====================
-CIVIL_ENGINEERING_CURRICULUM = {
-    "Year 1 - Part I": [
-        {"code": "SH 101", "name": "Engineering Mathematics I", "type": "L+T", "credit": 3, "full_marks": 100},
-        {"code": "SH 101", "name": "Engineering Mathematics I", "type": "P", "credit": 0, "full_marks": 25},
-        {"code": "SH 103", "name": "Engineering Chemistry", "type": "L+T", "credit": 3, "full_marks": 100},
-        {"code": "SH 103", "name": "Engineering Chemistry", "type": "P", "credit": 0, "full_marks": 25},
-        {"code": "CT 101", "name": "Computer Programming", "type": "L+T", "credit": 3, "full_marks": 100},
-        {"code": "CT 101", "name": "Computer Programming", "type": "P", "credit": 0, "full_marks": 50},
-        {"code": "EE 103", "name": "Basic Electrical and Electronics Engineering", "type": "L+T", "credit": 3, "full_marks": 100},
-        {"code": "EE 103", "name": "Basic Electrical and Electronics Engineering", "type": "P", "credit": 0, "full_marks": 25},
-        {"code": "CE 101", "name": "Engineering Mechanics", "type": "L+T", "credit": 4, "full_marks": 100},
-        {"code": "CE 102", "name": "Engineering Geology I", "type": "L+T", "credit": 2, "full_marks": 75},
-        {"code": "CE 102", "name": "Engineering Geology I", "type": "P", "credit": 0, "full_marks": 25},
-        {"code": "CE 103", "name": "Civil Engineering Materials", "type": "L+T", "credit": 2, "full_marks": 50},
-        {"code": "CE 103", "name": "Civil Engineering Materials", "type": "P", "credit": 0, "full_marks": 25},
-    ],
-    "Year 1 - Part II": [
-        {"code": "SH 151", "name": "Engineering Mathematics II", "type": "L+T", "credit": 3, "full_marks": 100},
-        {"code": "SH 152", "name": "Engineering Physics", "type": "L+T", "credit": 4, "full_marks": 100},
-        {"code": "SH 152", "name": "Engineering Physics", "type": "P", "credit": 0, "full_marks": 25},
-        {"code": "ME 158", "name": "Engineering Drawing", "type": "L+T", "credit": 2, "full_marks": 50},
-        {"code": "ME 158", "name": "Engineering Drawing", "type": "P", "credit": 0, "full_marks": 50},
-        {"code": "CE 151", "name": "Strength of Materials", "type": "L+T", "credit": 3, "full_marks": 100},
-        {"code": "CE 151", "name": "Strength of Materials", "type": "P", "credit": 0, "full_marks": 25},
-        {"code": "CE 152", "name": "Engineering Geology II", "type": "L+T", "credit": 2, "full_marks": 50},
-        {"code": "CE 152", "name": "Engineering Geology II", "type": "P", "credit": 0, "full_marks": 25},
-        {"code": "CE 153", "name": "Engineering Survey I", "type": "L+T", "credit": 3, "full_marks": 100},
-        {"code": "CE 153", "name": "Engineering Survey I", "type": "P", "credit": 0, "full_marks": 50},
-    ],
-    "Year 2 - Part I": [
-        {"code": "SH 201", "name": "Engineering Mathematics III", "type": "L+T", "credit": 3, "full_marks": 100},
-        {"code": "SH 202", "name": "Numerical Methods", "type": "L+T", "credit": 3, "full_marks": 100},
-        {"code": "SH 202", "name": "Numerical Methods", "type": "P", "credit": 0, "full_marks": 50},
-        {"code": "CE 201", "name": "Fluid Mechanics", "type": "L+T", "credit": 4, "full_marks": 100},
-        {"code": "CE 201", "name": "Fluid Mechanics", "type": "P", "credit": 0, "full_marks": 25},
-        {"code": "CE 202", "name": "Theory of Structures I", "type": "L+T", "credit": 3, "full_marks": 100},
-        {"code": "CE 202", "name": "Theory of Structures I", "type": "P", "credit": 0, "full_marks": 25},
-        {"code": "CE 203", "name": "Engineering Survey II", "type": "L+T", "credit": 3, "full_marks": 100},
-        {"code": "CE 203", "name": "Engineering Survey II", "type": "P", "credit": 0, "full_marks": 50},
-        {"code": "CE 204", "name": "Computer Aided Civil Drawing", "type": "L+T", "credit": 2, "full_marks": 50},
-        {"code": "CE 204", "name": "Computer Aided Civil Drawing", "type": "P", "credit": 0, "full_marks": 50},
-        {"code": "CE 205", "name": "Concrete Technology", "type": "L+T", "credit": 2, "full_marks": 50},
-        {"code": "CE 205", "name": "Concrete Technology", "type": "P", "credit": 0, "full_marks": 25},
-    ],
-    "Year 2 - Part II": [
-        {"code": "SH 251", "name": "Communication English", "type": "L+T", "credit": 3, "full_marks": 100},
-        {"code": "SH 251", "name": "Communication English", "type": "P", "credit": 0, "full_marks": 25},
-        {"code": "SH 252", "name": "Probability and Statistics", "type": "L+T", "credit": 3, "full_marks": 100},
-        {"code": "CE 251", "name": "Hydraulics", "type": "L+T", "credit": 4, "full_marks": 100},
-        {"code": "CE 251", "name": "Hydraulics", "type": "P", "credit": 0, "full_marks": 25},
-        {"code": "CE 252", "name": "Theory of Structures II", "type": "L+T", "credit": 4, "full_marks": 100},
-        {"code": "CE 252", "name": "Theory of Structures II", "type": "P", "credit": 0, "full_marks": 25},
-        {"code": "CE 253", "name": "Soil Mechanics", "type": "L+T", "credit": 4, "full_marks": 100},
-        {"code": "CE 253", "name": "Soil Mechanics", "type": "P", "credit": 0, "full_marks": 25},
-        {"code": "CE 254", "name": "Water Supply Engineering", "type": "L+T", "credit": 3, "full_marks": 100},
-        {"code": "CE 254", "name": "Water Supply Engineering", "type": "P", "credit": 0, "full_marks": 25},
-        {"code": "CE 255", "name": "Building Technology", "type": "L+T", "credit": 2, "full_marks": 50},
-        {"code": "CE 256", "name": "Survey Camp", "type": "P", "credit": 2, "full_marks": 100},
-    ]
-}
-
-# ==================== CORE CALCULATION LOGIC ====================
-
-def calculate_percentage(marks_obtained, full_marks):
-    """Calculate percentage correctly"""
-    return (marks_obtained / full_marks) * 100
-
-
-def assign_grade(percentage):
-    """Assign grade and grade point based on fixed bands"""
-    for grade_row in GRADE_TABLE:
-        if grade_row["min"] <= percentage <= grade_row["max"]:
-            return grade_row["grade"], grade_row["point"]
-    return "F", 0.0
-
-
-def calculate_weighted_point(grade_point, credit):
-    """Grade point weighted by component credit"""
-    return grade_point * credit
-
-
-def calculate_semester_gpa(marks_data, semester_name):
-    """
-    Correct GPA calculation:
-    - Theory and Practical counted separately
-    - Zero marks treated as valid (F grade)
-    - All credits included
-    """
-    total_weighted_points = 0.0
-    total_credits = 0.0
-
-    curriculum = CIVIL_ENGINEERING_CURRICULUM[semester_name]
-
-    for subject in curriculum:
-        credit = subject["credit"]
-        key = f"{subject['code']}_{subject['type']}"
-
-        # Skip only if credit is zero (non-GPA components)
-        if credit <= 0:
-            continue
-
-        # If marks not entered, skip (exam not taken yet)
-        if key not in marks_data:
-            continue
-
-        marks = marks_data[key]
-
-        # Zero marks are VALID
-        percentage = calculate_percentage(marks, subject["full_marks"])
-        grade, grade_point = assign_grade(percentage)
-
-        weighted_point = calculate_weighted_point(grade_point, credit)
-
-        total_weighted_points += weighted_point
-        total_credits += credit
-
-    if total_credits == 0:
-        return 0.0, 0.0, 0.0
-
-    gpa = total_weighted_points / total_credits
-    return round(gpa, 2), total_weighted_points, total_credits
+# ==================== SESSION STATE INITIALIZATION ====================
 
+def empty_semester_marks(index):
+    """One empty marks dict per semester of a program"""
+    return {name: {} for name in index.semesters}
 
-def calculate_cumulative_gpa(all_semester_marks):
-    """Correct cumulative GPA across semesters"""
-    total_weighted_points = 0.0
-    total_credits = 0.0
+if 'program' not in st.session_state:
+    requested = st.query_params.get("program", DEFAULT_PROGRAM)
+    st.session_state.program = requested if requested in list_programs() else DEFAULT_PROGRAM
+    st.session_state.active_program = st.session_state.program
 
-    for semester_name, marks_data in all_semester_marks.items():
-        curriculum = CIVIL_ENGINEERING_CURRICULUM[semester_name]
+def current_program():
+    """Program selected in this session (parsed on first use, shared process-wide)"""
+    return get_program(st.session_state.program)
 
-        for subject in curriculum:
-            credit = subject["credit"]
-            key = f"{subject['code']}_{subject['type']}"
+if 'semester_marks' not in st.session_state:
+    st.session_state.semester_marks = empty_semester_marks(current_program().index)
 
-            if credit <= 0 or key not in marks_data:
-                continue
+if 'program_marks' not in st.session_state:
+    # Marks of programs switched away from, restored when switching back
+    st.session_state.program_marks = {}
 
-            marks = marks_data[key]
-            percentage = calculate_percentage(marks, subject["full_marks"])
-            _, grade_point = assign_grade(percentage)
+if 'current_semester' not in st.session_state:
+    st.session_state.current_semester = next(iter(current_program().index.semesters))
 
-            total_weighted_points += grade_point * credit
-            total_credits += credit
+if 'entry_mode' not in st.session_state:
+    st.session_state.entry_mode = "Form"
 
-    if total_credits == 0:
-        return 0.0, 0.0, 0.0
+if 'running_totals' not in st.session_state:
+    st.session_state.running_totals = build_running_totals(st.session_state.semester_marks, current_program().index)
 
-    cgpa = total_weighted_points / total_credits
-    return round(cgpa, 2), total_weighted_points, total_credits
+if 'student_id' not in st.session_state:
+    # Normalised once here and in render_student_selector; everything else reads student_id
+    st.session_state.student_id_input = st.query_params.get("student", "")
+    st.session_state.student_id = st.session_state.student_id_input.strip()
 
-# ==================== SESSION STATE INITIALIZATION ====================
+# Page configuration
+st.set_page_config(
+    page_title=f"GPA Calculator - {current_program().name}",
+    page_icon="🎓",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
 
-if 'semester_marks' not in st.session_state:
-    st.session_state.semester_marks = {
-        "Year 1 - Part I": {},
-        "Year 1 - Part II": {},
-        "Year 2 - Part I": {},
-        "Year 2 - Part II": {}
-    }
+# ==================== MARKS PERSISTENCE ====================
+
+@st.cache_resource
+def get_marks_store():
+    """Process-wide SQLite marks store, enabled by the GPA_DB_PATH environment variable"""
+    path = os.environ.get("GPA_DB_PATH")
+    return MarksStore(path) if path else None
+
+@st.cache_resource(max_entries=8)
+def get_ranking_index(program_id):
+    """Process-wide CGPA ranking of a program's students, seeded from the marks store"""
+    index = get_program(program_id).index
+    ranking = RankingIndex(max_cgpa=max(point for _, point in index.band_results))
+    store = get_marks_store()
+    if store is not None:
+        for student_id, semester_marks in store.iter_students(program_id):
+            ranking.update_totals(student_id, gpa_core.build_running_totals(semester_marks, index))
+    return ranking
+
+def anonymous_entry():
+    """This session's anonymous ranking entry; it lives in session state, so it leaves the rankings with the session"""
+    if '_anonymous_rank' not in st.session_state:
+        st.session_state['_anonymous_rank'] = AnonymousEntry(f"session:{_session_id()}")
+    return st.session_state['_anonymous_rank']
+
+def ranking_id():
+    """Who this session ranks as: the student ID, else the anonymous session"""
+    return st.session_state.student_id or anonymous_entry().student_id
+
+def update_ranking():
+    """Move this session's student to its current CGPA in the program ranking (O(log n))"""
+    ranking = get_ranking_index(st.session_state.program)
+    if not st.session_state.student_id:
+        anonymous_entry().track(ranking)
+    ranking.update_totals(ranking_id(), st.session_state.running_totals)
+
+@st.cache_resource
+def get_session_memory():
+    """Process-wide session memory manager (budget from GPA_SESSION_BUDGET_MB)"""
+    return SessionMemoryManager()
+
+def restore_session():
+    """Bring this session's marks back if they were spilled while it was idle"""
+    get_session_memory().begin(st.session_state, _session_id())
+
+def reset_entry_widgets():
+    """Drop marks widget state so inputs re-read semester_marks"""
+    for key in list(st.session_state):
+        if key.startswith(("input_", "grid_")):
+            del st.session_state[key]
+
+def load_student(student_id):
+    """Load a student's marks from the store into this session (on first access)"""
+    program = current_program()
+    st.session_state.semester_marks = get_marks_store().load_student(student_id, program.id)
+    st.session_state.running_totals = build_running_totals(st.session_state.semester_marks, program.index)
+    st.session_state.loaded_student = student_id
+    # Marks entered before picking an ID belonged to the anonymous session
+    get_ranking_index(program.id).remove(anonymous_entry().student_id)
+    update_ranking()
+    reset_entry_widgets()
+
+def switch_program():
+    """Selectbox callback: stash this program's marks and restore (or start) the new one's"""
+    # Callbacks run before main(), so restore a spilled session first
+    restore_session()
+    previous = st.session_state.active_program
+    st.session_state.program_marks[previous] = st.session_state.semester_marks
+    
+    program = current_program()
+    store = get_marks_store()
+    if store is not None and st.session_state.student_id:
+        semester_marks = store.load_student(st.session_state.student_id, program.id)
+    else:
+        semester_marks = st.session_state.program_marks.pop(program.id, None) or empty_semester_marks(program.index)
+    
+    st.session_state.semester_marks = semester_marks
+    st.session_state.running_totals = build_running_totals(semester_marks, program.index)
+    st.session_state.current_semester = next(iter(program.index.semesters))
+    st.session_state.active_program = program.id
+    update_ranking()
+    reset_entry_widgets()
+
+def set_marks(semester_name, key, marks):
+    """Update one component's marks (None = not taken) in session state, running totals and store"""
+    marks_data = st.session_state.semester_marks[semester_name]
+    current_marks = marks_data.get(key, None)
+    if marks == current_marks:
+        return
+    
+    program = current_program()
+    apply_mark_change(st.session_state.running_totals, semester_name, key, current_marks, marks, program.index)
+    if marks is None:
+        marks_data.pop(key, None)
+    else:
+        marks_data[key] = marks
+    update_ranking()
+    
+    store = get_marks_store()
+    if store is not None and st.session_state.student_id:
+        store.set_mark(st.session_state.student_id, semester_name, key, marks, program.id)
+
+# ==================== VIEW MODELS (CACHED) ====================
+# Static display data derived from the curriculum and grade table, built
+# once per process and shared read-only by every session and rerun
+
+@st.cache_resource(max_entries=8)
+def grade_table_view(program_id):
+    """Grading scale table shown in the header"""
+    import pandas as pd
+    index = get_program(program_id).index
+    # Bands are continuous: each covers [min, next band's min)
+    upper = list(index.band_mins[1:]) + [None]
+    rows = [
+        {
+            "Percentage": f"{low:g} and above" if high is None else f"{low:g} to below {high:g}",
+            "Grade": grade,
+            "Grade Point": point,
+        }
+        for low, high, (grade, point) in zip(index.band_mins, upper, index.band_results)
+    ]
+    return pd.DataFrame(rows[::-1])
+
+@st.cache_resource(max_entries=32)
+def marks_input_view(program_id, semester_name):
+    """Per-subject headers and per-component labels / widget params for the marks form"""
+    semester = get_program(program_id).index.semesters[semester_name]
+    return tuple(
+        {
+            "title_md": f"### {components[0].name}",
+            "code_md": f"**Course Code:** {code}",
+            "components": tuple(
+                {
+                    "key": component.key,
+                    "widget_key": f"input_{component.key}",
+                    "label": f"Marks for {component.key}",
+                    "type_md": f"**{component.type}**",
+                    "credit_md": f"{component.credit:.1f}" if component.credit > 0 else "-",
+                    "full_marks_md": f"{component.full_marks}",
+                    "full_marks": component.full_marks,
+                    "max_value": float(component.full_marks),
+                    "graded": component.credit > 0,
+                }
+                for component in components
+            ),
+        }
+        for code, components in semester.by_code.items()
+    )
 
-if 'current_semester' not in st.session_state:
-    st.session_state.current_semester = "Year 1 - Part I"
+@st.cache_resource(max_entries=32)
+def marks_grid_view(program_id, semester_name):
+    """Static columns of the marks grid, one row per component"""
+    return tuple(
+        {
+            "Course Code": component.code,
+            "Subject": component.name,
+            "Component": component.type,
+            "Credit": component.credit if component.credit > 0 else None,
+            "Full Marks": component.full_marks,
+        }
+        for component in get_program(program_id).index.semesters[semester_name].components
+    )
 
 # ==================== UI COMPONENTS ====================
 
+@timed
 def render_header():
     """Render application header"""
-    st.title("🎓 GPA Calculator - Civil Engineering")
-    st.markdown("**Bachelor in Civil Engineering (First 4 Semesters)**")
+    program = current_program()
+    st.title(f"🎓 GPA Calculator - {program.name}")
+    st.markdown(f"**{program.description}**")
     
     with st.expander("ℹ️ **How to Use - Read First**", expanded=False):
         st.markdown("""
@@ -221,16 +264,31 @@ def render_header():
         """)
         
         # Display grade table
-        grade_df = pd.DataFrame(GRADE_TABLE)
-        grade_df = grade_df[['min', 'max', 'grade', 'point']]
-        grade_df.columns = ['Min %', 'Max %', 'Grade', 'Grade Point']
-        st.table(grade_df)
+        st.table(grade_table_view(program.id))
 
+@timed
+def render_program_selector():
+    """Render program selection (only when more than one program is available)"""
+    programs = list_programs()
+    if len(programs) < 2:
+        return
+    
+    st.sidebar.selectbox(
+        "🏛️ Program",
+        programs,
+        format_func=program_label,
+        key="program",
+        on_change=switch_program,
+        help="Switching keeps the marks entered for each program in this session"
+    )
+    st.sidebar.markdown("---")
+
+@timed
 def render_semester_selector():
     """Render semester selection"""
     st.sidebar.title("📚 Semester Selection")
     
-    semester_list = list(CIVIL_ENGINEERING_CURRICULUM.keys())
+    semester_list = list(current_program().index.semesters)
     
     st.sidebar.markdown(f"### Current: {st.session_state.current_semester}")
     st.sidebar.markdown("---")
@@ -245,32 +303,51 @@ def render_semester_selector():
             st.session_state.current_semester = semester
             st.rerun()
 
+@timed
+def render_student_selector():
+    """Render student ID input when marks are persisted"""
+    if get_marks_store() is None:
+        return
+    
+    st.sidebar.markdown("---")
+    student_id = st.sidebar.text_input(
+        "🆔 Student ID",
+        key="student_id_input",
+        help="Marks are saved under this ID and restored on your next visit"
+    ).strip()
+    st.session_state.student_id = student_id
+    
+    if student_id and st.session_state.get("loaded_student") != student_id:
+        load_student(student_id)
+
+@timed
+def render_entry_mode_selector():
+    """Render marks entry mode selection"""
+    st.sidebar.markdown("---")
+    st.sidebar.radio(
+        "✏️ Entry Mode",
+        ["Form", "Grid"],
+        key="entry_mode",
+        horizontal=True,
+        help="Grid: edit a whole semester in one table and save once (faster on slow connections)"
+    )
+
+@timed
 def render_marks_input():
     """Render marks input interface for current semester"""
     current_sem = st.session_state.current_semester
-    curriculum = CIVIL_ENGINEERING_CURRICULUM[current_sem]
     marks_data = st.session_state.semester_marks[current_sem]
     
     st.subheader(f"📝 Enter Marks - {current_sem}")
     st.markdown("*Enter marks obtained for each component. Leave blank if not taken yet.*")
     st.markdown("---")
     
-    # Group by subject code
-    subjects_by_code = {}
-    for subject in curriculum:
-        code = subject['code']
-        if code not in subjects_by_code:
-            subjects_by_code[code] = []
-        subjects_by_code[code].append(subject)
-    
     # Display each subject
-    for code, components in subjects_by_code.items():
-        # Subject header
-        subject_name = components[0]['name']
-        
+    for subject in marks_input_view(st.session_state.program, current_sem):
         with st.container():
-            st.markdown(f"### {subject_name}")
-            st.markdown(f"**Course Code:** {code}")
+            # Subject header
+            st.markdown(subject["title_md"])
+            st.markdown(subject["code_md"])
             
             cols = st.columns([2, 1, 1, 2, 1, 1, 1])
             cols[0].markdown("**Component**")
@@ -281,47 +358,44 @@ def render_marks_input():
             cols[5].markdown("**Grade**")
             cols[6].markdown("**GP**")
             
-            for component in components:
-                key = f"{component['code']}_{component['type']}"
+            for component in subject["components"]:
+                key = component["key"]
                 cols = st.columns([2, 1, 1, 2, 1, 1, 1])
                 
                 # Component type
-                cols[0].markdown(f"**{component['type']}**")
+                cols[0].markdown(component["type_md"])
                 
-                # Credit (show only if > 0)
-                if component['credit'] > 0:
-                    cols[1].markdown(f"{component['credit']:.1f}")
-                else:
-                    cols[1].markdown("-")
+                # Credit (shows "-" for zero-credit components)
+                cols[1].markdown(component["credit_md"])
                 
                 # Full marks
-                cols[2].markdown(f"{component['full_marks']}")
+                cols[2].markdown(component["full_marks_md"])
                 
                 # Marks input
                 current_marks = marks_data.get(key, None)
                 marks_input = cols[3].number_input(
-                    f"Marks for {key}",
+                    component["label"],
                     min_value=0.0,
-                    max_value=float(component['full_marks']),
+                    max_value=component["max_value"],
                     value=float(current_marks) if current_marks is not None else 0.0,
                     step=0.5,
                     format="%.1f",
-                    key=f"input_{key}",
+                    key=component["widget_key"],
                     label_visibility="collapsed"
                 )
                 
                 # Update marks in session state
                 if marks_input > 0:
-                    st.session_state.semester_marks[current_sem][key] = marks_input
+                    set_marks(current_sem, key, marks_input)
                 
                     # Calculate and display grade info
-                    percentage = calculate_percentage(marks_input, component['full_marks'])
-                    grade, grade_point = assign_grade(percentage)
+                    percentage = calculate_percentage(marks_input, component["full_marks"])
+                    grade, grade_point = assign_grade(percentage, current_program().index)
                     
                     cols[4].markdown(f"{percentage:.1f}")
                     cols[5].markdown(f"**{grade}**")
                     
-                    if component['credit'] > 0:
+                    if component["graded"]:
                         cols[6].markdown(f"{grade_point:.1f}")
                     else:
                         cols[6].markdown("-")
@@ -332,6 +406,75 @@ def render_marks_input():
             
             st.markdown("---")
 
+@timed
+def render_marks_grid():
+    """Render marks input for current semester as a single editable grid"""
+    import pandas as pd
+    
+    current_sem = st.session_state.current_semester
+    semester = current_program().index.semesters[current_sem]
+    marks_data = st.session_state.semester_marks[current_sem]
+    
+    st.subheader(f"📝 Enter Marks - {current_sem}")
+    st.markdown("*Edit the **Marks** column, then click **Save Marks**. Leave blank if not taken yet.*")
+    
+    # One row per component, with grade info for marks already saved
+    rows = []
+    for component, static_row in zip(semester.components, marks_grid_view(st.session_state.program, current_sem)):
+        marks = marks_data.get(component.key, None)
+        row = dict(static_row, **{"Marks": marks, "%": None, "Grade": None, "GP": None})
+        if marks is not None:
+            percentage = calculate_percentage(marks, component.full_marks)
+            grade, grade_point = assign_grade(percentage, current_program().index)
+            row["%"] = round(percentage, 1)
+            row["Grade"] = grade
+            row["GP"] = grade_point if component.credit > 0 else None
+        rows.append(row)
+    
+    grid_key = f"grid_{current_sem}"
+    
+    # Edits stay client-side until the form is submitted: one rerun per save
+    with st.form(key=f"grid_form_{current_sem}", border=False):
+        edited = st.data_editor(
+            pd.DataFrame(rows),
+            key=grid_key,
+            hide_index=True,
+            use_container_width=True,
+            num_rows="fixed",
+            disabled=["Course Code", "Subject", "Component", "Credit", "Full Marks", "%", "Grade", "GP"],
+            column_config={
+                "Credit": st.column_config.NumberColumn(format="%.1f"),
+                "Marks": st.column_config.NumberColumn(min_value=0.0, step=0.5, format="%.1f"),
+                "%": st.column_config.NumberColumn(format="%.1f"),
+                "GP": st.column_config.NumberColumn(format="%.1f"),
+            }
+        )
+        submitted = st.form_submit_button("💾 Save Marks", type="primary")
+    
+    if not submitted:
+        return
+    
+    # Validate every row against its full marks before saving anything
+    new_marks = {}
+    invalid = []
+    for component, value in zip(semester.components, edited["Marks"]):
+        marks = None if pd.isna(value) or value <= 0 else float(value)
+        if marks is not None and marks > component.full_marks:
+            invalid.append(f"{component.key} ({marks:.1f} > {component.full_marks})")
+        new_marks[component.key] = marks
+    
+    if invalid:
+        st.error("❌ Marks exceed full marks: " + ", ".join(invalid))
+        return
+    
+    for key, marks in new_marks.items():
+        set_marks(current_sem, key, marks)
+    
+    # Saved marks are now part of the grid data; drop the pending edits
+    del st.session_state[grid_key]
+    st.rerun()
+
+@timed
 def render_semester_results():
     """Render GPA results for current semester"""
     current_sem = st.session_state.current_semester
@@ -345,11 +488,11 @@ def render_semester_results():
     st.markdown("---")
     st.subheader(f"📊 {current_sem} Results")
     
-    # Calculate semester GPA
-    sem_gpa, sem_weighted, sem_credits = calculate_semester_gpa(marks_data, current_sem)
+    # Semester GPA from the running totals
+    sem_gpa, sem_weighted, sem_credits = totals_gpa(st.session_state.running_totals["semesters"][current_sem])
     
     # Get total possible credits for the semester
-    total_possible_credits = sum(s['credit'] for s in CIVIL_ENGINEERING_CURRICULUM[current_sem] if s['credit'] > 0)
+    total_possible_credits = current_program().index.semesters[current_sem].total_credits
     
     # Display results
     col1, col2, col3, col4 = st.columns(4)
@@ -383,6 +526,7 @@ def render_semester_results():
             help="Percentage of semester completed"
         )
 
+@timed
 def render_cumulative_gpa():
     """Render cumulative GPA across all semesters"""
     # Check if marks exist in any semester
@@ -398,22 +542,28 @@ def render_cumulative_gpa():
     st.markdown("---")
     st.subheader("🎯 Cumulative GPA (All Semesters)")
     
-    # Calculate cumulative GPA
-    cgpa, cgpa_weighted, cgpa_credits = calculate_cumulative_gpa(st.session_state.semester_marks)
+    # Cumulative GPA from the running totals
+    cgpa, cgpa_weighted, cgpa_credits = totals_gpa(st.session_state.running_totals)
     
-    # Calculate total possible credits across all semesters
-    total_possible_credits = sum(
-        sum(s['credit'] for s in curriculum if s['credit'] > 0)
-        for curriculum in CIVIL_ENGINEERING_CURRICULUM.values()
-    )
+    # Total possible credits across all semesters
+    total_possible_credits = current_program().index.total_credits
     
     col1, col2, col3, col4 = st.columns(4)
     
+    # Class standing from the shared ranking index
+    ranking = get_ranking_index(st.session_state.program)
+    standing = ranking.rank(ranking_id())
+    
     with col1:
         st.metric(
             label="Cumulative GPA",
             value=f"{cgpa:.2f}" if cgpa_credits > 0 else "0.00",
-            help="Overall GPA across all semesters"
+            delta=(
+                f"Rank {standing[0]} of {standing[1]} · ahead of {ranking.percentile(ranking_id()):.0f}%"
+                if standing else None
+            ),
+            delta_color="off",
+            help="Overall GPA across all semesters; rank among students using this calculator"
         )
     
     with col2:
@@ -427,7 +577,7 @@ def render_cumulative_gpa():
         st.metric(
             label="Total Possible Credits",
             value=f"{total_possible_credits:.1f}",
-            help="Total credits in first 4 semesters"
+            help="Total credits across all semesters"
         )
     
     with col4:
@@ -442,10 +592,10 @@ def render_cumulative_gpa():
     st.markdown("### 📈 Semester-wise Breakdown")
     
     breakdown_data = []
-    for sem_name in CIVIL_ENGINEERING_CURRICULUM.keys():
+    for sem_name in current_program().index.semesters:
         marks_data = st.session_state.semester_marks[sem_name]
         if any(marks_data.values()):
-            gpa, weighted, credits = calculate_semester_gpa(marks_data, sem_name)
+            gpa, weighted, credits = totals_gpa(st.session_state.running_totals["semesters"][sem_name])
             breakdown_data.append({
                 "Semester": sem_name,
                 "GPA": f"{gpa:.2f}",
@@ -454,9 +604,121 @@ def render_cumulative_gpa():
             })
     
     if breakdown_data:
+        import pandas as pd
         df_breakdown = pd.DataFrame(breakdown_data)
         st.dataframe(df_breakdown, use_container_width=True, hide_index=True)
 
+@timed
+def render_target_planner():
+    """Render the least marks needed on remaining components to reach a target CGPA"""
+    index = current_program().index
+    semester_marks = st.session_state.semester_marks
+    if not gpa_target.remaining_components(semester_marks, index):
+        return
+    
+    st.markdown("---")
+    st.subheader("🏁 Target CGPA Planner")
+    
+    max_point = max(point for _, point in index.band_results)
+    col1, col2 = st.columns([1, 3])
+    target = col1.number_input(
+        "Target CGPA",
+        min_value=0.0,
+        max_value=float(max_point),
+        value=min(3.0, float(max_point)),
+        step=0.05,
+        format="%.2f",
+        key="target_cgpa",
+        help="Every subject without marks is assumed to be taken and passed"
+    )
+    
+    result = solve_target(st.session_state.running_totals, semester_marks, target, index)
+    
+    if not result["reachable"]:
+        col2.warning(f"⚠️ {target:.2f} is out of reach: the best possible CGPA is **{result['max_cgpa']:.2f}**")
+        return
+    
+    col2.success(
+        f"✅ Reach **{target:.2f}** with at least **{result['total_marks']:.1f}** marks over "
+        f"{len(result['plan'])} remaining components (projected CGPA {result['projected_cgpa']:.2f})"
+    )
+    
+    import pandas as pd
+    plan_df = pd.DataFrame([
+        {
+            "Semester": row["component"].semester,
+            "Course Code": row["component"].code,
+            "Subject": row["component"].name,
+            "Component": row["component"].type,
+            "Credit": row["component"].credit,
+            "Full Marks": row["component"].full_marks,
+            "Marks Needed": row["marks"],
+            "Grade": row["grade"],
+        }
+        for row in result["plan"]
+    ])
+    st.dataframe(plan_df, use_container_width=True, hide_index=True)
+
+@timed
+def render_cgpa_projection():
+    """Render the simulated final CGPA distribution over the remaining components"""
+    index = current_program().index
+    semester_marks = st.session_state.semester_marks
+    if not gpa_target.remaining_components(semester_marks, index):
+        return
+    
+    st.markdown("---")
+    st.subheader("🎲 Final CGPA Projection")
+    
+    fitted_mean, fitted_std = gpa_montecarlo.fit_history(semester_marks, index)
+    col1, col2, col3 = st.columns(3)
+    model = col1.radio(
+        "Marks in remaining subjects",
+        ["Like my marks so far", "Custom"],
+        key="projection_model",
+        help=f"Fitted from your entered marks: mean {fitted_mean:.1f}%, spread {fitted_std:.1f}%"
+    )
+    if model == "Custom":
+        mean = col2.slider("Expected %", 0.0, 100.0, float(round(fitted_mean)), 1.0, key="projection_mean")
+        std = col2.slider("Spread (± %)", 0.0, 30.0, min(float(round(fitted_std)), 30.0), 0.5, key="projection_std")
+    else:
+        mean, std = fitted_mean, fitted_std
+    
+    max_point = max(point for _, point in index.band_results)
+    threshold = col3.number_input(
+        "Stay above CGPA",
+        min_value=0.0,
+        max_value=float(max_point),
+        value=min(3.0, float(max_point)),
+        step=0.05,
+        format="%.2f",
+        key="projection_threshold"
+    )
+    
+    # Simulations are reused until the marks or the distribution change
+    key = (freeze_marks(semester_marks, st.session_state.program), mean, std)
+    projection = st.session_state.setdefault("projection", {})
+    if projection.get("key") != key:
+        projection["key"] = key
+        projection["result"] = gpa_montecarlo.count_outcomes(
+            *simulate_cgpa(st.session_state.running_totals, semester_marks, mean, std, index)
+        )
+    summary = gpa_montecarlo.projection_summary(projection["result"], threshold)
+    
+    percentiles = summary["percentiles"]
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Median CGPA", f"{percentiles[50]:.2f}", help=f"Over {gpa_montecarlo.DEFAULT_SIMULATIONS:,} simulated outcomes")
+    col2.metric("Likely Range", f"{percentiles[5]:.2f} - {percentiles[95]:.2f}", help="5th to 95th percentile")
+    col3.metric(f"Chance of ≥ {threshold:.2f}", f"{summary['p_above']:.0%}")
+    
+    import pandas as pd
+    st.dataframe(
+        pd.DataFrame([{f"P{p}": f"{value:.2f}" for p, value in percentiles.items()}]),
+        use_container_width=True,
+        hide_index=True
+    )
+
+@timed
 def render_export_options():
     """Render data export options"""
     # Check if any marks are entered
@@ -471,56 +733,39 @@ def render_export_options():
     st.sidebar.markdown("---")
     st.sidebar.markdown("### 💾 Export Data")
     
-    # Prepare export data
-    export_data = []
+    # Payloads are built only when a download is clicked, and memoized on
+    # the marks content; a rerun only pays for this cheap snapshot
+    snapshot = freeze_marks(st.session_state.semester_marks, st.session_state.program)
+    file_stem = f"{st.session_state.program}_gpa_{datetime.now().strftime('%Y%m%d')}"
+    
+    # CSV download
+    st.sidebar.download_button(
+        label="📥 Download as CSV",
+        data=lambda: export_csv(snapshot),
+        file_name=f"{file_stem}.csv",
+        mime="text/csv",
+        use_container_width=True
+    )
     
-    for sem_name, marks_data in st.session_state.semester_marks.items():
-        curriculum = CIVIL_ENGINEERING_CURRICULUM[sem_name]
-        
-        for subject in curriculum:
-            key = f"{subject['code']}_{subject['type']}"
-            marks = marks_data.get(key, None)
-            
-            if marks is not None and marks > 0:
-                percentage = calculate_percentage(marks, subject['full_marks'])
-                grade, grade_point = assign_grade(percentage)
-                
-                export_data.append({
-                    'Semester': sem_name,
-                    'Course Code': subject['code'],
-                    'Subject': subject['name'],
-                    'Component': subject['type'],
-                    'Credit': subject['credit'],
-                    'Full Marks': subject['full_marks'],
-                    'Marks Obtained': marks,
-                    'Percentage': f"{percentage:.2f}",
-                    'Grade': grade,
-                    'Grade Point': grade_point,
-                })
-    
-    if export_data:
-        df_export = pd.DataFrame(export_data)
-        
-        # CSV download
-        csv = df_export.to_csv(index=False)
-        st.sidebar.download_button(
-            label="📥 Download as CSV",
-            data=csv,
-            file_name=f"civil_gpa_{datetime.now().strftime('%Y%m%d')}.csv",
-            mime="text/csv",
-            use_container_width=True
-        )
-        
-        # JSON download
-        json_data = json.dumps(st.session_state.semester_marks, indent=2)
-        st.sidebar.download_button(
-            label="📥 Download as JSON",
-            data=json_data,
-            file_name=f"civil_gpa_{datetime.now().strftime('%Y%m%d')}.json",
-            mime="application/json",
-            use_container_width=True
-        )
+    # JSON download
+    st.sidebar.download_button(
+        label="📥 Download as JSON",
+        data=lambda: export_json(snapshot),
+        file_name=f"{file_stem}.json",
+        mime="application/json",
+        use_container_width=True
+    )
+    
+    # Parquet download (columnar, for analytics)
+    st.sidebar.download_button(
+        label="📥 Download as Parquet",
+        data=lambda: export_parquet(snapshot),
+        file_name=f"{file_stem}.parquet",
+        mime="application/vnd.apache.parquet",
+        use_container_width=True
+    )
 
+@timed
 def render_clear_data():
     """Render clear all data option"""
     st.sidebar.markdown("---")
@@ -528,39 +773,94 @@ def render_clear_data():
     
     if st.sidebar.button("🗑️ Clear All Marks", use_container_width=True, type="secondary"):
         if st.sidebar.checkbox("I confirm I want to delete all data"):
-            st.session_state.semester_marks = {
-                "Year 1 - Part I": {},
-                "Year 1 - Part II": {},
-                "Year 2 - Part I": {},
-                "Year 2 - Part II": {}
-            }
+            program = current_program()
+            st.session_state.semester_marks = empty_semester_marks(program.index)
+            st.session_state.running_totals = build_running_totals(st.session_state.semester_marks, program.index)
+            store = get_marks_store()
+            if store is not None and st.session_state.student_id:
+                store.delete_student(st.session_state.student_id, program.id)
+            update_ranking()
             st.sidebar.success("✅ All marks cleared!")
             st.rerun()
 
 # ==================== MAIN APPLICATION ====================
 
+@timed
+def render_diagnostics():
+    """Render profiling panel: call counts and rolling p50/p95 per timer"""
+    rows, reruns = gpa_profiling.snapshot()
+    
+    memory = get_session_memory().stats()
+    
+    with st.sidebar.expander("🩺 Diagnostics", expanded=True):
+        st.markdown(f"**Reruns:** {reruns}")
+        st.markdown(
+            f"**Sessions:** {memory['sessions']} ({memory['spilled']} spilled) · "
+            f"**Memory:** {memory['resident_bytes'] / 2**20:.1f} / {memory['budget_bytes'] / 2**20:.0f} MB · "
+            f"**Spills / restores:** {memory['spills']} / {memory['restores']}"
+        )
+        if rows:
+            st.dataframe(
+                [
+                    {"Timer": r["name"], "Calls": r["calls"], "p50 ms": round(r["p50_ms"], 2), "p95 ms": round(r["p95_ms"], 2)}
+                    for r in rows
+                ],
+                hide_index=True,
+                use_container_width=True
+            )
+
+def _session_id():
+    """Streamlit session id, to tag profiling log lines"""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else None
+
 def main():
     """Main application entry point"""
     
+    # Profiling: GPA_PROFILE=1 for everyone, ?profile=1 for this session
+    profiling = gpa_profiling.env_enabled() or st.query_params.get("profile") == "1"
+    gpa_profiling.start_run(profiling, _session_id())
+    restore_session()
+    try:
+        render_page()
+    finally:
+        get_session_memory().end(st.session_state)
+        gpa_profiling.end_run()
+    
+    if profiling:
+        render_diagnostics()
+
+def render_page():
+    """Render every section of the page"""
+    
     # Render header
     render_header()
     
     # Render sidebar
+    render_program_selector()
     render_semester_selector()
+    render_student_selector()
+    render_entry_mode_selector()
     render_export_options()
     render_clear_data()
     
     # Render main content
-    render_marks_input()
+    if st.session_state.entry_mode == "Grid":
+        render_marks_grid()
+    else:
+        render_marks_input()
     render_semester_results()
     render_cumulative_gpa()
+    render_target_planner()
+    render_cgpa_projection()
     
     # Footer
     st.markdown("---")
     st.markdown(
-        """
+        f"""
         <div style='text-align: center; color: #666; font-size: 12px;'>
-        <p><strong>Civil Engineering - Bachelor Program</strong></p>
+        <p><strong>{current_program().name} - Bachelor Program</strong></p>
         <p>Theory (L+T) and Practical (P) are graded separately | Credits used for weighting | Grades assigned based on percentage</p>
         </div>
         """,
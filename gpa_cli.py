@@ -0,0 +1,147 @@
+"""
+GPA Calculator - Command Line
+Usage:
+    gpa grade marks.json [--json] [--program ID]
+    gpa stream marks.csv|marks.jsonl [-o results.csv] [--format csv|jsonl] [--workers N] [--chunk-size N] [--program ID]
+    gpa report marks.csv|marks.jsonl -o reports/ [--workers N] [--chunk-size N] [--program ID]
+    gpa import marks.json --db marks.db --student ID [--program ID]
+    gpa programs
+    gpa serve [--host 127.0.0.1] [--port 8000] [--workers N]
+The marks file uses the app's JSON export shape: {semester: {"CODE_TYPE": marks}}
+--program picks a curriculum from the program registry (default: civil)
+"""
+
+import argparse
+import json
+import sys
+
+from gpa_core import grade_results, validate_semester_marks
+from gpa_registry import DEFAULT_PROGRAM, get_program, list_programs, program_label
+from gpa_stream import INPUT_ENCODING, grade_stream
+
+
+def load_semester_marks(path, index=None):
+    """Load and validate a semester_marks JSON export"""
+    with open(path, encoding=INPUT_ENCODING) as f:
+        return validate_semester_marks(json.load(f), index)
+
+
+def print_results(results):
+    """Plain-text semester-wise breakdown"""
+    print(f"{'Semester':<20} {'GPA':>5} {'Credits':>8} {'Weighted Points':>16}")
+    for row in results["semesters"]:
+        print(f"{row['semester']:<20} {row['gpa']:>5.2f} {row['credits']:>8.1f} {row['weighted_points']:>16.2f}")
+    print(f"{'Cumulative':<20} {results['cgpa']:>5.2f} {results['credits']:>8.1f} {results['weighted_points']:>16.2f}")
+
+
+def cmd_grade(args):
+    index = get_program(args.program).index
+    results = grade_results(load_semester_marks(args.marks_file, index), index)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_results(results)
+
+
+def cmd_stream(args):
+    output_format = args.format
+    if output_format is None:
+        output_format = "jsonl" if args.output and args.output.endswith(".jsonl") else "csv"
+    count = grade_stream(args.input_file, args.output, output_format, args.workers, args.chunk_size, args.program)
+    print(f"graded {count} students", file=sys.stderr)
+
+
+def cmd_report(args):
+    from gpa_reports import REPORT_CHUNK_SIZE, generate_reports
+    from gpa_stream import read_records
+
+    index = get_program(args.program).index
+    with open(args.input_file, encoding=INPUT_ENCODING, newline="") as f:
+        count = generate_reports(
+            read_records(args.input_file, f, index), args.output,
+            args.workers, args.chunk_size or REPORT_CHUNK_SIZE, args.program,
+        )
+    print(f"wrote {count} grade sheets to {args.output}", file=sys.stderr)
+
+
+def cmd_import(args):
+    from gpa_store import MarksStore
+
+    store = MarksStore(args.db)
+    try:
+        index = get_program(args.program).index
+        count = store.import_json(args.student, load_semester_marks(args.marks_file, index), args.program)
+    finally:
+        store.close()
+    print(f"imported {count} marks for {args.student}", file=sys.stderr)
+
+
+def cmd_programs(args):
+    for program_id in list_programs():
+        print(f"{program_id:<16} {program_label(program_id)}")
+
+
+def cmd_serve(args):
+    from gpa_service import serve
+
+    serve(args.host, args.port, args.workers)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="gpa", description="Credit-weighted GPA calculator")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    grade = commands.add_parser("grade", help="compute GPA and CGPA from a JSON marks file")
+    grade.add_argument("marks_file", help="semester_marks JSON, as exported by the app")
+    grade.add_argument("--json", action="store_true", help="print results as JSON")
+    grade.add_argument("--program", default=DEFAULT_PROGRAM, help="program ID (default: %(default)s)")
+    grade.set_defaults(func=cmd_grade)
+
+    stream = commands.add_parser("stream", help="stream-grade a CSV/JSONL marks dump, one student at a time")
+    stream.add_argument("input_file", help="export-layout CSV (optional Student ID column), JSONL or JSON")
+    stream.add_argument("-o", "--output", help="results file (default: stdout)")
+    stream.add_argument("--format", choices=["csv", "jsonl"], help="results format (default: from -o extension, else csv)")
+    stream.add_argument("--workers", type=int, default=1, help="grading processes (0 = all CPUs, default: 1)")
+    stream.add_argument("--chunk-size", type=int, help="students per worker task (default: 500)")
+    stream.add_argument("--program", default=DEFAULT_PROGRAM, help="program ID (default: %(default)s)")
+    stream.set_defaults(func=cmd_stream)
+
+    report = commands.add_parser("report", help="write an HTML grade sheet for every student in a CSV/JSONL marks dump")
+    report.add_argument("input_file", help="export-layout CSV (optional Student ID column), JSONL or JSON")
+    report.add_argument("-o", "--output", required=True, help="output directory (one .html per student, plus index.csv)")
+    report.add_argument("--workers", type=int, default=1, help="rendering processes (0 = all CPUs, default: 1)")
+    report.add_argument("--chunk-size", type=int, help="students per worker task (default: 500)")
+    report.add_argument("--program", default=DEFAULT_PROGRAM, help="program ID (default: %(default)s)")
+    report.set_defaults(func=cmd_report)
+
+    load = commands.add_parser("import", help="import a JSON marks export into the SQLite marks store")
+    load.add_argument("marks_file", help="semester_marks JSON, as exported by the app")
+    load.add_argument("--db", required=True, help="SQLite database path (the app's GPA_DB_PATH)")
+    load.add_argument("--student", required=True, help="student ID to store the marks under")
+    load.add_argument("--program", default=DEFAULT_PROGRAM, help="program ID (default: %(default)s)")
+    load.set_defaults(func=cmd_import)
+
+    programs = commands.add_parser("programs", help="list the available programs")
+    programs.set_defaults(func=cmd_programs)
+
+    service = commands.add_parser("serve", help="run the HTTP grading service (needs uvicorn)")
+    service.add_argument("--host", default="127.0.0.1", help="bind address (default: %(default)s)")
+    service.add_argument("--port", type=int, default=8000, help="port (default: %(default)s)")
+    service.add_argument("--workers", type=int, help="batch grading processes (default: all CPUs)")
+    service.set_defaults(func=cmd_serve)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        args.func(args)
+    except (OSError, ValueError) as e:
+        parser.exit(2, f"gpa: error: {e}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+GPA Calculator - Compact Marks Rows
+One student's marks as a fixed-length array('f') indexed by component id
+(the Component.id of the compiled curriculum), NaN = not taken yet.
+
+A row costs 4 bytes per component with no per-student dicts, keys or
+boxed floats, and rows stack into the gpa_batch marks matrix straight
+from their raw bytes, with no per-mark Python objects.
+Converters map rows to and from the semester_marks dict / JSON shape
+used by the app, the exports and the marks store.
+
+float32 holds every 0.5-step mark exactly; other marks come back rounded
+to MARKS_DECIMALS, and rows are graded on those same rounded values.
+"""
+
+import math
+from array import array
+
+from gpa_core import (
+    CURRICULUM_INDEX, assign_grade, build_running_totals, calculate_percentage, scaled_weighted_point,
+)
+
+MARKS_TYPECODE = "f"
+MARKS_DECIMALS = 2
+
+# ==================== CONVERTERS ====================
+
+def empty_row(index=None):
+    """Row with every component not taken"""
+    return array(MARKS_TYPECODE, [math.nan]) * len((index or CURRICULUM_INDEX).components)
+
+
+def marks_row(all_semester_marks, index=None):
+    """Compact row from a semester_marks dict (unknown semesters or keys raise KeyError)"""
+    index = index or CURRICULUM_INDEX
+    row = empty_row(index)
+    for semester_name, marks_data in all_semester_marks.items():
+        by_key = index.semesters[semester_name].by_key
+        for key, marks in marks_data.items():
+            row[by_key[key].id] = marks
+    return row
+
+
+def semester_marks_from_row(row, index=None):
+    """semester_marks dict (every semester, taken components only) from a compact row"""
+    index = index or CURRICULUM_INDEX
+    all_semester_marks = {name: {} for name in index.semesters}
+    for component, marks in zip(index.components, row):
+        if marks == marks:
+            all_semester_marks[component.semester][component.key] = round(marks, MARKS_DECIMALS)
+    return all_semester_marks
+
+
+def row_from_bytes(data):
+    """Row from its raw bytes (row.tobytes()), e.g. a database blob"""
+    row = array(MARKS_TYPECODE)
+    row.frombytes(data)
+    return row
+
+
+def rows_matrix(rows, index=None):
+    """
+    students x components float matrix for gpa_batch.calculate_cohort_gpa, from compact rows.
+    Two copies: the rows' bytes joined once, then widened to float64 (rounded in place)
+    """
+    import numpy as np
+
+    n_components = len((index or CURRICULUM_INDEX).components)
+    matrix = np.frombuffer(b"".join(row.tobytes() for row in rows), dtype=np.float32).reshape(len(rows), n_components)
+    matrix = matrix.astype(float)
+    return np.round(matrix, MARKS_DECIMALS, out=matrix)
+
+# ==================== GRADING ====================
+
+def row_totals(row, index=None):
+    """Running totals (see build_running_totals) of a compact row, walked by component id with no key lookups"""
+    index = index or CURRICULUM_INDEX
+    totals = build_running_totals({}, index)
+    for component, marks in zip(index.components, row):
+        if marks != marks or component.credit <= 0:
+            continue
+        percentage = calculate_percentage(round(marks, MARKS_DECIMALS), component.full_marks)
+        _, grade_point = assign_grade(percentage, index)
+        weighted = scaled_weighted_point(grade_point, component.credit)
+
+        semester_totals = totals["semesters"][component.semester]
+        semester_totals["weighted"] += weighted
+        semester_totals["credits"] += component.credit
+        totals["weighted"] += weighted
+        totals["credits"] += component.credit
+    return totals
@@ -0,0 +1,357 @@
+"""
+GPA Calculator - Core Grading Logic
+Grade table, curriculum and GPA calculations with no UI dependency,
+shared by the Streamlit app, batch jobs and the gpa command line
+"""
+
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
+from types import MappingProxyType
+
+# ==================== GRADE TABLE (CONTINUOUS BANDS) ====================
+GRADE_TABLE = [
+    {"min": 80, "grade": "A", "point": 4.0},
+    {"min": 75, "grade": "A−", "point": 3.7},
+    {"min": 70, "grade": "B+", "point": 3.3},
+    {"min": 65, "grade": "B", "point": 3.0},
+    {"min": 60, "grade": "B−", "point": 2.7},
+    {"min": 55, "grade": "C+", "point": 2.3},
+    {"min": 50, "grade": "C", "point": 2.0},
+    {"min": 0, "grade": "F", "point": 0.0}
+]
+
+# compile_curriculum turns this into bisect bands: each covers [min, next band's min),
+# so fractional percentages (e.g. 79.5%) no longer fall between integer bands.
+# NaN and percentages below the lowest band grade as FALLBACK_GRADE, in the scalar
+# and array paths alike.
+FALLBACK_GRADE = ("F", 0.0)
+
+# ==================== CIVIL ENGINEERING CURRICULUM ====================
+CIVIL_ENGINEERING_CURRICULUM = {
+    "Year 1 - Part I": [
+        {"code": "SH 101", "name": "Engineering Mathematics I", "type": "L+T", "credit": 3, "full_marks": 100},
+        {"code": "SH 101", "name": "Engineering Mathematics I", "type": "P", "credit": 0, "full_marks": 25},
+        {"code": "SH 103", "name": "Engineering Chemistry", "type": "L+T", "credit": 3, "full_marks": 100},
+        {"code": "SH 103", "name": "Engineering Chemistry", "type": "P", "credit": 0, "full_marks": 25},
+        {"code": "CT 101", "name": "Computer Programming", "type": "L+T", "credit": 3, "full_marks": 100},
+        {"code": "CT 101", "name": "Computer Programming", "type": "P", "credit": 0, "full_marks": 50},
+        {"code": "EE 103", "name": "Basic Electrical and Electronics Engineering", "type": "L+T", "credit": 3, "full_marks": 100},
+        {"code": "EE 103", "name": "Basic Electrical and Electronics Engineering", "type": "P", "credit": 0, "full_marks": 25},
+        {"code": "CE 101", "name": "Engineering Mechanics", "type": "L+T", "credit": 4, "full_marks": 100},
+        {"code": "CE 102", "name": "Engineering Geology I", "type": "L+T", "credit": 2, "full_marks": 75},
+        {"code": "CE 102", "name": "Engineering Geology I", "type": "P", "credit": 0, "full_marks": 25},
+        {"code": "CE 103", "name": "Civil Engineering Materials", "type": "L+T", "credit": 2, "full_marks": 50},
+        {"code": "CE 103", "name": "Civil Engineering Materials", "type": "P", "credit": 0, "full_marks": 25},
+    ],
+    "Year 1 - Part II": [
+        {"code": "SH 151", "name": "Engineering Mathematics II", "type": "L+T", "credit": 3, "full_marks": 100},
+        {"code": "SH 152", "name": "Engineering Physics", "type": "L+T", "credit": 4, "full_marks": 100},
+        {"code": "SH 152", "name": "Engineering Physics", "type": "P", "credit": 0, "full_marks": 25},
+        {"code": "ME 158", "name": "Engineering Drawing", "type": "L+T", "credit": 2, "full_marks": 50},
+        {"code": "ME 158", "name": "Engineering Drawing", "type": "P", "credit": 0, "full_marks": 50},
+        {"code": "CE 151", "name": "Strength of Materials", "type": "L+T", "credit": 3, "full_marks": 100},
+        {"code": "CE 151", "name": "Strength of Materials", "type": "P", "credit": 0, "full_marks": 25},
+        {"code": "CE 152", "name": "Engineering Geology II", "type": "L+T", "credit": 2, "full_marks": 50},
+        {"code": "CE 152", "name": "Engineering Geology II", "type": "P", "credit": 0, "full_marks": 25},
+        {"code": "CE 153", "name": "Engineering Survey I", "type": "L+T", "credit": 3, "full_marks": 100},
+        {"code": "CE 153", "name": "Engineering Survey I", "type": "P", "credit": 0, "full_marks": 50},
+    ],
+    "Year 2 - Part I": [
+        {"code": "SH 201", "name": "Engineering Mathematics III", "type": "L+T", "credit": 3, "full_marks": 100},
+        {"code": "SH 202", "name": "Numerical Methods", "type": "L+T", "credit": 3, "full_marks": 100},
+        {"code": "SH 202", "name": "Numerical Methods", "type": "P", "credit": 0, "full_marks": 50},
+        {"code": "CE 201", "name": "Fluid Mechanics", "type": "L+T", "credit": 4, "full_marks": 100},
+        {"code": "CE 201", "name": "Fluid Mechanics", "type": "P", "credit": 0, "full_marks": 25},
+        {"code": "CE 202", "name": "Theory of Structures I", "type": "L+T", "credit": 3, "full_marks": 100},
+        {"code": "CE 202", "name": "Theory of Structures I", "type": "P", "credit": 0, "full_marks": 25},
+        {"code": "CE 203", "name": "Engineering Survey II", "type": "L+T", "credit": 3, "full_marks": 100},
+        {"code": "CE 203", "name": "Engineering Survey II", "type": "P", "credit": 0, "full_marks": 50},
+        {"code": "CE 204", "name": "Computer Aided Civil Drawing", "type": "L+T", "credit": 2, "full_marks": 50},
+        {"code": "CE 204", "name": "Computer Aided Civil Drawing", "type": "P", "credit": 0, "full_marks": 50},
+        {"code": "CE 205", "name": "Concrete Technology", "type": "L+T", "credit": 2, "full_marks": 50},
+        {"code": "CE 205", "name": "Concrete Technology", "type": "P", "credit": 0, "full_marks": 25},
+    ],
+    "Year 2 - Part II": [
+        {"code": "SH 251", "name": "Communication English", "type": "L+T", "credit": 3, "full_marks": 100},
+        {"code": "SH 251", "name": "Communication English", "type": "P", "credit": 0, "full_marks": 25},
+        {"code": "SH 252", "name": "Probability and Statistics", "type": "L+T", "credit": 3, "full_marks": 100},
+        {"code": "CE 251", "name": "Hydraulics", "type": "L+T", "credit": 4, "full_marks": 100},
+        {"code": "CE 251", "name": "Hydraulics", "type": "P", "credit": 0, "full_marks": 25},
+        {"code": "CE 252", "name": "Theory of Structures II", "type": "L+T", "credit": 4, "full_marks": 100},
+        {"code": "CE 252", "name": "Theory of Structures II", "type": "P", "credit": 0, "full_marks": 25},
+        {"code": "CE 253", "name": "Soil Mechanics", "type": "L+T", "credit": 4, "full_marks": 100},
+        {"code": "CE 253", "name": "Soil Mechanics", "type": "P", "credit": 0, "full_marks": 25},
+        {"code": "CE 254", "name": "Water Supply Engineering", "type": "L+T", "credit": 3, "full_marks": 100},
+        {"code": "CE 254", "name": "Water Supply Engineering", "type": "P", "credit": 0, "full_marks": 25},
+        {"code": "CE 255", "name": "Building Technology", "type": "L+T", "credit": 2, "full_marks": 50},
+        {"code": "CE 256", "name": "Survey Camp", "type": "P", "credit": 2, "full_marks": 100},
+    ]
+}
+
+# ==================== COMPILED CURRICULUM INDEX ====================
+# Built once at import; calc and render functions read from it instead of
+# rescanning the nested curriculum dicts on every rerun
+
+Component = namedtuple("Component", ["id", "semester", "key", "code", "name", "type", "credit", "full_marks"])
+
+SemesterIndex = namedtuple("SemesterIndex", [
+    "name",
+    "components",     # all components, curriculum order
+    "graded",         # credit-bearing components only (count towards GPA)
+    "by_key",         # "CODE_TYPE" -> Component
+    "by_code",        # course code -> tuple of its components
+    "total_credits",  # sum of credits of graded components
+    "credits",        # contiguous credit array, aligned with components
+    "full_marks",     # contiguous full-marks array, aligned with components
+])
+
+CurriculumIndex = namedtuple("CurriculumIndex", [
+    "semesters",      # semester name -> SemesterIndex
+    "components",     # every component across all semesters, id order
+    "total_credits",
+    "credits",
+    "full_marks",
+    "grade_table",    # grade table rows, as given
+    "band_mins",      # ascending band minimums, for bisect
+    "band_results",   # (grade, point) aligned with band_mins
+])
+
+
+def _frozen_array(values):
+    """Contiguous read-only float array"""
+    return memoryview(array("d", values)).toreadonly()
+
+
+def compile_curriculum(curriculum, grade_table=GRADE_TABLE):
+    """Compile a {semester: [subject dicts]} curriculum and its grade table into an immutable CurriculumIndex"""
+    semesters = {}
+    all_components = []
+
+    for semester_name, subjects in curriculum.items():
+        components = tuple(
+            Component(
+                id=len(all_components) + i,
+                semester=semester_name,
+                key=f"{subject['code']}_{subject['type']}",
+                code=subject["code"],
+                name=subject["name"],
+                type=subject["type"],
+                credit=subject["credit"],
+                full_marks=subject["full_marks"],
+            )
+            for i, subject in enumerate(subjects)
+        )
+        all_components.extend(components)
+
+        by_code = {}
+        for component in components:
+            by_code.setdefault(component.code, []).append(component)
+
+        graded = tuple(c for c in components if c.credit > 0)
+        semesters[semester_name] = SemesterIndex(
+            name=semester_name,
+            components=components,
+            graded=graded,
+            by_key=MappingProxyType({c.key: c for c in components}),
+            by_code=MappingProxyType({code: tuple(group) for code, group in by_code.items()}),
+            total_credits=sum(c.credit for c in graded),
+            credits=_frozen_array(c.credit for c in components),
+            full_marks=_frozen_array(c.full_marks for c in components),
+        )
+
+    bands = sorted(grade_table, key=lambda row: row["min"])
+    return CurriculumIndex(
+        semesters=MappingProxyType(semesters),
+        components=tuple(all_components),
+        total_credits=sum(s.total_credits for s in semesters.values()),
+        credits=_frozen_array(c.credit for c in all_components),
+        full_marks=_frozen_array(c.full_marks for c in all_components),
+        grade_table=tuple(MappingProxyType(dict(row)) for row in grade_table),
+        band_mins=tuple(row["min"] for row in bands),
+        band_results=tuple((row["grade"], row["point"]) for row in bands),
+    )
+
+
+CURRICULUM_INDEX = compile_curriculum(CIVIL_ENGINEERING_CURRICULUM)
+
+# ==================== CORE CALCULATION LOGIC ====================
+# Weighted points are summed as integers in hundredths of a grade point, so
+# totals are exact and GPA rounding never depends on float summation order.
+# Functions taking index= grade against that compiled program (see
+# gpa_registry); None means the built-in Civil Engineering program.
+
+POINT_SCALE = 100
+
+
+def calculate_percentage(marks_obtained, full_marks):
+    """Calculate percentage correctly"""
+    return (marks_obtained / full_marks) * 100
+
+
+def assign_grade(percentage, index=None):
+    """Assign grade and grade point based on fixed bands (continuous, no gaps)"""
+    # NaN compares false everywhere, so bisect would put it in the top band
+    if percentage != percentage:
+        return FALLBACK_GRADE
+    band = bisect_right((index or CURRICULUM_INDEX).band_mins, percentage) - 1
+    if band < 0:
+        return FALLBACK_GRADE
+    return (index or CURRICULUM_INDEX).band_results[band]
+
+
+def calculate_weighted_point(grade_point, credit):
+    """Grade point weighted by component credit"""
+    return grade_point * credit
+
+
+def scaled_weighted_point(grade_point, credit):
+    """calculate_weighted_point in exact 1/POINT_SCALE units, so totals are summed without float drift"""
+    return round(grade_point * POINT_SCALE) * credit
+
+
+def _gpa_result(scaled_weighted_points, total_credits):
+    """(gpa, weighted points, credits) from exact scaled totals"""
+    if total_credits == 0:
+        return 0.0, 0.0, 0.0
+
+    total_weighted_points = scaled_weighted_points / POINT_SCALE
+    gpa = total_weighted_points / total_credits
+    return round(gpa, 2), total_weighted_points, float(total_credits)
+
+
+def calculate_semester_gpa(marks_data, semester_name, index=None):
+    """
+    Correct GPA calculation:
+    - Theory and Practical counted separately
+    - Zero marks treated as valid (F grade)
+    - All credits included
+    """
+    total_weighted_points = 0
+    total_credits = 0
+
+    # Only graded components: zero-credit (non-GPA) components are skipped
+    for component in (index or CURRICULUM_INDEX).semesters[semester_name].graded:
+        credit = component.credit
+
+        # If marks not entered, skip (exam not taken yet)
+        if component.key not in marks_data:
+            continue
+
+        marks = marks_data[component.key]
+
+        # Zero marks are VALID
+        percentage = calculate_percentage(marks, component.full_marks)
+        grade, grade_point = assign_grade(percentage, index)
+
+        weighted_point = scaled_weighted_point(grade_point, credit)
+
+        total_weighted_points += weighted_point
+        total_credits += credit
+
+    return _gpa_result(total_weighted_points, total_credits)
+
+
+def calculate_cumulative_gpa(all_semester_marks, index=None):
+    """Correct cumulative GPA across semesters"""
+    total_weighted_points = 0
+    total_credits = 0
+
+    for semester_name, marks_data in all_semester_marks.items():
+        for component in (index or CURRICULUM_INDEX).semesters[semester_name].graded:
+            if component.key not in marks_data:
+                continue
+
+            marks = marks_data[component.key]
+            percentage = calculate_percentage(marks, component.full_marks)
+            _, grade_point = assign_grade(percentage, index)
+
+            total_weighted_points += scaled_weighted_point(grade_point, component.credit)
+            total_credits += component.credit
+
+    return _gpa_result(total_weighted_points, total_credits)
+
+# ==================== RUNNING TOTALS ====================
+# Incrementally maintained per-semester and overall totals, so a single
+# mark change costs one component regrade instead of a full recompute.
+# Totals use the same exact scaled integers as the calc functions, so
+# applying and reverting deltas never drifts from a full recompute.
+
+def _component_contribution(component, marks, index):
+    """(scaled weighted points, credits) a component adds to the totals"""
+    if marks is None or component.credit <= 0:
+        return 0, 0
+
+    percentage = calculate_percentage(marks, component.full_marks)
+    _, grade_point = assign_grade(percentage, index)
+    return scaled_weighted_point(grade_point, component.credit), component.credit
+
+
+def build_running_totals(all_semester_marks, index=None):
+    """Full recompute of the running totals from semester_marks"""
+    totals = {
+        "semesters": {name: {"weighted": 0, "credits": 0} for name in (index or CURRICULUM_INDEX).semesters},
+        "weighted": 0,
+        "credits": 0,
+    }
+
+    for semester_name, marks_data in all_semester_marks.items():
+        for key, marks in marks_data.items():
+            apply_mark_change(totals, semester_name, key, None, marks, index)
+
+    return totals
+
+
+def apply_mark_change(totals, semester_name, key, old_marks, new_marks, index=None):
+    """Apply the delta of one component's marks changing (None = not taken)"""
+    component = (index or CURRICULUM_INDEX).semesters[semester_name].by_key[key]
+    old_weighted, old_credits = _component_contribution(component, old_marks, index)
+    new_weighted, new_credits = _component_contribution(component, new_marks, index)
+
+    semester_totals = totals["semesters"][semester_name]
+    semester_totals["weighted"] += new_weighted - old_weighted
+    semester_totals["credits"] += new_credits - old_credits
+    totals["weighted"] += new_weighted - old_weighted
+    totals["credits"] += new_credits - old_credits
+
+
+def totals_gpa(totals):
+    """(gpa, weighted points, credits) from a running totals entry, like calculate_semester_gpa"""
+    return _gpa_result(totals["weighted"], totals["credits"])
+
+# ==================== VALIDATION & RESULTS ====================
+# Shared by the command line, the grading service, reports and the stream grader
+
+def validate_semester_marks(semester_marks, index=None):
+    """Check a semester_marks object against a curriculum; raises ValueError"""
+    index = index or CURRICULUM_INDEX
+    if not isinstance(semester_marks, dict):
+        raise ValueError("expected a JSON object of {semester: {component: marks}}")
+
+    for semester_name, marks_data in semester_marks.items():
+        if semester_name not in index.semesters:
+            raise ValueError(f"unknown semester: {semester_name!r}")
+        if not isinstance(marks_data, dict):
+            raise ValueError(f"expected an object of {{component: marks}} for {semester_name}")
+        by_key = index.semesters[semester_name].by_key
+        for key, marks in marks_data.items():
+            if key not in by_key:
+                raise ValueError(f"unknown component in {semester_name}: {key!r}")
+            if isinstance(marks, bool) or not isinstance(marks, (int, float)) or not 0 <= marks <= by_key[key].full_marks:
+                raise ValueError(f"invalid marks for {key} in {semester_name}: {marks!r}")
+
+    return semester_marks
+
+
+def grade_results(semester_marks, index=None):
+    """Semester-wise and cumulative results for one student"""
+    semesters = []
+    for semester_name in (index or CURRICULUM_INDEX).semesters:
+        marks_data = semester_marks.get(semester_name, {})
+        if not marks_data:
+            continue
+        gpa, weighted, credits = calculate_semester_gpa(marks_data, semester_name, index)
+        semesters.append({"semester": semester_name, "gpa": gpa, "credits": credits, "weighted_points": weighted})
+
+    cgpa, weighted, credits = calculate_cumulative_gpa(semester_marks, index)
+    return {"semesters": semesters, "cgpa": cgpa, "credits": credits, "weighted_points": weighted}
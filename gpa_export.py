@@ -0,0 +1,94 @@
+"""
+GPA Calculator - Export Payloads
+Builds the CSV / JSON / Parquet downloads from semester_marks.
+Payloads are memoized on the marks content, so an unchanged transcript
+is never regraded or reserialized.
+"""
+
+import csv
+import io
+import json
+from functools import lru_cache
+
+from gpa_core import assign_grade, calculate_percentage
+from gpa_registry import DEFAULT_PROGRAM, get_program
+
+EXPORT_COLUMNS = [
+    "Semester", "Course Code", "Subject", "Component", "Credit",
+    "Full Marks", "Marks Obtained", "Percentage", "Grade", "Grade Point",
+]
+
+
+def freeze_marks(all_semester_marks, program=DEFAULT_PROGRAM):
+    """Hashable (program, semester_marks) snapshot (order preserved), used as the memo key"""
+    return program, tuple(
+        (semester_name, tuple(marks_data.items()))
+        for semester_name, marks_data in all_semester_marks.items()
+    )
+
+
+def _thaw(frozen_marks):
+    return {semester_name: dict(items) for semester_name, items in frozen_marks[1]}
+
+
+@lru_cache(maxsize=64)
+def export_rows(frozen_marks):
+    """Graded export rows (one per component with marks) in curriculum order"""
+    program, semesters = frozen_marks
+    index = get_program(program).index
+    rows = []
+    for semester_name, items in semesters:
+        marks_data = dict(items)
+        for component in index.semesters[semester_name].components:
+            marks = marks_data.get(component.key, None)
+
+            if marks is not None and marks > 0:
+                percentage = calculate_percentage(marks, component.full_marks)
+                grade, grade_point = assign_grade(percentage, index)
+
+                rows.append((
+                    semester_name, component.code, component.name, component.type, component.credit,
+                    component.full_marks, marks, f"{percentage:.2f}", grade, grade_point,
+                ))
+    return tuple(rows)
+
+
+@lru_cache(maxsize=64)
+def export_csv(frozen_marks):
+    """CSV download, same layout as the original DataFrame export"""
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(EXPORT_COLUMNS)
+    writer.writerows(export_rows(frozen_marks))
+    return out.getvalue()
+
+
+@lru_cache(maxsize=64)
+def export_json(frozen_marks):
+    """semester_marks JSON download"""
+    return json.dumps(_thaw(frozen_marks), indent=2)
+
+
+@lru_cache(maxsize=64)
+def export_parquet(frozen_marks):
+    """Columnar Parquet download for analytics (Percentage stored as a number)"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    columns = list(zip(*export_rows(frozen_marks))) or [()] * len(EXPORT_COLUMNS)
+    table = pa.table({
+        "Semester": pa.array(columns[0], pa.string()),
+        "Course Code": pa.array(columns[1], pa.string()),
+        "Subject": pa.array(columns[2], pa.string()),
+        "Component": pa.array(columns[3], pa.string()),
+        "Credit": pa.array(columns[4], pa.int32()),
+        "Full Marks": pa.array(columns[5], pa.int32()),
+        "Marks Obtained": pa.array(columns[6], pa.float64()),
+        "Percentage": pa.array([float(p) for p in columns[7]], pa.float64()),
+        "Grade": pa.array(columns[8], pa.string()),
+        "Grade Point": pa.array(columns[9], pa.float64()),
+    })
+
+    out = io.BytesIO()
+    pq.write_table(table, out)
+    return out.getvalue()
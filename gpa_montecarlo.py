@@ -0,0 +1,141 @@
+"""
+GPA Calculator - Monte Carlo CGPA Projection
+Distribution of the final CGPA when every component not taken yet is
+drawn from a marks distribution, graded through the grade bands and
+credit-weighted like calculate_cumulative_gpa.
+
+Each simulation is a row of a simulations x components array, so the
+whole run is a handful of NumPy operations per grade band, with no
+per-simulation loop.
+"""
+
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from gpa_core import CURRICULUM_INDEX, POINT_SCALE, calculate_percentage, scaled_weighted_point
+from gpa_target import MARKS_STEP, band_options, remaining_components
+
+DEFAULT_SIMULATIONS = 100_000
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Used when there are too few marks to fit a distribution
+DEFAULT_MEAN = 65.0
+DEFAULT_STD = 10.0
+
+# ==================== MARKS DISTRIBUTION ====================
+
+def fit_history(all_semester_marks, index=None):
+    """(mean, std) percentage over the graded components with marks, or the defaults below two marks"""
+    index = index or CURRICULUM_INDEX
+    percentages = [
+        calculate_percentage(marks_data[component.key], component.full_marks)
+        for semester_name, marks_data in all_semester_marks.items()
+        for component in index.semesters[semester_name].graded
+        if component.key in marks_data
+    ]
+    if len(percentages) < 2:
+        return DEFAULT_MEAN, DEFAULT_STD
+    return float(np.mean(percentages)), float(np.std(percentages, ddof=1))
+
+# ==================== SIMULATION ====================
+
+def band_probabilities(components, mean, std, index=None):
+    """
+    P(component lands in band b or above), per remaining component and band, plus
+    the scaled weighted points each band adds over the one below it.
+    Marks are Normal(mean, std) percentages, clipped to 0-100 and rounded to the
+    marks input step, so band b is reached from (its least marks - half a step).
+    """
+    index = index or CURRICULUM_INDEX
+    options = [band_options(component, index, allow_fail=True) for component in components]
+    n_bands = max(len(component_options) for component_options in options)
+    above = np.zeros((len(components), n_bands), dtype=np.float32)
+    increments = np.zeros((len(components), n_bands), dtype=np.float32)
+
+    for j, (component, component_options) in enumerate(zip(components, options)):
+        previous = 0
+        for b, (marks, _, grade_point) in enumerate(component_options):
+            bound = (marks - MARKS_STEP / 2) * 100 / component.full_marks
+            if marks == 0:
+                above[j, b] = 1.0
+            elif std > 0:
+                above[j, b] = 0.5 * math.erfc((bound - mean) / (std * math.sqrt(2)))
+            else:
+                above[j, b] = float(mean >= bound)
+            weighted = scaled_weighted_point(grade_point, component.credit)
+            increments[j, b] = weighted - previous
+            previous = weighted
+
+    return above, increments
+
+
+def simulate_cgpa(totals, all_semester_marks, mean, std, index=None, n_simulations=DEFAULT_SIMULATIONS, seed=0):
+    """
+    Final CGPA of n_simulations draws, as exact scaled weighted points and credits.
+    Each remaining component's band is drawn from one uniform against its band
+    probabilities (inverse CDF), the same distribution as drawing marks and
+    grading them, at one comparison per band instead of a band lookup per mark.
+    Returns (scaled weighted points per simulation, final credits).
+    """
+    index = index or CURRICULUM_INDEX
+    components = remaining_components(all_semester_marks, index)
+    final_credits = totals["credits"] + sum(component.credit for component in components)
+    if not components:
+        return np.full(n_simulations, totals["weighted"], dtype=np.int64), final_credits
+
+    above, increments = band_probabilities(components, mean, std, index)
+    uniforms = np.random.default_rng(seed).random((n_simulations, len(components)), dtype=np.float32)
+
+    # Sum of band increments reached; float32 sums of these integers stay exact
+    weighted = np.zeros(n_simulations, dtype=np.float32)
+    for b in range(above.shape[1]):
+        weighted += (uniforms < above[:, b]).astype(np.float32) @ increments[:, b]
+    return totals["weighted"] + np.rint(weighted).astype(np.int64), final_credits
+
+
+# ==================== SUMMARY ====================
+
+# Distinct final scaled weighted points and how many simulations ended on each:
+# exact like the raw array, at a few KB instead of 8 bytes per simulation
+ProjectionCounts = namedtuple("ProjectionCounts", ["values", "counts", "final_credits"])
+
+
+def count_outcomes(weighted, final_credits):
+    """Compact a simulate_cgpa result into ProjectionCounts (this is what sessions cache)"""
+    lowest = int(weighted.min())
+    counts = np.bincount(weighted - lowest)
+    offsets = np.flatnonzero(counts)
+    return ProjectionCounts(offsets + lowest, counts[offsets], final_credits)
+
+
+def _percentile(cgpa_of, values, cumulative, q):
+    """
+    np.percentile (linear interpolation) over the CGPA of every simulation, from
+    sorted distinct values and their cumulative counts, step for step so it rounds the same
+    """
+    position = q / 100 * (int(cumulative[-1]) - 1)
+    below = math.floor(position)
+    neighbours = np.searchsorted(cumulative, [below, below + 1], side="right").clip(max=len(values) - 1)
+    low, high = cgpa_of(values[neighbours])
+    t = position - below
+    return high - (high - low) * (1 - t) if t >= 0.5 else low + (high - low) * t
+
+
+def projection_summary(outcomes, threshold):
+    """Percentiles of the final CGPA and the probability of ending at or above threshold, from ProjectionCounts"""
+    values, counts, final_credits = outcomes
+
+    def cgpa_of(weighted):
+        return weighted / POINT_SCALE / final_credits if final_credits else np.zeros(len(weighted))
+
+    cumulative = np.cumsum(counts)
+    n = int(cumulative[-1])
+    return {
+        "percentiles": {q: float(np.round(_percentile(cgpa_of, values, cumulative, q), 2)) for q in PERCENTILES},
+        # Summed as exact integers
+        "mean": round(int(values @ counts) / n / POINT_SCALE / final_credits, 2) if final_credits else 0.0,
+        # Exact, in scaled units, like the target solver
+        "p_above": int(counts[values >= round(threshold * POINT_SCALE) * final_credits].sum()) / n,
+    }
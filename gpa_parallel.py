@@ -0,0 +1,66 @@
+"""
+GPA Calculator - Parallel Cohort Grading
+Shards students into chunks and grades them across a process pool.
+
+Only the students' marks and a program id travel to workers. Each worker
+resolves the program's compiled curriculum index once, in its initializer
+(from the registry's process cache when the pool forks, else from the
+on-disk snapshot), never per task.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from gpa_registry import DEFAULT_PROGRAM, get_program
+from gpa_stream import grade_record
+
+DEFAULT_CHUNK_SIZE = 500
+
+_worker_index = None
+
+
+def _init_worker(program):
+    """Resolve the program's compiled curriculum once per worker, before the first task"""
+    global _worker_index
+    _worker_index = get_program(program).index
+
+
+def _grade_chunk(chunk):
+    """Grade one chunk of (student_id, semester_marks) records in a worker"""
+    return [grade_record(student_id, semester_marks, _worker_index) for student_id, semester_marks in chunk]
+
+
+def chunked(records, chunk_size):
+    """Lists of up to chunk_size records, read lazily"""
+    records = iter(records)
+    while chunk := list(islice(records, chunk_size)):
+        yield chunk
+
+
+def map_in_order(pool, fn, chunks, workers):
+    """
+    Yield fn(chunk) from pool for every chunk, in input order.
+    At most two chunks per worker are in flight, so a streamed input is
+    never read far ahead of the pool.
+    """
+    pending = deque()
+    for chunk in chunks:
+        pending.append(pool.submit(fn, chunk))
+        if len(pending) >= workers * 2:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def grade_parallel(records, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, program=DEFAULT_PROGRAM):
+    """
+    Yield grade_record results for (student_id, semester_marks) records, in input order.
+    workers defaults to the CPU count; see map_in_order for read-ahead.
+    """
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(program,)) as pool:
+        for results in map_in_order(pool, _grade_chunk, chunked(records, chunk_size), workers):
+            yield from results
@@ -0,0 +1,131 @@
+"""
+GPA Calculator - Opt-in Profiling
+Times render functions and calc calls, counts reruns and calls, keeps
+rolling p50/p95 per timer and emits one JSON log line per timing.
+
+Enabled per rerun: the GPA_PROFILE=1 environment variable turns it on for
+every session, the ?profile=1 query parameter for a single session.
+Log lines go to stderr, or to the file named by GPA_PROFILE_LOG.
+When disabled, a timed function costs one context-variable lookup.
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+
+WINDOW = 200  # rolling window of timings kept per name
+
+_run = ContextVar("gpa_profile_run", default=None)
+_lock = threading.Lock()
+_timings = {}   # name -> deque of recent durations (seconds)
+_calls = {}     # name -> total call count
+_reruns = 0
+
+logger = logging.getLogger("gpa.profile")
+
+
+def env_enabled():
+    """Profiling forced on for every session by the environment"""
+    return os.environ.get("GPA_PROFILE", "").lower() in ("1", "true", "yes")
+
+
+def _setup_logger():
+    if logger.handlers:
+        return
+    log_path = os.environ.get("GPA_PROFILE_LOG")
+    handler = logging.FileHandler(log_path, encoding="utf-8") if log_path else logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+# ==================== RECORDING ====================
+
+def record(name, seconds):
+    """Add one timing to the rolling stats and the JSON log"""
+    with _lock:
+        _timings.setdefault(name, deque(maxlen=WINDOW)).append(seconds)
+        _calls[name] = _calls.get(name, 0) + 1
+
+    run = _run.get()
+    logger.info(json.dumps({
+        "event": "timing",
+        "name": name,
+        "ms": round(seconds * 1000, 3),
+        "session": run["session"] if run else None,
+        "ts": round(time.time(), 3),
+    }))
+
+
+def start_run(enabled, session=None):
+    """Mark the start of a rerun; everything timed until end_run belongs to it"""
+    if not enabled:
+        _run.set(None)
+        return
+    _setup_logger()
+    _run.set({"session": session, "start": time.perf_counter()})
+
+
+def end_run():
+    """Record the whole rerun's duration"""
+    global _reruns
+    run = _run.get()
+    if run is None:
+        return
+    with _lock:
+        _reruns += 1
+    record("rerun", time.perf_counter() - run["start"])
+
+
+def is_enabled():
+    return _run.get() is not None
+
+
+def timed(func=None, *, name=None):
+    """Decorator timing each call while profiling is enabled for the current run"""
+    if func is None:
+        return functools.partial(timed, name=name)
+    label = name or func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _run.get() is None:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record(label, time.perf_counter() - start)
+
+    return wrapper
+
+# ==================== STATS ====================
+
+def _percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def snapshot():
+    """[{name, calls, p50_ms, p95_ms}] plus the rerun count, for the diagnostics panel"""
+    with _lock:
+        timings = {name: sorted(values) for name, values in _timings.items()}
+        calls = dict(_calls)
+        reruns = _reruns
+
+    rows = [
+        {
+            "name": name,
+            "calls": calls[name],
+            "p50_ms": _percentile(values, 0.50) * 1000,
+            "p95_ms": _percentile(values, 0.95) * 1000,
+        }
+        for name, values in sorted(timings.items())
+    ]
+    return rows, reruns
@@ -0,0 +1,129 @@
+"""
+GPA Calculator - Cohort Ranking Index
+Class rank, percentile and top-k over a cohort's CGPAs, kept up to date as
+students' marks change.
+
+CGPAs are reported to 2 decimals, so a cohort fits in a fixed set of
+buckets (one per 0.01 of CGPA). A Fenwick tree of bucket counts moves a
+student between buckets in O(log buckets) and answers "how many students
+are below this CGPA" in O(log buckets), however large the cohort is.
+Nothing is ever re-sorted.
+"""
+
+import heapq
+import threading
+import weakref
+
+from gpa_core import CURRICULUM_INDEX, POINT_SCALE, totals_gpa
+
+
+class RankingIndex:
+    """Order-statistics index of student CGPAs, safe to share across sessions"""
+
+    def __init__(self, max_cgpa=None):
+        if max_cgpa is None:
+            max_cgpa = max(point for _, point in CURRICULUM_INDEX.band_results)
+        self.n_buckets = round(max_cgpa * POINT_SCALE) + 1
+
+        self._lock = threading.Lock()
+        self._tree = [0] * (self.n_buckets + 1)  # Fenwick tree of bucket counts, 1-based
+        self._bucket_of = {}                     # student id -> bucket
+        self._members = {}                       # bucket -> set of student ids
+
+    # ==================== FENWICK TREE ====================
+
+    def _add(self, bucket, delta):
+        i = bucket + 1
+        while i <= self.n_buckets:
+            self._tree[i] += delta
+            i += i & -i
+
+    def _count_upto(self, bucket):
+        """Students in buckets 0..bucket"""
+        i, count = min(bucket, self.n_buckets - 1) + 1, 0
+        while i > 0:
+            count += self._tree[i]
+            i -= i & -i
+        return count
+
+    # ==================== UPDATES ====================
+
+    def update(self, student_id, cgpa):
+        """Set a student's CGPA (None removes the student); O(log buckets)"""
+        bucket = None if cgpa is None else min(max(round(cgpa * POINT_SCALE), 0), self.n_buckets - 1)
+        with self._lock:
+            old = self._bucket_of.get(student_id)
+            if old == bucket:
+                return
+            if old is not None:
+                self._add(old, -1)
+                self._members[old].discard(student_id)
+                del self._bucket_of[student_id]
+            if bucket is not None:
+                self._add(bucket, 1)
+                self._members.setdefault(bucket, set()).add(student_id)
+                self._bucket_of[student_id] = bucket
+
+    def update_totals(self, student_id, totals):
+        """Set a student's CGPA from running totals; students with no graded credits are not ranked"""
+        cgpa, _, credits = totals_gpa(totals)
+        self.update(student_id, cgpa if credits > 0 else None)
+
+    def remove(self, student_id):
+        self.update(student_id, None)
+
+    # ==================== QUERIES ====================
+
+    def __len__(self):
+        return len(self._bucket_of)
+
+    def rank(self, student_id):
+        """(rank, cohort size): 1 = highest CGPA, ties share a rank; None if not ranked"""
+        with self._lock:
+            bucket = self._bucket_of.get(student_id)
+            if bucket is None:
+                return None
+            total = len(self._bucket_of)
+            return total - self._count_upto(bucket) + 1, total
+
+    def percentile(self, student_id):
+        """Percent of the cohort with a strictly lower CGPA; None if not ranked"""
+        with self._lock:
+            bucket = self._bucket_of.get(student_id)
+            if bucket is None:
+                return None
+            below = self._count_upto(bucket - 1) if bucket > 0 else 0
+            return 100.0 * below / len(self._bucket_of)
+
+    def top(self, k):
+        """[(student_id, cgpa)] of the k highest CGPAs, walking buckets down from the top (touches only those buckets)"""
+        results = []
+        with self._lock:
+            bucket = self.n_buckets - 1
+            remaining = len(self._bucket_of)
+            while len(results) < k and remaining > 0:
+                members = self._members.get(bucket)
+                if members:
+                    cgpa = bucket / POINT_SCALE
+                    # Ties in a bucket are listed by student id
+                    for student_id in heapq.nsmallest(k - len(results), members):
+                        results.append((student_id, cgpa))
+                    remaining -= len(members)
+                bucket -= 1
+        return results
+
+
+class AnonymousEntry:
+    """An anonymous session's place in rankings, removed from each one once the session's state is freed"""
+
+    __slots__ = ("student_id", "rankings", "__weakref__")
+
+    def __init__(self, student_id):
+        self.student_id = student_id
+        self.rankings = set()  # id() of each ranking this entry was added to
+
+    def track(self, ranking):
+        """Remove this entry from ranking when the entry is garbage collected (once per ranking)"""
+        if id(ranking) not in self.rankings:
+            self.rankings.add(id(ranking))
+            weakref.finalize(self, ranking.remove, self.student_id)
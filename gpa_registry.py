@@ -0,0 +1,226 @@
+"""
+GPA Calculator - Program Registry
+Curricula and grade tables for every engineering program, loaded from
+JSON / TOML data files next to the built-in Civil Engineering program.
+
+Listing programs only scans file names. A program is parsed on first use,
+and the parsed data is cached on disk as a pickle snapshot keyed by the
+file's mtime and size, so startup does not grow with the number of
+programs installed and reruns never reparse.
+
+Program file layout (JSON shown; TOML uses the same keys):
+    {
+      "name": "Computer Engineering",
+      "description": "Bachelor in Computer Engineering (8 Semesters)",
+      "grade_table": [{"min": 80, "grade": "A", "point": 4.0}, ...],   # optional; a band runs up to the next min
+      "semesters": {
+        "Year 1 - Part I": [
+          {"code": "SH 101", "name": "Engineering Mathematics I", "type": "L+T", "credit": 3, "full_marks": 100},
+          ...
+        ],
+        ...
+      }
+    }
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import namedtuple
+
+from gpa_core import CURRICULUM_INDEX, GRADE_TABLE, POINT_SCALE, compile_curriculum
+
+PROGRAM_EXTENSIONS = (".json", ".toml")
+SNAPSHOT_VERSION = 1
+
+DEFAULT_PROGRAM = "civil"
+
+Program = namedtuple("Program", ["id", "name", "description", "index"])
+
+BUILTIN_PROGRAMS = {
+    DEFAULT_PROGRAM: Program(
+        id=DEFAULT_PROGRAM,
+        name="Civil Engineering",
+        description="Bachelor in Civil Engineering (First 4 Semesters)",
+        index=CURRICULUM_INDEX,
+    ),
+}
+
+_lock = threading.Lock()
+_programs = {}  # program id -> Program, parsed on first use
+
+
+def programs_dir():
+    """Directory scanned for program files (GPA_PROGRAMS_DIR, default ./programs next to this module)"""
+    return os.environ.get("GPA_PROGRAMS_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "programs")
+
+
+def cache_dir():
+    """Directory for parsed-program snapshots (GPA_CACHE_DIR, default the user cache dir)"""
+    if os.environ.get("GPA_CACHE_DIR"):
+        return os.environ["GPA_CACHE_DIR"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "gpa-calculator")
+
+# ==================== DISCOVERY ====================
+
+def program_files():
+    """{program id: path} of installed program files, from file names only"""
+    try:
+        entries = list(os.scandir(programs_dir()))
+    except FileNotFoundError:
+        return {}
+
+    files = {}
+    for entry in entries:
+        stem, extension = os.path.splitext(entry.name)
+        if extension.lower() in PROGRAM_EXTENSIONS and entry.is_file():
+            files[stem] = entry.path
+    return files
+
+
+def list_programs():
+    """Available program ids, built-in first; data files override built-ins of the same id"""
+    return list(dict.fromkeys([*BUILTIN_PROGRAMS, *sorted(program_files())]))
+
+
+def program_label(program_id):
+    """Display label without parsing the program ("computer_engineering" -> "Computer Engineering")"""
+    if program_id in BUILTIN_PROGRAMS and program_id not in program_files():
+        return BUILTIN_PROGRAMS[program_id].name
+    return program_id.replace("_", " ").replace("-", " ").title()
+
+# ==================== PARSING ====================
+
+def _parse_file(path):
+    if path.lower().endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            import tomli as tomllib
+        with open(path, "rb") as f:
+            try:
+                return tomllib.load(f)
+            except ValueError as e:
+                raise ValueError(f"{path}: {e}") from None
+
+    with open(path, encoding="utf-8") as f:
+        try:
+            return json.load(f)
+        except ValueError as e:
+            raise ValueError(f"{path}: {e}") from None
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _validate(data, path):
+    """Check a parsed program file; returns (curriculum, grade_table). Any problem is a ValueError naming the file"""
+    semesters = data.get("semesters") if isinstance(data, dict) else None
+    if not isinstance(semesters, dict) or not semesters:
+        raise ValueError(f"{path}: 'semesters' must map semester names to subject lists")
+
+    for semester_name, subjects in semesters.items():
+        if not isinstance(subjects, list):
+            raise ValueError(f"{path}: {semester_name}: must be a list of subjects")
+        keys = set()
+        for subject in subjects:
+            if not isinstance(subject, dict):
+                raise ValueError(f"{path}: {semester_name}: subject must be a table/object, got {type(subject).__name__}")
+            missing = {"code", "name", "type", "credit", "full_marks"} - set(subject)
+            if missing:
+                raise ValueError(f"{path}: {semester_name}: subject missing {sorted(missing)}")
+            if not _is_number(subject["full_marks"]) or not _is_number(subject["credit"]) \
+                    or subject["full_marks"] <= 0 or subject["credit"] < 0:
+                raise ValueError(f"{path}: {semester_name}: {subject['code']} has invalid credit/full_marks")
+            # Credits are scaled like grade points in the cohort engine
+            if abs(subject["credit"] * POINT_SCALE - round(subject["credit"] * POINT_SCALE)) > 1e-9:
+                raise ValueError(f"{path}: {semester_name}: {subject['code']} credit {subject['credit']} has more than 2 decimals")
+            key = f"{subject['code']}_{subject['type']}"
+            if key in keys:
+                raise ValueError(f"{path}: {semester_name}: duplicate component {key}")
+            keys.add(key)
+
+    grade_table = data.get("grade_table", GRADE_TABLE)
+    if not isinstance(grade_table, list) or not grade_table:
+        raise ValueError(f"{path}: grade_table must be a list of bands")
+    for row in grade_table:
+        if not isinstance(row, dict):
+            raise ValueError(f"{path}: grade_table band must be a table/object, got {type(row).__name__}")
+        missing = {"min", "grade", "point"} - set(row)
+        if missing:
+            raise ValueError(f"{path}: grade_table band missing {sorted(missing)}")
+        if not _is_number(row["min"]) or not _is_number(row["point"]):
+            raise ValueError(f"{path}: grade_table band {row['grade']!r} has a non-numeric min/point")
+        # Weighted points are summed exactly in 1/POINT_SCALE units
+        if abs(row["point"] * POINT_SCALE - round(row["point"] * POINT_SCALE)) > 1e-9:
+            raise ValueError(f"{path}: grade point {row['point']} has more than 2 decimals")
+    if not any(row["min"] <= 0 for row in grade_table):
+        raise ValueError(f"{path}: grade_table must have a band starting at 0%")
+
+    return semesters, grade_table
+
+
+def _snapshot_path(path):
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir(), f"{digest}.pickle")
+
+
+def _load_parsed(path):
+    """Parsed program data, from the on-disk snapshot when the file is unchanged"""
+    stat = os.stat(path)
+    stamp = (SNAPSHOT_VERSION, stat.st_mtime_ns, stat.st_size)
+    snapshot = _snapshot_path(path)
+
+    try:
+        with open(snapshot, "rb") as f:
+            cached_stamp, data = pickle.load(f)
+        if cached_stamp == stamp:
+            return data
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+
+    data = _parse_file(path)
+    try:
+        os.makedirs(os.path.dirname(snapshot), exist_ok=True)
+        tmp = f"{snapshot}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, snapshot)
+    except OSError:
+        pass  # read-only cache dir: still works, just reparses next process
+    return data
+
+# ==================== LOOKUP ====================
+
+def get_program(program_id=DEFAULT_PROGRAM):
+    """Program by id, parsed and compiled on first use, then shared process-wide"""
+    program = _programs.get(program_id)
+    if program is not None:
+        return program
+
+    with _lock:
+        if program_id in _programs:
+            return _programs[program_id]
+
+        path = program_files().get(program_id)
+        if path is None:
+            if program_id not in BUILTIN_PROGRAMS:
+                raise ValueError(f"unknown program: {program_id!r}")
+            program = BUILTIN_PROGRAMS[program_id]
+        else:
+            data = _load_parsed(path)
+            curriculum, grade_table = _validate(data, path)
+            program = Program(
+                id=program_id,
+                name=data.get("name", program_label(program_id)),
+                description=data.get("description", ""),
+                index=compile_curriculum(curriculum, grade_table),
+            )
+
+        _programs[program_id] = program
+        return program
+
@@ -0,0 +1,278 @@
+"""
+GPA Calculator - Batch Grade Sheet Reports
+Writes an HTML grade sheet for every student in a cohort: the summary and
+semester-wise breakdown the app shows, plus each semester's graded
+components.
+
+Students are graded a chunk at a time with the vectorized cohort engine
+(gpa_batch) instead of one scalar call per student. Templates are compiled
+once per program and worker: every component's table row is pre-rendered
+except its marks and grade. Workers write their own files, so only a
+one-line summary per student comes back to the parent, which appends it to
+index.csv as chunks complete.
+
+Sheets carry print styles (A4), so a browser's "Print to PDF" gives the PDF.
+
+Run: gpa report marks.csv|marks.jsonl -o reports/ [--workers N] [--chunk-size N] [--program ID]
+"""
+
+import csv
+import hashlib
+import os
+import re
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from html import escape
+from string import Template
+
+import numpy as np
+
+from gpa_batch import assign_grades, calculate_cohort_gpa, cohort_layout, marks_matrix
+from gpa_core import validate_semester_marks
+from gpa_parallel import chunked, map_in_order
+from gpa_registry import DEFAULT_PROGRAM, get_program
+
+REPORT_CHUNK_SIZE = 500
+INDEX_FILE = "index.csv"
+INDEX_COLUMNS = ["Student ID", "CGPA", "Credits", "File"]
+
+# ==================== TEMPLATES ====================
+
+SHEET_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Grade Sheet - $student_id</title>
+<style>
+@page { size: A4; margin: 16mm; }
+body { font-family: Helvetica, Arial, sans-serif; font-size: 11pt; color: #222; }
+h1 { font-size: 16pt; margin: 0; }
+h2 { font-size: 13pt; margin: 18pt 0 6pt; }
+h3 { font-size: 11pt; margin: 12pt 0 4pt; }
+.program { color: #555; margin: 2pt 0 12pt; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border: 1px solid #bbb; padding: 3pt 6pt; text-align: left; }
+th { background: #eee; }
+td.num, th.num { text-align: right; }
+.summary td { border: none; padding: 2pt 12pt 2pt 0; }
+section { break-inside: avoid; }
+</style>
+</head>
+<body>
+<h1>Grade Sheet</h1>
+<p class="program">$program_name</p>
+<table class="summary">
+<tr><td>Student ID</td><td><b>$student_id</b></td></tr>
+<tr><td>Cumulative GPA</td><td><b>$cgpa</b></td></tr>
+<tr><td>Total Credits Earned</td><td>$credits</td></tr>
+<tr><td>Total Possible Credits</td><td>$total_credits</td></tr>
+<tr><td>Overall Progress</td><td>$progress%</td></tr>
+</table>
+<h2>Semester-wise Breakdown</h2>
+<table>
+<tr><th>Semester</th><th class="num">GPA</th><th class="num">Credits</th><th class="num">Weighted Points</th></tr>
+$breakdown_rows</table>
+<h2>Components</h2>
+$semester_sections</body>
+</html>
+""")
+
+
+def compile_template(template):
+    """string.Template -> equivalent str.format string, so filling it is one C-level format_map call"""
+    text, parts, last = template.template, [], 0
+    for match in template.pattern.finditer(text):
+        parts.append(text[last:match.start()].replace("{", "{{").replace("}", "}}"))
+        name = match.group("named") or match.group("braced")
+        parts.append("$" if name is None else "{" + name + "}")
+        last = match.end()
+    parts.append(text[last:].replace("{", "{{").replace("}", "}}"))
+    return "".join(parts)
+
+
+SHEET_FORMAT = compile_template(SHEET_TEMPLATE)
+
+BREAKDOWN_ROW = '<tr><td>{}</td><td class="num">{:.2f}</td><td class="num">{:.1f}</td><td class="num">{:.2f}</td></tr>\n'
+
+COMPONENT_HEADER = (
+    "<tr><th>Course Code</th><th>Subject</th><th>Component</th>"
+    '<th class="num">Credit</th><th class="num">Marks</th><th>Grade</th></tr>\n'
+)
+
+ReportTemplates = namedtuple("ReportTemplates", [
+    "index",
+    "layout",             # gpa_batch cohort layout
+    "program_name",
+    "semester_names",     # escaped
+    "semester_columns",   # matrix columns of each semester
+    "semester_opening",   # <section><h3>...<table> + header, per semester
+    "row_prefix",         # per column: the row up to the marks cell
+    "full_marks",         # per column: " / full marks" suffix of the marks cell
+])
+
+
+def compile_templates(program=DEFAULT_PROGRAM):
+    """Pre-render everything in a program's grade sheets that does not depend on the student"""
+    definition = get_program(program)
+    index = definition.index
+    layout = cohort_layout(index)
+
+    row_prefix, full_marks = [], []
+    for component in index.components:
+        row_prefix.append(
+            f"<tr><td>{escape(component.code)}</td><td>{escape(component.name)}</td>"
+            f'<td>{escape(component.type)}</td><td class="num">{component.credit:g}</td><td class="num">'
+        )
+        full_marks.append(f" / {component.full_marks:g}")
+
+    semester_names = [escape(name) for name in layout.semester_names]
+    return ReportTemplates(
+        index=index,
+        layout=layout,
+        program_name=escape(definition.name),
+        semester_names=semester_names,
+        semester_columns=[[c.id for c in index.semesters[name].components] for name in layout.semester_names],
+        semester_opening=[f"<section>\n<h3>{name}</h3>\n<table>\n{COMPONENT_HEADER}" for name in semester_names],
+        row_prefix=row_prefix,
+        full_marks=full_marks,
+    )
+
+# ==================== RENDERING ====================
+
+def report_filename(student_id):
+    """
+    File name for a student's sheet; anything but letters, digits, '.', '-' and '_' becomes '_'.
+    IDs changed by that get a hash of the original ID appended, so 'a/b' and 'a_b' stay distinct.
+    """
+    student_id = str(student_id)
+    name = re.sub(r"[^A-Za-z0-9._-]", "_", student_id).lstrip(".")
+    if not name:
+        raise ValueError(f"student {student_id!r}: ID has no characters usable in a file name")
+    if name != student_id:
+        name += "-" + hashlib.sha1(student_id.encode("utf-8")).hexdigest()[:8]
+    return name + ".html"
+
+
+def render_chunk(records, templates):
+    """Yield (student_id, html, cgpa, credits) for a chunk of (student_id, semester_marks) records"""
+    cohort = []
+    for student_id, semester_marks in records:
+        try:
+            cohort.append(validate_semester_marks(semester_marks, templates.index))
+        except ValueError as e:
+            raise ValueError(f"student {student_id}: {e}") from None
+
+    layout = templates.layout
+    matrix = marks_matrix(cohort, layout)
+    results = calculate_cohort_gpa(matrix, layout)
+    grades, _ = assign_grades(matrix / layout.column_full_marks * 100, layout)
+    total_credits = templates.index.total_credits
+
+    # Plain lists: per-element numpy indexing would cost more than the rendering
+    marks, grades, taken = matrix.tolist(), grades.tolist(), (~np.isnan(matrix)).tolist()
+    results = {name: values.tolist() for name, values in results.items()}
+
+    for row, (student_id, _) in enumerate(records):
+        breakdown, sections = [], []
+        student_marks, student_grades, student_taken = marks[row], grades[row], taken[row]
+        semester_gpa, semester_credits = results["semester_gpa"][row], results["semester_credits"][row]
+        semester_weighted = results["semester_weighted"][row]
+
+        for s, columns in enumerate(templates.semester_columns):
+            taken_columns = [c for c in columns if student_taken[c]]
+            if not taken_columns:
+                continue
+            breakdown.append(BREAKDOWN_ROW.format(
+                templates.semester_names[s], semester_gpa[s], semester_credits[s], semester_weighted[s]
+            ))
+            sections.append(templates.semester_opening[s])
+            sections.extend(
+                f"{templates.row_prefix[c]}{student_marks[c]:g}{templates.full_marks[c]}</td><td>{student_grades[c]}</td></tr>\n"
+                for c in taken_columns
+            )
+            sections.append("</table>\n</section>\n")
+
+        cgpa, credits = results["cgpa"][row], results["credits"][row]
+        html = SHEET_FORMAT.format_map(dict(
+            student_id=escape(str(student_id)),
+            program_name=templates.program_name,
+            cgpa=f"{cgpa:.2f}",
+            credits=f"{credits:.1f}",
+            total_credits=f"{total_credits:.1f}",
+            progress=f"{credits / total_credits * 100 if total_credits > 0 else 0:.0f}",
+            breakdown_rows="".join(breakdown),
+            semester_sections="".join(sections),
+        ))
+        yield student_id, html, cgpa, credits
+
+
+def write_chunk(records, templates, output_dir):
+    """Render a chunk and write each sheet; returns index.csv rows"""
+    rows = []
+    for student_id, html, cgpa, credits in render_chunk(records, templates):
+        filename = report_filename(student_id)
+        with open(os.path.join(output_dir, filename), "w", encoding="utf-8") as f:
+            f.write(html)
+        rows.append([student_id, f"{cgpa:.2f}", f"{credits:.1f}", filename])
+    return rows
+
+# ==================== PARALLEL GENERATION ====================
+
+_worker_templates = None
+_worker_output_dir = None
+
+
+def _init_worker(program, output_dir):
+    """Compile the program's templates once per worker, before the first chunk"""
+    global _worker_templates, _worker_output_dir
+    _worker_templates = compile_templates(program)
+    _worker_output_dir = output_dir
+
+
+def _write_chunk_in_worker(records):
+    return write_chunk(records, _worker_templates, _worker_output_dir)
+
+
+def _chunked_writes(records, workers, chunk_size, program, output_dir):
+    """Yield index.csv rows chunk by chunk, in input order"""
+    chunks = chunked(records, chunk_size)
+
+    if workers == 1:
+        templates = compile_templates(program)
+        for chunk in chunks:
+            yield write_chunk(chunk, templates, output_dir)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(program, output_dir)) as pool:
+        yield from map_in_order(pool, _write_chunk_in_worker, chunks, workers)
+
+
+def _unique_students(records):
+    """Pass records through, rejecting a repeated student ID before its chunk is dispatched"""
+    seen = set()
+    for student_id, semester_marks in records:
+        if student_id in seen:
+            raise ValueError(f"student {student_id}: appears more than once (each student gets one grade sheet)")
+        seen.add(student_id)
+        yield student_id, semester_marks
+
+
+def generate_reports(records, output_dir, workers=1, chunk_size=REPORT_CHUNK_SIZE, program=DEFAULT_PROGRAM):
+    """
+    Write a grade sheet per (student_id, semester_marks) record into output_dir, plus index.csv.
+    Student IDs must be unique (ValueError otherwise).
+    workers > 1 (or 0 / None for all CPUs) renders chunks in a process pool.
+    Returns the number of sheets written.
+    """
+    workers = workers if workers is not None and workers > 0 else os.cpu_count() or 1
+    get_program(program)  # unknown programs fail before any output is created
+    os.makedirs(output_dir, exist_ok=True)
+
+    count = 0
+    with open(os.path.join(output_dir, INDEX_FILE), "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(INDEX_COLUMNS)
+        for rows in _chunked_writes(_unique_students(records), workers, chunk_size, program, output_dir):
+            writer.writerows(rows)
+            count += len(rows)
+    return count
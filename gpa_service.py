@@ -0,0 +1,170 @@
+"""
+GPA Calculator - HTTP Grading Service
+Plain ASGI app exposing the grading rules to other campus systems.
+
+Endpoints (bodies use the app's JSON export shape, {semester: {"CODE_TYPE": marks}}):
+    GET  /health
+    GET  /programs
+    POST /grade[?program=ID]          one semester_marks object
+    POST /grade/batch[?program=ID]    [{"student_id": ..., "semester_marks": {...}}, ...]
+
+Results are those of `gpa grade --json`. A single student grades in
+microseconds and runs on the event loop; batches larger than INLINE_BATCH
+are split into chunks and graded in a process pool, so the loop never
+blocks on CPU-heavy work.
+
+Run: gpa serve [--host 127.0.0.1] [--port 8000] [--workers N]   (needs uvicorn)
+"""
+
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs
+
+from gpa_core import grade_results, validate_semester_marks
+from gpa_registry import DEFAULT_PROGRAM, get_program, list_programs
+
+MAX_BODY_BYTES = 16 * 2**20
+INLINE_BATCH = 32      # batches up to this size are graded on the event loop
+BATCH_CHUNK_SIZE = 250
+
+_pool = None
+
+# ==================== GRADING ====================
+
+def grade_batch(records, program=DEFAULT_PROGRAM, start=0):
+    """
+    Grade [{"student_id", "semester_marks"}] records; a bad record fails the whole batch.
+    start is the position of the first record in the request (for errors and default ids).
+    """
+    index = get_program(program).index
+    results = []
+    for position, record in enumerate(records, start=start):
+        if not isinstance(record, dict) or "semester_marks" not in record:
+            raise ValueError(f"record {position}: expected {{\"student_id\": ..., \"semester_marks\": {{...}}}}")
+        try:
+            semester_marks = validate_semester_marks(record["semester_marks"], index)
+        except ValueError as e:
+            raise ValueError(f"record {position}: {e}") from None
+        results.append({"student_id": record.get("student_id", position), **grade_results(semester_marks, index)})
+    return results
+
+
+def worker_pool():
+    """Process pool for batch grading (GPA_SERVICE_WORKERS processes, default all CPUs)"""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=int(os.environ.get("GPA_SERVICE_WORKERS") or 0) or None)
+    return _pool
+
+
+async def grade_batch_offloaded(records, program):
+    """grade_batch across the worker pool, one chunk per task, results in input order"""
+    if len(records) <= INLINE_BATCH:
+        return grade_batch(records, program)
+
+    get_program(program)  # unknown programs fail here, before any work is shipped
+    loop = asyncio.get_running_loop()
+    chunks = [records[i:i + BATCH_CHUNK_SIZE] for i in range(0, len(records), BATCH_CHUNK_SIZE)]
+    graded = await asyncio.gather(*(
+        loop.run_in_executor(worker_pool(), grade_batch, chunk, program, i * BATCH_CHUNK_SIZE)
+        for i, chunk in enumerate(chunks)
+    ))
+    return [result for chunk_results in graded for result in chunk_results]
+
+# ==================== HTTP ====================
+
+async def read_body(receive):
+    body = bytearray()
+    while True:
+        message = await receive()
+        body += message.get("body", b"")
+        if len(body) > MAX_BODY_BYTES:
+            raise OverflowError
+        if not message.get("more_body"):
+            return bytes(body)
+
+
+async def send_json(send, status, payload):
+    body = json.dumps(payload).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def handle_health(body, program):
+    return {"status": "ok"}
+
+
+async def handle_programs(body, program):
+    return {"programs": list_programs()}
+
+
+async def handle_grade(body, program):
+    index = get_program(program).index
+    return grade_results(validate_semester_marks(json.loads(body), index), index)
+
+
+async def handle_batch(body, program):
+    records = json.loads(body)
+    if not isinstance(records, list):
+        raise ValueError("expected a JSON array of {\"student_id\": ..., \"semester_marks\": {...}}")
+    return await grade_batch_offloaded(records, program)
+
+
+ROUTES = {
+    ("GET", "/health"): handle_health,
+    ("GET", "/programs"): handle_programs,
+    ("POST", "/grade"): handle_grade,
+    ("POST", "/grade/batch"): handle_batch,
+}
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            if _pool is not None:
+                _pool.shutdown(cancel_futures=True)
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    """ASGI entry point"""
+    if scope["type"] == "lifespan":
+        return await lifespan(receive, send)
+    if scope["type"] != "http":
+        return  # no websocket endpoints; the server closes the connection
+
+    method, path = scope["method"], scope["path"].rstrip("/") or "/"
+    if (method, path) not in ROUTES:
+        if any(route_path == path for _, route_path in ROUTES):
+            return await send_json(send, 405, {"error": f"method {method} not allowed"})
+        return await send_json(send, 404, {"error": f"not found: {path}"})
+
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    program = query.get("program", [DEFAULT_PROGRAM])[0]
+    try:
+        body = await read_body(receive)
+        payload = await ROUTES[method, path](body, program)
+    except OverflowError:
+        return await send_json(send, 413, {"error": f"body larger than {MAX_BODY_BYTES} bytes"})
+    except ValueError as e:  # includes malformed JSON and unknown programs
+        return await send_json(send, 400, {"error": str(e)})
+    await send_json(send, 200, payload)
+
+
+def serve(host="127.0.0.1", port=8000, workers=None):
+    """Run the service under uvicorn"""
+    import uvicorn
+
+    if workers:
+        os.environ["GPA_SERVICE_WORKERS"] = str(workers)
+    uvicorn.run(app, host=host, port=port, log_level="warning")
@@ -0,0 +1,218 @@
+"""
+GPA Calculator - Session Memory Manager
+Keeps the app's per-session memory bounded on a shared server.
+
+The curriculum, grade table and view models are already process-wide
+(gpa_core / gpa_registry / st.cache_resource); what grows with open tabs is
+each session's own state. Every rerun reports its session here: the
+manager measures the session's footprint, and while the total is over
+budget it spills the least recently used idle sessions to local disk.
+
+Spilling never touches another session's st.session_state: the manager
+holds the session's own marks containers, pickles them, and clears them
+in place. The session's next rerun refills the same objects before
+anything reads them. Recomputable caches are just dropped.
+
+Configuration:
+    GPA_SESSION_BUDGET_MB     total session footprint before spilling (default 256)
+    GPA_SESSION_IDLE_SECONDS  a session must be idle this long to spill (default 120)
+    GPA_SPILL_DIR             where each process creates its private (0700) spill directory
+                              (default: the system temp directory); removed at exit
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import weakref
+
+# Session state entries the manager may spill (restored on the next rerun) or drop (rebuilt on demand)
+SPILL_KEYS = ("semester_marks", "program_marks", "running_totals")
+DROP_KEYS = ("projection",)
+
+# ==================== FOOTPRINT ====================
+
+def deep_sizeof(obj, seen=None):
+    """Bytes held by obj and everything it contains (containers, strings, numbers, arrays)"""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif hasattr(obj, "nbytes") and not isinstance(obj, memoryview):
+        size += obj.nbytes  # numpy arrays: getsizeof misses views' buffers
+    return size
+
+
+class SessionMemory:
+    """One session's entry: its spillable containers, footprint and spill file"""
+
+    __slots__ = (
+        "session_id", "containers", "bytes", "spillable_bytes", "last_seen", "running", "spilling", "spilled", "__weakref__",
+    )
+
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.containers = {}
+        self.bytes = 0            # whole session state
+        self.spillable_bytes = 0  # the part held in containers
+        self.last_seen = time.monotonic()
+        self.running = False
+        self.spilling = False     # being written to disk, outside the manager lock
+        self.spilled = False
+
+# ==================== MANAGER ====================
+
+class SessionMemoryManager:
+    """Measures every session's footprint and spills idle ones while over budget"""
+
+    def __init__(self, budget_bytes=None, idle_seconds=None, spill_dir=None):
+        self.budget_bytes = budget_bytes or int(float(os.environ.get("GPA_SESSION_BUDGET_MB", 256)) * 2**20)
+        self.idle_seconds = float(idle_seconds if idle_seconds is not None else os.environ.get("GPA_SESSION_IDLE_SECONDS", 120))
+        # Private to this process (mkdtemp creates it 0700), so other users and processes cannot read or plant spill files
+        self.spill_dir = tempfile.mkdtemp(prefix="gpa-sessions-", dir=spill_dir or os.environ.get("GPA_SPILL_DIR"))
+        weakref.finalize(self, shutil.rmtree, self.spill_dir, ignore_errors=True)
+
+        self._lock = threading.Lock()
+        # Entries live in each session's own state, so closed sessions drop out by themselves
+        self._sessions = weakref.WeakValueDictionary()
+        self.spills = 0
+        self.restores = 0
+
+    def begin(self, session_state, session_id):
+        """Start of a rerun: restore this session if it was spilled, and pin it in memory"""
+        entry = session_state.get("_memory")
+        if entry is None:
+            entry = session_state["_memory"] = SessionMemory(session_id)
+            # A closed session's spill file goes with its state
+            weakref.finalize(entry, _remove_file, self._spill_path(session_id))
+        with self._lock:
+            self._sessions[entry.session_id] = entry
+            entry.running = True
+            spilled = entry.spilled
+        if spilled:
+            # Running entries are never spilled, so the file can be read without the lock
+            saved = self._read_spill(entry)
+            with self._lock:
+                self._restore(entry, saved)
+
+    def end(self, session_state):
+        """End of a rerun: re-measure this session, then spill idle sessions while over budget"""
+        entry = session_state.get("_memory")
+        if entry is None:
+            return
+        containers = {key: session_state[key] for key in SPILL_KEYS + DROP_KEYS if key in session_state}
+        seen = set()
+        spillable = deep_sizeof(containers, seen)
+        # Everything else: widget values, flags, caches
+        rest = deep_sizeof({key: value for key, value in session_state.to_dict().items() if key not in containers}, seen)
+
+        with self._lock:
+            entry.containers = containers
+            entry.spillable_bytes = spillable
+            entry.bytes = spillable + rest
+            entry.last_seen = time.monotonic()
+            entry.running = False
+            victims = self._pick_victims()
+        for victim, last_seen, data in victims:
+            self._spill(victim, last_seen, data)
+
+    def stats(self):
+        """{"sessions", "resident_bytes", "spilled", "spills", "restores", "budget_bytes"}"""
+        with self._lock:
+            entries = list(self._sessions.values())
+            return {
+                "sessions": len(entries),
+                "resident_bytes": sum(e.bytes for e in entries),
+                "spilled": sum(e.spilled for e in entries),
+                "spills": self.spills,
+                "restores": self.restores,
+                "budget_bytes": self.budget_bytes,
+            }
+
+    # ==================== SPILL / RESTORE ====================
+
+    def _pick_victims(self):
+        """
+        With the lock held: the least recently used idle sessions to spill while over budget,
+        as (entry, last_seen, pickled containers). File I/O happens after the lock is released.
+        """
+        entries = list(self._sessions.values())
+        total = sum(e.bytes - (e.spillable_bytes if e.spilling else 0) for e in entries)
+        if total <= self.budget_bytes:
+            return []
+
+        now = time.monotonic()
+        idle = [
+            e for e in entries
+            if not e.spilled and not e.spilling and not e.running and now - e.last_seen >= self.idle_seconds
+        ]
+        victims = []
+        for entry in sorted(idle, key=lambda e: e.last_seen):
+            saved = {key: dict(entry.containers[key]) for key in SPILL_KEYS if key in entry.containers}
+            entry.spilling = True
+            victims.append((entry, entry.last_seen, pickle.dumps(saved, protocol=pickle.HIGHEST_PROTOCOL)))
+            total -= entry.spillable_bytes
+            if total <= self.budget_bytes:
+                break
+        return victims
+
+    def _spill_path(self, session_id):
+        digest = hashlib.sha1(str(session_id).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.spill_dir, f"{digest}.pickle")
+
+    def _spill(self, entry, last_seen, data):
+        """Write a session's pickled containers to disk, then empty them in place unless it has rerun meanwhile"""
+        path = self._spill_path(entry.session_id)
+        try:
+            tmp = f"{path}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            with self._lock:
+                entry.spilling = False
+            raise
+
+        with self._lock:
+            entry.spilling = False
+            if entry.running or entry.last_seen != last_seen:
+                # The session came back while its file was written; it keeps its (newer) state
+                _remove_file(path)
+                return
+            for container in entry.containers.values():
+                container.clear()
+            entry.spilled = True
+            entry.bytes -= entry.spillable_bytes
+            entry.spillable_bytes = 0
+            self.spills += 1
+
+    def _read_spill(self, entry):
+        path = self._spill_path(entry.session_id)
+        with open(path, "rb") as f:
+            saved = pickle.load(f)
+        _remove_file(path)
+        return saved
+
+    def _restore(self, entry, saved):
+        """Refill the session's containers from its spill file's contents"""
+        for key, contents in saved.items():
+            entry.containers[key].update(contents)
+        entry.spilled = False
+        self.restores += 1
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
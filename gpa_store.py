@@ -0,0 +1,172 @@
+"""
+GPA Calculator - Persistent Marks Store
+SQLite-backed marks keyed by (student, program, semester, component key), with
+write-behind batching: edits are buffered in memory and written in one
+transaction when the buffer fills, after a short interval, or on close.
+Students are loaded lazily, on first access.
+"""
+
+import atexit
+import sqlite3
+import threading
+import time
+from itertools import groupby
+
+from gpa_registry import DEFAULT_PROGRAM, get_program
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS marks (
+    student_id    TEXT NOT NULL,
+    program       TEXT NOT NULL,
+    semester      TEXT NOT NULL,
+    component_key TEXT NOT NULL,
+    marks         REAL NOT NULL,
+    updated_at    REAL NOT NULL,
+    PRIMARY KEY (student_id, program, semester, component_key)
+) WITHOUT ROWID
+"""
+
+# Databases written before programs existed hold only the default program
+MIGRATE_ADD_PROGRAM = f"""
+ALTER TABLE marks RENAME TO marks_v0;
+{SCHEMA};
+INSERT INTO marks SELECT student_id, '{DEFAULT_PROGRAM}', semester, component_key, marks, updated_at FROM marks_v0;
+DROP TABLE marks_v0;
+"""
+
+
+class MarksStore:
+    """Marks database with a write-behind buffer, safe to share across sessions"""
+
+    def __init__(self, path, flush_interval=2.0, max_pending=500):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._lock = threading.RLock()
+        self._pending = {}  # (student_id, program, semester, key) -> marks, None = delete
+        self._closed = threading.Event()
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL + NORMAL: one fsync per checkpoint instead of per transaction
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(marks)")]
+        if columns and "program" not in columns:
+            self._conn.executescript(MIGRATE_ADD_PROGRAM)
+        self._conn.execute(SCHEMA)
+        self._conn.commit()
+
+        self._flusher = threading.Thread(target=self._flush_periodically, name="marks-store-flush", daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
+
+    # ==================== READS ====================
+
+    def load_student(self, student_id, program=DEFAULT_PROGRAM):
+        """semester_marks dict for a student's program (every semester, pending edits included)"""
+        semester_marks = {name: {} for name in get_program(program).index.semesters}
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT semester, component_key, marks FROM marks WHERE student_id = ? AND program = ?",
+                (student_id, program),
+            ).fetchall()
+            pending = [(k[1:], v) for k, v in self._pending.items() if k[:2] == (student_id, program)]
+
+        for semester_name, key, marks in rows:
+            if semester_name in semester_marks:
+                semester_marks[semester_name][key] = marks
+        for (_, semester_name, key), marks in pending:
+            if semester_name not in semester_marks:
+                continue
+            if marks is None:
+                semester_marks[semester_name].pop(key, None)
+            else:
+                semester_marks[semester_name][key] = marks
+
+        return semester_marks
+
+    def iter_students(self, program=DEFAULT_PROGRAM):
+        """(student_id, semester_marks) for every stored student of a program, pending edits included"""
+        semesters = get_program(program).index.semesters
+        with self._lock:
+            self.flush()
+            rows = self._conn.execute(
+                "SELECT student_id, semester, component_key, marks FROM marks WHERE program = ? ORDER BY student_id",
+                (program,),
+            ).fetchall()
+
+        for student_id, student_rows in groupby(rows, key=lambda row: row[0]):
+            semester_marks = {name: {} for name in semesters}
+            for _, semester_name, key, marks in student_rows:
+                if semester_name in semester_marks:
+                    semester_marks[semester_name][key] = marks
+            yield student_id, semester_marks
+
+    # ==================== WRITES ====================
+
+    def set_mark(self, student_id, semester_name, key, marks, program=DEFAULT_PROGRAM):
+        """Buffer one component's marks (None deletes it)"""
+        with self._lock:
+            self._pending[(student_id, program, semester_name, key)] = marks
+            if len(self._pending) >= self.max_pending:
+                self.flush()
+
+    def delete_student(self, student_id, program=DEFAULT_PROGRAM):
+        """Remove every stored mark of a student in one program"""
+        with self._lock:
+            self._pending = {k: v for k, v in self._pending.items() if k[:2] != (student_id, program)}
+            self._conn.execute("DELETE FROM marks WHERE student_id = ? AND program = ?", (student_id, program))
+            self._conn.commit()
+
+    def import_json(self, student_id, semester_marks, program=DEFAULT_PROGRAM):
+        """Replace a student's marks in one program with a semester_marks JSON export"""
+        index = get_program(program).index
+        rows = []
+        now = time.time()
+        for semester_name, marks_data in semester_marks.items():
+            if semester_name not in index.semesters:
+                raise ValueError(f"unknown semester: {semester_name!r}")
+            by_key = index.semesters[semester_name].by_key
+            for key, marks in marks_data.items():
+                if key not in by_key:
+                    raise ValueError(f"unknown component in {semester_name}: {key!r}")
+                rows.append((student_id, program, semester_name, key, float(marks), now))
+
+        with self._lock:
+            self.flush()
+            with self._conn:
+                self._conn.execute("DELETE FROM marks WHERE student_id = ? AND program = ?", (student_id, program))
+                self._conn.executemany("INSERT INTO marks VALUES (?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def flush(self):
+        """Write every buffered edit in a single transaction"""
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            now = time.time()
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO marks VALUES (?, ?, ?, ?, ?, ?)",
+                    [(*k, v, now) for k, v in pending.items() if v is not None],
+                )
+                self._conn.executemany(
+                    "DELETE FROM marks WHERE student_id = ? AND program = ? AND semester = ? AND component_key = ?",
+                    [k for k, v in pending.items() if v is None],
+                )
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        """Flush pending edits and close the database"""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        with self._lock:
+            self.flush()
+            self._conn.close()
@@ -0,0 +1,196 @@
+"""
+GPA Calculator - Streaming Batch Grader
+Grades exam-board dumps one student at a time, so memory stays flat
+however many rows the input has.
+
+Inputs:
+- CSV in the app's export layout (Semester, Course Code, Component,
+  Marks Obtained, ...), with an optional leading "Student ID" column.
+  Rows of one student must be contiguous.
+- JSONL, one student per line: either a semester_marks object or
+  {"student_id": ..., "semester_marks": {...}}
+- A single exported semester_marks JSON file (one student)
+"""
+
+import csv
+import json
+import os
+import sys
+from itertools import groupby
+
+from gpa_core import CURRICULUM_INDEX, apply_mark_change, build_running_totals, totals_gpa, validate_semester_marks
+from gpa_registry import DEFAULT_PROGRAM, get_program
+
+STUDENT_ID_COLUMN = "Student ID"
+REQUIRED_CSV_COLUMNS = ("Semester", "Course Code", "Component")
+# Excel and other tools often save CSV / JSON with a UTF-8 byte order mark; this codec drops it
+INPUT_ENCODING = "utf-8-sig"
+
+# ==================== READERS ====================
+
+def _check_component(semester_name, key, where, index=None):
+    """Reject semesters and CODE_TYPE keys that are not in the curriculum"""
+    index = index or CURRICULUM_INDEX
+    if semester_name not in index.semesters:
+        raise ValueError(f"{where}: unknown semester {semester_name!r}")
+    if key not in index.semesters[semester_name].by_key:
+        raise ValueError(f"{where}: unknown component {key!r} in {semester_name}")
+
+
+def read_csv_records(f, index=None):
+    """Yield (student_id, semester_marks) from an export-layout CSV, one student at a time"""
+    reader = csv.DictReader(f)
+    fieldnames = reader.fieldnames or []
+    if fieldnames and fieldnames[0].startswith("\ufeff"):
+        # Opened without INPUT_ENCODING: the BOM would hide the first column's name
+        reader.fieldnames = fieldnames = [fieldnames[0][1:], *fieldnames[1:]]
+    missing = [column for column in REQUIRED_CSV_COLUMNS if column not in fieldnames]
+    if missing:
+        raise ValueError(f"line 1: CSV header is missing column(s) {', '.join(missing)}")
+    has_student_ids = STUDENT_ID_COLUMN in fieldnames
+    numbered_rows = enumerate(reader, start=2)
+
+    def student_of(numbered_row):
+        if not has_student_ids:
+            return "1"
+        line, row = numbered_row
+        student_id = (row.get(STUDENT_ID_COLUMN) or "").strip()
+        if not student_id:
+            raise ValueError(f"line {line}: blank {STUDENT_ID_COLUMN}")
+        return student_id
+
+    for student_id, rows in groupby(numbered_rows, key=student_of):
+        semester_marks = {}
+        for line, row in rows:
+            marks = (row.get("Marks Obtained") or "").strip()
+            if not marks:
+                continue
+            semester_name = row["Semester"]
+            key = f"{row['Course Code']}_{row['Component']}"
+            _check_component(semester_name, key, f"line {line}", index)
+            try:
+                semester_marks.setdefault(semester_name, {})[key] = float(marks)
+            except ValueError:
+                raise ValueError(f"line {line}: invalid marks {marks!r}") from None
+        yield student_id, semester_marks
+
+
+def read_jsonl_records(f):
+    """Yield (student_id, semester_marks) from JSONL, one student per line"""
+    for line_number, line in enumerate(f, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"line {line_number}: invalid JSON ({e})") from None
+        if not isinstance(record, dict):
+            raise ValueError(f"line {line_number}: expected a JSON object, got {type(record).__name__}")
+        if "semester_marks" in record:
+            yield str(record.get("student_id", line_number)), record["semester_marks"]
+        else:
+            yield str(line_number), record
+
+
+def read_records(path, f, index=None):
+    """Pick a reader from the file extension"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return read_csv_records(f, index)
+    if extension == ".jsonl":
+        return read_jsonl_records(f)
+    if extension == ".json":
+        return iter([("1", json.load(f))])
+    raise ValueError(f"unsupported input format: {path} (expected .csv, .jsonl or .json)")
+
+# ==================== GRADING ====================
+
+def grade_record(student_id, semester_marks, index=None):
+    """Semester-wise and cumulative results for one student, via the running totals"""
+    try:
+        validate_semester_marks(semester_marks, index)
+    except ValueError as e:
+        raise ValueError(f"student {student_id}: {e}") from None
+
+    totals = build_running_totals({}, index)
+    for semester_name, marks_data in semester_marks.items():
+        for key, marks in marks_data.items():
+            apply_mark_change(totals, semester_name, key, None, marks, index)
+
+    cgpa, weighted, credits = totals_gpa(totals)
+    result = {
+        "student_id": student_id,
+        "cgpa": cgpa,
+        "credits": credits,
+        "weighted_points": weighted,
+        "semesters": {},
+    }
+    for semester_name, semester_totals in totals["semesters"].items():
+        gpa, weighted, credits = totals_gpa(semester_totals)
+        result["semesters"][semester_name] = {"gpa": gpa, "credits": credits, "weighted_points": weighted}
+    return result
+
+# ==================== WRITERS ====================
+
+def result_columns(index=None):
+    """CSV header: totals, then GPA and credits for every semester of the program"""
+    return (
+        [STUDENT_ID_COLUMN, "CGPA", "Credits", "Weighted Points"]
+        + [f"{name} {field}" for name in (index or CURRICULUM_INDEX).semesters for field in ("GPA", "Credits")]
+    )
+
+
+RESULT_COLUMNS = result_columns()
+
+
+def _result_row(result):
+    row = [result["student_id"], f"{result['cgpa']:.2f}", f"{result['credits']:.1f}", f"{result['weighted_points']:.2f}"]
+    for semester in result["semesters"].values():
+        row += [f"{semester['gpa']:.2f}", f"{semester['credits']:.1f}"]
+    return row
+
+
+def write_csv_results(results, f, index=None):
+    """Write results as CSV rows as they arrive"""
+    writer = csv.writer(f)
+    writer.writerow(result_columns(index))
+    for count, result in enumerate(results, start=1):
+        writer.writerow(_result_row(result))
+        yield count
+
+
+def write_jsonl_results(results, f, index=None):
+    """Write results as JSON lines as they arrive"""
+    for count, result in enumerate(results, start=1):
+        f.write(json.dumps(result) + "\n")
+        yield count
+
+
+WRITERS = {"csv": write_csv_results, "jsonl": write_jsonl_results}
+
+# ==================== PIPELINE ====================
+
+def grade_stream(input_path, output=None, output_format="csv", workers=1, chunk_size=None, program=DEFAULT_PROGRAM):
+    """
+    Stream-grade input_path into output (a path, or stdout when None) against a program's curriculum.
+    workers > 1 (or 0 / None for all CPUs) grades chunks of students in a process pool.
+    Returns the number of students graded.
+    """
+    index = get_program(program).index
+    out = open(output, "w", encoding="utf-8", newline="") if output else sys.stdout
+
+    try:
+        with open(input_path, encoding=INPUT_ENCODING, newline="") as f:
+            count = 0
+            records = read_records(input_path, f, index)
+            if workers == 1:
+                results = (grade_record(sid, marks, index) for sid, marks in records)
+            else:
+                from gpa_parallel import DEFAULT_CHUNK_SIZE, grade_parallel
+                results = grade_parallel(records, workers, chunk_size or DEFAULT_CHUNK_SIZE, program)
+            for count in WRITERS[output_format](results, out, index):
+                pass
+            return count
+    finally:
+        if output:
+            out.close()
@@ -0,0 +1,123 @@
+"""
+GPA Calculator - Target CGPA Solver
+Least marks needed on the components not taken yet to reach a target CGPA.
+
+Every remaining component picks one grade band, and gains that band's
+grade point x credit for the marks it takes to enter the band. Choosing
+the bands is a multiple-choice knapsack: a dynamic program over exact
+scaled weighted points (the gpa_core integers, divided by their gcd)
+finds the smallest total marks reaching the target, in
+O(components x bands x points) instead of bands ** components.
+"""
+
+import math
+from functools import reduce
+
+import numpy as np
+
+from gpa_core import CURRICULUM_INDEX, POINT_SCALE, assign_grade, calculate_percentage, scaled_weighted_point, totals_gpa
+
+# Marks are planned in the marks input's step
+MARKS_STEP = 0.5
+
+# ==================== BAND OPTIONS ====================
+
+def remaining_components(all_semester_marks, index=None):
+    """Credit-bearing components with no marks entered yet, in curriculum order"""
+    index = index or CURRICULUM_INDEX
+    return [
+        component
+        for semester_name, semester in index.semesters.items()
+        for component in semester.graded
+        if component.key not in all_semester_marks.get(semester_name, {})
+    ]
+
+
+def band_options(component, index=None, allow_fail=False):
+    """(marks, grade, grade point) for every band reachable on a component, at the least marks entering it"""
+    index = index or CURRICULUM_INDEX
+    options = []
+    for band_min, (grade, grade_point) in zip(index.band_mins, index.band_results):
+        if grade_point <= 0 and not allow_fail:
+            continue
+        marks = math.ceil(max(band_min, 0) * component.full_marks / 100 / MARKS_STEP) * MARKS_STEP
+        # Float percentages can land just under a band minimum; step up until the grade matches
+        while marks <= component.full_marks and assign_grade(calculate_percentage(marks, component.full_marks), index) != (grade, grade_point):
+            marks += MARKS_STEP
+        if marks <= component.full_marks:
+            options.append((marks, grade, grade_point))
+    return options
+
+# ==================== SOLVER ====================
+
+def solve_target(totals, all_semester_marks, target_cgpa, index=None, allow_fail=False):
+    """
+    Least-total-marks plan reaching target_cgpa, given the running totals of the marks so far.
+    Every remaining component is assumed to be taken, so its credits count, and
+    passed (zero-point bands are skipped) unless allow_fail.
+    Returns {"reachable", "plan", "total_marks", "projected_cgpa", "max_cgpa"};
+    when the target is out of reach the plan is the best possible (top band everywhere).
+    """
+    index = index or CURRICULUM_INDEX
+    components = remaining_components(all_semester_marks, index)
+    options = [band_options(component, index, allow_fail) for component in components]
+    gains = [
+        [round(scaled_weighted_point(grade_point, component.credit)) for _, _, grade_point in component_options]
+        for component, component_options in zip(components, options)
+    ]
+
+    final_credits = totals["credits"] + sum(component.credit for component in components)
+    # Exact: weighted / credits >= target  <=>  weighted >= target x credits, in scaled units
+    need = math.ceil(round(target_cgpa * POINT_SCALE) * final_credits - totals["weighted"] - 1e-9)
+    best_gain = sum(max(component_gains) for component_gains in gains)
+
+    if need > best_gain:
+        choices = [max(range(len(g)), key=g.__getitem__) for g in gains]
+    else:
+        choices = _least_marks(options, gains, max(need, 0))
+
+    plan = []
+    gained = 0
+    for component, component_options, component_gains, choice in zip(components, options, gains, choices):
+        marks, grade, grade_point = component_options[choice]
+        gained += component_gains[choice]
+        plan.append({"component": component, "marks": marks, "grade": grade, "grade_point": grade_point})
+
+    return {
+        "reachable": need <= best_gain,
+        "plan": plan,
+        "total_marks": sum(row["marks"] for row in plan),
+        "projected_cgpa": totals_gpa({"weighted": totals["weighted"] + gained, "credits": final_credits})[0],
+        "max_cgpa": totals_gpa({"weighted": totals["weighted"] + best_gain, "credits": final_credits})[0],
+    }
+
+
+def _least_marks(options, gains, need):
+    """Band choice per component with gains summing to >= need at the least total marks"""
+    if not options:
+        return []
+
+    unit = reduce(math.gcd, (gain for component_gains in gains for gain in component_gains), 0) or 1
+    levels = np.arange(-(-need // unit) + 1)
+
+    # cost[g] = least marks so far reaching at least g gain units
+    cost = np.full(len(levels), np.inf)
+    cost[0] = 0.0
+    choices = np.empty((len(options), len(levels)), dtype=np.int16)
+
+    for i, (component_options, component_gains) in enumerate(zip(options, gains)):
+        candidates = np.stack([
+            cost[np.maximum(levels - gain // unit, 0)] + marks
+            for (marks, _, _), gain in zip(component_options, component_gains)
+        ])
+        choices[i] = candidates.argmin(axis=0)
+        cost = candidates[choices[i], levels]
+
+    # Walk back from the full need, one component at a time
+    plan = []
+    level = levels[-1]
+    for i in range(len(options) - 1, -1, -1):
+        choice = int(choices[i, level])
+        plan.append(choice)
+        level = max(level - gains[i][choice] // unit, 0)
+    return plan[::-1]
@@ -0,0 +1,63 @@
+"""
+Shared test fixtures and data helpers (the benchmarks import the helpers too)
+"""
+
+import json
+import random
+
+import numpy as np
+import pytest
+
+from gpa_batch import COLUMN_FULL_MARKS, COMPONENT_COLUMNS, SEMESTER_NAMES
+from gpa_core import CURRICULUM_INDEX, assign_grade, calculate_percentage
+from gpa_export import EXPORT_COLUMNS
+
+
+def random_marks(rng, component):
+    """Marks in the app's 0.5 input steps, anywhere from 0 to full marks"""
+    return rng.randint(0, component.full_marks * 2) / 2
+
+
+@pytest.fixture
+def full_transcript():
+    """Every component of the civil curriculum filled with seeded random marks"""
+    rng = random.Random(0)
+    semester_marks = {name: {} for name in CURRICULUM_INDEX.semesters}
+    for component in CURRICULUM_INDEX.components:
+        semester_marks[component.semester][component.key] = random_marks(rng, component)
+    return semester_marks
+
+
+def synthetic_matrix(n_students, seed=0, not_taken=0.2):
+    """Random marks in 0.5 steps, with a share of components left as NaN"""
+    rng = np.random.default_rng(seed)
+    matrix = np.round(rng.uniform(0, 1, (n_students, len(COMPONENT_COLUMNS))) * COLUMN_FULL_MARKS * 2) / 2
+    matrix[rng.uniform(size=matrix.shape) < not_taken] = np.nan
+    return matrix
+
+
+def to_semester_marks(row):
+    """One matrix row in the app's semester_marks shape"""
+    all_semester_marks = {semester_name: {} for semester_name in SEMESTER_NAMES}
+    for (semester_name, key), marks in zip(COMPONENT_COLUMNS, row):
+        if not np.isnan(marks):
+            all_semester_marks[semester_name][key] = float(marks)
+    return all_semester_marks
+
+
+def eager_export(all_semester_marks):
+    """What the export sidebar built on every rerun before payloads were memoized: (CSV, JSON)"""
+    import pandas as pd
+
+    export_data = []
+    for sem_name, marks_data in all_semester_marks.items():
+        for component in CURRICULUM_INDEX.semesters[sem_name].components:
+            marks = marks_data.get(component.key, None)
+            if marks is not None and marks > 0:
+                percentage = calculate_percentage(marks, component.full_marks)
+                grade, grade_point = assign_grade(percentage)
+                export_data.append(dict(zip(EXPORT_COLUMNS, (
+                    sem_name, component.code, component.name, component.type, component.credit,
+                    component.full_marks, marks, f"{percentage:.2f}", grade, grade_point,
+                ))))
+    return pd.DataFrame(export_data).to_csv(index=False), json.dumps(all_semester_marks, indent=2)
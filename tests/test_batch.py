@@ -0,0 +1,85 @@
+import numpy as np
+
+from conftest import synthetic_matrix, to_semester_marks
+from gpa_batch import SEMESTER_NAMES, assign_grades, calculate_cohort_gpa, marks_matrix
+from gpa_core import assign_grade, calculate_cumulative_gpa, calculate_semester_gpa
+
+
+def test_cohort_matches_scalar_functions():
+    matrix = synthetic_matrix(500, seed=1)
+    result = calculate_cohort_gpa(matrix)
+
+    for i, row in enumerate(matrix):
+        all_semester_marks = to_semester_marks(row)
+        for s, semester_name in enumerate(SEMESTER_NAMES):
+            expected = calculate_semester_gpa(all_semester_marks[semester_name], semester_name)
+            actual = (result["semester_gpa"][i, s], result["semester_weighted"][i, s], result["semester_credits"][i, s])
+            assert tuple(map(float, actual)) == expected, (i, semester_name)
+        actual = (result["cgpa"][i], result["weighted"][i], result["credits"][i])
+        assert tuple(map(float, actual)) == calculate_cumulative_gpa(all_semester_marks), i
+
+
+def test_marks_matrix_round_trip():
+    matrix = synthetic_matrix(50, seed=2)
+    rebuilt = marks_matrix([to_semester_marks(row) for row in matrix])
+    np.testing.assert_array_equal(rebuilt, matrix)
+
+
+def test_assign_grades_matches_scalar():
+    percentages = np.concatenate([np.arange(0, 10001) / 100, [np.nan, -0.01, -5.0, 100.01, 250.0]])
+    grades, points = assign_grades(percentages)
+    for percentage, grade, point in zip(percentages.tolist(), grades.tolist(), points.tolist()):
+        assert assign_grade(percentage) == (grade, point), percentage
+
+
+def test_nan_and_out_of_range_grades():
+    assert assign_grade(float("nan")) == ("F", 0.0)
+    assert assign_grade(-5.0) == ("F", 0.0)
+    assert assign_grade(250.0) == ("A", 4.0)
+    assert assign_grade(79.99) == ("A−", 3.7)
+
+
+def test_fractional_credits_match_scalar_functions(tmp_path, monkeypatch):
+    import json
+    import random
+
+    import gpa_registry
+    from gpa_batch import cohort_layout
+    from gpa_core import grade_results
+
+    monkeypatch.setenv("GPA_PROGRAMS_DIR", str(tmp_path))
+    monkeypatch.setenv("GPA_CACHE_DIR", str(tmp_path / "cache"))
+    subjects = [
+        {"code": "FR 101", "name": "Half", "type": "L+T", "credit": 1.5, "full_marks": 100},
+        {"code": "FR 102", "name": "Whole", "type": "L+T", "credit": 3, "full_marks": 100},
+        {"code": "FR 103", "name": "Quarter", "type": "P", "credit": 0.25, "full_marks": 50},
+        {"code": "FR 104", "name": "Tenths", "type": "P", "credit": 2.1, "full_marks": 50},
+    ]
+    (tmp_path / "fractional.json").write_text(json.dumps({"semesters": {"Sem 1": subjects[:2], "Sem 2": subjects[2:]}}))
+    index = gpa_registry.get_program("fractional").index
+    layout = cohort_layout(index)
+
+    # 1.5 credits at A (4.0) and 3 credits at C (2.0): 12 / 4.5
+    marks = {"Sem 1": {"FR 101_L+T": 80, "FR 102_L+T": 50}, "Sem 2": {}}
+    result = calculate_cohort_gpa(marks_matrix([marks], layout), layout)
+    assert grade_results(marks, index)["cgpa"] == result["cgpa"][0] == 2.67
+    assert result["credits"][0] == 4.5
+
+    rng = random.Random(0)
+    cohort = [
+        {
+            semester_name: {
+                c.key: rng.randint(0, c.full_marks * 2) / 2 for c in semester.components if rng.random() < 0.8
+            }
+            for semester_name, semester in index.semesters.items()
+        }
+        for _ in range(300)
+    ]
+    result = calculate_cohort_gpa(marks_matrix(cohort, layout), layout)
+    for i, semester_marks in enumerate(cohort):
+        for s, semester_name in enumerate(layout.semester_names):
+            expected = calculate_semester_gpa(semester_marks[semester_name], semester_name, index)
+            actual = (result["semester_gpa"][i, s], result["semester_weighted"][i, s], result["semester_credits"][i, s])
+            assert tuple(map(float, actual)) == expected, (i, semester_name)
+        actual = (result["cgpa"][i], result["weighted"][i], result["credits"][i])
+        assert tuple(map(float, actual)) == calculate_cumulative_gpa(semester_marks, index), i
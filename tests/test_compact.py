@@ -0,0 +1,54 @@
+import math
+
+import numpy as np
+import pytest
+
+from conftest import synthetic_matrix, to_semester_marks
+from gpa_batch import calculate_cohort_gpa, marks_matrix
+from gpa_compact import empty_row, marks_row, row_from_bytes, row_totals, rows_matrix, semester_marks_from_row
+from gpa_core import CURRICULUM_INDEX, build_running_totals, totals_gpa
+
+
+@pytest.fixture
+def cohort():
+    return [to_semester_marks(row) for row in synthetic_matrix(200, seed=3)]
+
+
+def test_rows_round_trip(cohort, full_transcript):
+    for all_semester_marks in cohort + [full_transcript]:
+        row = marks_row(all_semester_marks)
+        assert semester_marks_from_row(row) == all_semester_marks
+        assert row_from_bytes(row.tobytes()).tobytes() == row.tobytes()
+
+
+def test_marks_round_to_two_decimals():
+    semester_name = next(iter(CURRICULUM_INDEX.semesters))
+    key = CURRICULUM_INDEX.semesters[semester_name].components[0].key
+    row = marks_row({semester_name: {key: 72.33}})
+    assert semester_marks_from_row(row)[semester_name] == {key: 72.33}
+
+
+def test_empty_row():
+    row = empty_row()
+    assert len(row) == len(CURRICULUM_INDEX.components)
+    assert all(math.isnan(marks) for marks in row)
+    assert totals_gpa(row_totals(row)) == totals_gpa(build_running_totals({}))
+
+
+def test_row_totals_match_running_totals(cohort, full_transcript):
+    for all_semester_marks in cohort + [full_transcript]:
+        assert totals_gpa(row_totals(marks_row(all_semester_marks))) == totals_gpa(build_running_totals(all_semester_marks))
+
+
+def test_rows_matrix_grades_like_marks_matrix(cohort):
+    matrix = rows_matrix([marks_row(all_semester_marks) for all_semester_marks in cohort])
+    expected = marks_matrix(cohort)
+    assert matrix.shape == expected.shape
+    np.testing.assert_array_equal(matrix, expected)
+    np.testing.assert_array_equal(calculate_cohort_gpa(matrix)["cgpa"], calculate_cohort_gpa(expected)["cgpa"])
+
+
+def test_rows_matrix_empty():
+    matrix = rows_matrix([])
+    assert matrix.shape == marks_matrix([]).shape == (0, len(CURRICULUM_INDEX.components))
+    assert calculate_cohort_gpa(matrix)["cgpa"].shape == (0,)
@@ -0,0 +1,30 @@
+import io
+
+import pytest
+
+from conftest import eager_export
+from gpa_export import EXPORT_COLUMNS, export_csv, export_json, export_parquet, freeze_marks
+
+pd = pytest.importorskip("pandas")
+
+
+def test_payloads_match_eager_export(full_transcript):
+    csv, json_data = eager_export(full_transcript)
+    snapshot = freeze_marks(full_transcript)
+    assert export_csv(snapshot) == csv
+    assert export_json(snapshot) == json_data
+
+
+def test_parquet_round_trip(full_transcript):
+    pytest.importorskip("pyarrow")
+    frame = pd.read_parquet(io.BytesIO(export_parquet(freeze_marks(full_transcript))))
+    assert list(frame.columns) == EXPORT_COLUMNS
+    assert len(frame) == sum(1 for marks_data in full_transcript.values() for marks in marks_data.values() if marks > 0)
+
+
+def test_snapshot_tracks_edits(full_transcript):
+    before = export_csv(freeze_marks(full_transcript))
+    semester_name = next(iter(full_transcript))
+    key = next(iter(full_transcript[semester_name]))
+    full_transcript[semester_name][key] = 1.0 if full_transcript[semester_name][key] == 0 else 0.0
+    assert export_csv(freeze_marks(full_transcript)) != before
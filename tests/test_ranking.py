@@ -0,0 +1,77 @@
+import gc
+import random
+from bisect import bisect_right
+
+from gpa_core import build_running_totals
+from gpa_ranking import AnonymousEntry, RankingIndex
+
+
+def test_ties_share_a_rank():
+    ranking = RankingIndex()
+    for student_id, cgpa in [("a", 3.5), ("b", 3.5), ("c", 3.0), ("d", 3.8)]:
+        ranking.update(student_id, cgpa)
+    assert ranking.rank("d") == (1, 4)
+    assert ranking.rank("a") == ranking.rank("b") == (2, 4)
+    assert ranking.rank("c") == (4, 4)
+    assert ranking.percentile("a") == 25.0
+    assert ranking.percentile("c") == 0.0
+    # Ties in a bucket are listed by student id
+    assert ranking.top(3) == [("d", 3.8), ("a", 3.5), ("b", 3.5)]
+
+
+def test_update_moves_and_remove_drops():
+    ranking = RankingIndex()
+    ranking.update("a", 2.0)
+    ranking.update("b", 3.0)
+    ranking.update("a", 3.9)
+    assert ranking.rank("a") == (1, 2)
+
+    ranking.remove("a")
+    assert ranking.rank("a") is None and ranking.percentile("a") is None
+    assert len(ranking) == 1 and ranking.rank("b") == (1, 1)
+    ranking.remove("a")  # removing an unranked student is a no-op
+    assert ranking.top(5) == [("b", 3.0)]
+
+
+def test_out_of_range_cgpas_are_clamped():
+    ranking = RankingIndex(max_cgpa=4.0)
+    ranking.update("high", 7.5)
+    ranking.update("low", -1.0)
+    ranking.update("top", 4.0)
+    assert ranking.top(3) == [("high", 4.0), ("top", 4.0), ("low", 0.0)]
+    assert ranking.rank("high") == ranking.rank("top") == (1, 3)
+
+
+def test_students_without_graded_credits_are_not_ranked():
+    ranking = RankingIndex()
+    ranking.update_totals("empty", build_running_totals({}))
+    assert len(ranking) == 0
+
+
+def test_matches_a_full_sort():
+    rng = random.Random(0)
+    ranking = RankingIndex()
+    cgpas = {}
+    for _ in range(5000):
+        student_id = f"S{rng.randrange(500):03d}"
+        cgpas[student_id] = round(rng.uniform(0, 4), 2)
+        ranking.update(student_id, cgpas[student_id])
+
+    ordered = sorted(cgpas.values())
+    for student_id, cgpa in cgpas.items():
+        assert ranking.rank(student_id) == (len(ordered) - bisect_right(ordered, cgpa) + 1, len(ordered))
+    assert ranking.top(10) == sorted(cgpas.items(), key=lambda item: (-item[1], item[0]))[:10]
+
+
+def test_anonymous_entry_leaves_rankings_when_collected():
+    civil, other = RankingIndex(), RankingIndex()
+    entry = AnonymousEntry("session:abc")
+    for ranking in (civil, other, civil):
+        entry.track(ranking)
+        ranking.update(entry.student_id, 3.2)
+    civil.update("named", 3.0)
+
+    del entry
+    gc.collect()
+    assert civil.rank("session:abc") is None and other.rank("session:abc") is None
+    assert len(civil) == 1 and len(other) == 0
@@ -0,0 +1,56 @@
+import json
+import re
+
+import pytest
+
+import gpa_registry
+
+SUBJECT = {"code": "MN 101", "name": "Intro", "type": "L+T", "credit": 3, "full_marks": 100}
+
+
+@pytest.fixture
+def programs_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("GPA_PROGRAMS_DIR", str(tmp_path / "programs"))
+    monkeypatch.setenv("GPA_CACHE_DIR", str(tmp_path / "cache"))
+    (tmp_path / "programs").mkdir()
+    return tmp_path / "programs"
+
+
+def write_program(programs_dir, program_id, data):
+    path = programs_dir / f"{program_id}.json"
+    path.write_text(data if isinstance(data, str) else json.dumps(data), encoding="utf-8")
+    return str(path)
+
+
+def test_loads_valid_program(programs_dir):
+    write_program(programs_dir, "valid_mini", {
+        "name": "Mini",
+        "grade_table": [{"min": 0, "grade": "F", "point": 0.0}, {"min": 50, "grade": "P", "point": 2.0}],
+        "semesters": {"Sem 1": [SUBJECT]},
+    })
+    program = gpa_registry.get_program("valid_mini")
+    assert program.name == "Mini"
+    assert program.index.band_mins == (0, 50)
+
+
+@pytest.mark.parametrize("data", [
+    "{not json",
+    [],
+    {"semesters": []},
+    {"semesters": {"Sem 1": "MN 101"}},
+    {"semesters": {"Sem 1": ["MN 101"]}},
+    {"semesters": {"Sem 1": [{"code": "MN 101"}]}},
+    {"semesters": {"Sem 1": [dict(SUBJECT, credit="3")]}},
+    {"semesters": {"Sem 1": [dict(SUBJECT, full_marks=0)]}},
+    {"semesters": {"Sem 1": [SUBJECT, SUBJECT]}},
+    {"semesters": {"Sem 1": [SUBJECT]}, "grade_table": {"min": 0}},
+    {"semesters": {"Sem 1": [SUBJECT]}, "grade_table": [0]},
+    {"semesters": {"Sem 1": [SUBJECT]}, "grade_table": [{"min": 0, "grade": "F"}]},
+    {"semesters": {"Sem 1": [SUBJECT]}, "grade_table": [{"min": "0", "grade": "F", "point": 0.0}]},
+    {"semesters": {"Sem 1": [SUBJECT]}, "grade_table": [{"min": 40, "grade": "P", "point": 2.0}]},
+    {"semesters": {"Sem 1": [SUBJECT]}, "grade_table": [{"min": 0, "grade": "F", "point": 0.125}]},
+])
+def test_malformed_program_is_value_error_naming_file(programs_dir, data):
+    path = write_program(programs_dir, "broken", data)
+    with pytest.raises(ValueError, match=re.escape(path)):
+        gpa_registry.get_program("broken")
@@ -0,0 +1,36 @@
+import csv
+import os
+
+import pytest
+
+from gpa_reports import INDEX_FILE, generate_reports, report_filename
+
+
+def test_report_filenames_stay_distinct():
+    names = [report_filename(student_id) for student_id in ("a/b", "a_b", "a b", "S-001", ".x", "x")]
+    assert len(set(names)) == len(names)
+    assert report_filename("S-001") == "S-001.html"
+
+
+@pytest.mark.parametrize("student_id", ["", ".", ".."])
+def test_report_filename_rejects_unusable_ids(student_id):
+    with pytest.raises(ValueError, match="no characters usable"):
+        report_filename(student_id)
+
+
+def test_generate_reports_writes_sheets_and_index(tmp_path, full_transcript):
+    records = [("s1", full_transcript), ("a/b", {"Year 1 - Part I": {"SH 101_L+T": 80}})]
+    assert generate_reports(records, str(tmp_path), chunk_size=1) == 2
+
+    with open(tmp_path / INDEX_FILE, encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))[1:]
+    assert [row[0] for row in rows] == ["s1", "a/b"]
+    assert all(os.path.exists(tmp_path / row[3]) for row in rows)
+
+
+def test_generate_reports_rejects_repeated_student(tmp_path):
+    records = [("x", {}), ("y", {}), ("x", {"Year 1 - Part I": {"SH 101_L+T": 80}})]
+    with pytest.raises(ValueError, match="student x: appears more than once"):
+        generate_reports(records, str(tmp_path), chunk_size=1)
+    with open(tmp_path / "x.html", encoding="utf-8") as f:
+        assert "SH 101" not in f.read()  # the first sheet for x was not overwritten
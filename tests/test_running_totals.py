@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from conftest import random_marks
+from gpa_core import (
+    CURRICULUM_INDEX, apply_mark_change, build_running_totals, calculate_cumulative_gpa,
+    calculate_semester_gpa, calculate_weighted_point, scaled_weighted_point, totals_gpa,
+)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_edits_match_full_recompute(seed):
+    rng = random.Random(seed)
+    semester_marks = {name: {} for name in CURRICULUM_INDEX.semesters}
+    totals = build_running_totals(semester_marks)
+
+    for _ in range(3000):
+        component = rng.choice(CURRICULUM_INDEX.components)
+        semester_name, key = component.semester, component.key
+        # One edit in ten clears the component again (None = not taken)
+        marks = None if rng.random() < 0.1 else random_marks(rng, component)
+
+        apply_mark_change(totals, semester_name, key, semester_marks[semester_name].get(key), marks)
+        if marks is None:
+            semester_marks[semester_name].pop(key, None)
+        else:
+            semester_marks[semester_name][key] = marks
+
+        full = calculate_semester_gpa(semester_marks[semester_name], semester_name)
+        assert totals_gpa(totals["semesters"][semester_name]) == full
+        assert totals_gpa(totals) == calculate_cumulative_gpa(semester_marks)
+
+    assert totals == build_running_totals(semester_marks)
+
+
+def test_build_from_full_transcript(full_transcript):
+    totals = build_running_totals(full_transcript)
+    assert totals_gpa(totals) == calculate_cumulative_gpa(full_transcript)
+    for semester_name, marks_data in full_transcript.items():
+        assert totals_gpa(totals["semesters"][semester_name]) == calculate_semester_gpa(marks_data, semester_name)
+
+
+def test_weighted_point_helpers():
+    assert calculate_weighted_point(3.7, 3) == pytest.approx(11.1)
+    assert scaled_weighted_point(3.7, 3) == 1110
+    assert scaled_weighted_point(3.3, 1.5) == 495
@@ -0,0 +1,99 @@
+import copy
+import os
+
+import pytest
+
+from gpa_sessions import SessionMemoryManager
+
+
+class FakeSessionState(dict):
+    """dict with the st.session_state methods the manager uses"""
+
+    def to_dict(self):
+        return dict(self)
+
+
+def session_state(marks):
+    return FakeSessionState(
+        semester_marks={"Year 1 - Part I": {"SH 101_L+T": marks}},
+        program_marks={},
+        running_totals={"weighted": marks * 100, "credits": 3},
+        projection={"key": "k", "result": object()},
+        input_x=marks,
+    )
+
+
+def spilled_state(state):
+    return {key: state[key] for key in ("semester_marks", "running_totals")}
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return SessionMemoryManager(budget_bytes=1, idle_seconds=60, spill_dir=str(tmp_path))
+
+
+def test_spill_dir_is_private(manager, tmp_path):
+    assert os.path.dirname(manager.spill_dir) == str(tmp_path)
+    assert os.stat(manager.spill_dir).st_mode & 0o777 == 0o700
+
+
+def test_idle_session_spills_and_restores(manager):
+    idle, active = session_state(70.0), session_state(80.0)
+    original = copy.deepcopy(spilled_state(idle))
+
+    manager.begin(idle, "idle")
+    manager.end(idle)
+    idle["_memory"].last_seen -= 120  # idle for two minutes
+    manager.begin(active, "active")
+    manager.end(active)
+
+    # Containers are emptied in place, the recomputable projection is dropped
+    assert idle["semester_marks"] == {} and idle["running_totals"] == {} and idle["projection"] == {}
+    assert active["semester_marks"]  # active within idle_seconds: kept
+    assert manager.stats()["spilled"] == 1
+    assert len(os.listdir(manager.spill_dir)) == 1
+
+    manager.begin(idle, "idle")
+    assert spilled_state(idle) == original
+    assert os.listdir(manager.spill_dir) == []
+    assert manager.stats()["restores"] == 1
+
+
+def test_session_spills_itself_with_no_idle_time(tmp_path):
+    manager = SessionMemoryManager(budget_bytes=1, idle_seconds=0, spill_dir=str(tmp_path))
+    state = session_state(65.0)
+    original = copy.deepcopy(spilled_state(state))
+
+    manager.begin(state, "s")
+    manager.end(state)
+    assert state["_memory"].spilled and state["semester_marks"] == {}
+
+    manager.begin(state, "s")
+    assert spilled_state(state) == original
+    manager.end(state)
+
+
+@pytest.mark.parametrize("finished_rerun", [False, True])
+def test_rerun_during_spill_keeps_newer_state(tmp_path, finished_rerun):
+    manager = SessionMemoryManager(budget_bytes=1, idle_seconds=0, spill_dir=str(tmp_path))
+    state = session_state(50.0)
+    manager.begin(state, "s")
+    manager.end(state)
+    manager.begin(state, "s")  # restore, then pick it as a victim without writing yet
+
+    state["_memory"].running = False
+    victims = manager._pick_victims()
+    assert [entry for entry, _, _ in victims] == [state["_memory"]]
+
+    # The session reruns and edits a mark while its file is being written
+    state["_memory"].running = True
+    state["semester_marks"]["Year 1 - Part I"]["SH 101_L+T"] = 90.0
+    if finished_rerun:
+        state["_memory"].running = False
+        state["_memory"].last_seen += 1
+    for victim in victims:
+        manager._spill(*victim)
+
+    assert state["semester_marks"] == {"Year 1 - Part I": {"SH 101_L+T": 90.0}}
+    assert not state["_memory"].spilled and not state["_memory"].spilling
+    assert os.listdir(manager.spill_dir) == []
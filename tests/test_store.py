@@ -0,0 +1,115 @@
+import sqlite3
+
+import pytest
+
+from gpa_store import MarksStore
+
+SEMESTER = "Year 1 - Part I"
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "marks.db")
+
+
+@pytest.fixture
+def store(db_path):
+    # No background flushes during a test: only max_pending, flush() and close() write
+    store = MarksStore(db_path, flush_interval=3600, max_pending=100)
+    yield store
+    store.close()
+
+
+def stored_rows(db_path):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT student_id, program, semester, component_key, marks FROM marks ORDER BY 1, 4").fetchall()
+
+
+def test_load_sees_pending_edits(store, db_path):
+    store.set_mark("s1", SEMESTER, "SH 101_L+T", 80.0)
+    store.set_mark("s1", SEMESTER, "CE 102_L+T", 60.0)
+    assert stored_rows(db_path) == []  # still buffered
+    assert store.load_student("s1")[SEMESTER] == {"SH 101_L+T": 80.0, "CE 102_L+T": 60.0}
+
+    store.flush()
+    store.set_mark("s1", SEMESTER, "CE 102_L+T", None)  # pending delete of a stored mark
+    store.set_mark("s1", SEMESTER, "SH 101_L+T", 85.0)
+    assert store.load_student("s1")[SEMESTER] == {"SH 101_L+T": 85.0}
+    assert len(stored_rows(db_path)) == 2
+
+    store.flush()
+    assert stored_rows(db_path) == [("s1", "civil", SEMESTER, "SH 101_L+T", 85.0)]
+
+
+def test_buffer_flushes_when_full(db_path):
+    store = MarksStore(db_path, flush_interval=3600, max_pending=3)
+    try:
+        for i, key in enumerate(["SH 101_L+T", "CE 102_L+T"]):
+            store.set_mark("s1", SEMESTER, key, 50.0 + i)
+        assert stored_rows(db_path) == []
+        store.set_mark("s2", SEMESTER, "SH 101_L+T", 70.0)
+        assert len(stored_rows(db_path)) == 3
+    finally:
+        store.close()
+
+
+def test_close_flushes(db_path):
+    store = MarksStore(db_path, flush_interval=3600)
+    store.set_mark("s1", SEMESTER, "SH 101_L+T", 80.0)
+    store.close()
+    assert stored_rows(db_path) == [("s1", "civil", SEMESTER, "SH 101_L+T", 80.0)]
+
+
+def test_delete_student_drops_stored_and_pending(store, db_path):
+    store.set_mark("s1", SEMESTER, "SH 101_L+T", 80.0)
+    store.flush()
+    store.set_mark("s1", SEMESTER, "CE 102_L+T", 60.0)
+    store.set_mark("s2", SEMESTER, "SH 101_L+T", 70.0)
+
+    store.delete_student("s1")
+    assert store.load_student("s1")[SEMESTER] == {}
+    store.flush()
+    assert stored_rows(db_path) == [("s2", "civil", SEMESTER, "SH 101_L+T", 70.0)]
+
+
+def test_import_json_replaces_marks(store):
+    store.set_mark("s1", SEMESTER, "SH 101_L+T", 80.0)
+    store.set_mark("s1", SEMESTER, "CE 102_L+T", 60.0)
+
+    count = store.import_json("s1", {SEMESTER: {"SH 101_L+T": 55}, "Year 1 - Part II": {}})
+    assert count == 1
+    semester_marks = store.load_student("s1")
+    assert semester_marks[SEMESTER] == {"SH 101_L+T": 55.0}
+    assert dict(store.iter_students()) == {"s1": semester_marks}
+
+
+@pytest.mark.parametrize("semester_marks, message", [
+    ({"Year 9": {}}, "unknown semester"),
+    ({SEMESTER: {"XX 999_L+T": 50}}, "unknown component"),
+])
+def test_import_json_rejects_unknown_keys(store, semester_marks, message):
+    store.set_mark("s1", SEMESTER, "SH 101_L+T", 80.0)
+    with pytest.raises(ValueError, match=message):
+        store.import_json("s1", semester_marks)
+    assert store.load_student("s1")[SEMESTER] == {"SH 101_L+T": 80.0}
+
+
+def test_migrates_pre_program_database(db_path):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE marks (student_id TEXT NOT NULL, semester TEXT NOT NULL, component_key TEXT NOT NULL, "
+            "marks REAL NOT NULL, updated_at REAL NOT NULL, PRIMARY KEY (student_id, semester, component_key))"
+        )
+        conn.execute("INSERT INTO marks VALUES ('old', ?, 'SH 101_L+T', 72.5, 0)", (SEMESTER,))
+
+    store = MarksStore(db_path, flush_interval=3600)
+    try:
+        assert store.load_student("old")[SEMESTER] == {"SH 101_L+T": 72.5}
+        store.set_mark("old", SEMESTER, "CE 102_L+T", 61.0)
+        store.flush()
+    finally:
+        store.close()
+    assert stored_rows(db_path) == [
+        ("old", "civil", SEMESTER, "CE 102_L+T", 61.0),
+        ("old", "civil", SEMESTER, "SH 101_L+T", 72.5),
+    ]
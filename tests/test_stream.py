@@ -0,0 +1,52 @@
+import io
+
+import pytest
+
+from gpa_stream import read_csv_records, read_jsonl_records, read_records
+
+HEADER = "Student ID,Semester,Course Code,Component,Marks Obtained\n"
+
+
+def test_csv_groups_contiguous_students():
+    data = HEADER + "s1,Year 1 - Part I,SH 101,L+T,80\ns1,Year 1 - Part I,CE 102,L+T,60\ns2,Year 1 - Part I,SH 101,L+T,40\n"
+    records = list(read_csv_records(io.StringIO(data)))
+    assert records == [
+        ("s1", {"Year 1 - Part I": {"SH 101_L+T": 80.0, "CE 102_L+T": 60.0}}),
+        ("s2", {"Year 1 - Part I": {"SH 101_L+T": 40.0}}),
+    ]
+
+
+def test_csv_with_byte_order_mark(tmp_path):
+    path = tmp_path / "excel.csv"
+    path.write_bytes(("\ufeff" + HEADER + "s1,Year 1 - Part I,SH 101,L+T,80\ns2,Year 1 - Part I,SH 101,L+T,40\n").encode("utf-8"))
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        assert [student_id for student_id, _ in read_records(str(path), f)] == ["s1", "s2"]
+    # Also when the caller opened the file as plain UTF-8
+    with open(path, encoding="utf-8", newline="") as f:
+        assert [student_id for student_id, _ in read_records(str(path), f)] == ["s1", "s2"]
+
+
+def test_csv_without_student_ids_is_one_student():
+    data = "Semester,Course Code,Component,Marks Obtained\nYear 1 - Part I,SH 101,L+T,80\n"
+    assert list(read_csv_records(io.StringIO(data))) == [("1", {"Year 1 - Part I": {"SH 101_L+T": 80.0}})]
+
+
+def test_csv_blank_student_id():
+    data = HEADER + "s1,Year 1 - Part I,SH 101,L+T,80\n ,Year 1 - Part I,SH 101,L+T,40\n"
+    with pytest.raises(ValueError, match="line 3: blank Student ID"):
+        list(read_csv_records(io.StringIO(data)))
+
+
+def test_csv_missing_columns():
+    data = "Semester,Marks Obtained\nYear 1 - Part I,80\n"
+    with pytest.raises(ValueError, match="Course Code, Component"):
+        list(read_csv_records(io.StringIO(data)))
+
+
+@pytest.mark.parametrize("line, message", [
+    ("{not json", "line 1: invalid JSON"),
+    ("[1, 2]", "line 1: expected a JSON object, got list"),
+])
+def test_jsonl_bad_lines(line, message):
+    with pytest.raises(ValueError, match=message):
+        list(read_jsonl_records(io.StringIO(line + "\n")))
@@ -0,0 +1,41 @@
+import itertools
+import random
+
+import pytest
+
+from gpa_core import CURRICULUM_INDEX, POINT_SCALE, build_running_totals
+from gpa_target import band_options, remaining_components, solve_target
+
+
+def brute_force(totals, semester_marks, target_cgpa):
+    """Least total marks reaching the target by trying every band combination (None if unreachable)"""
+    components = remaining_components(semester_marks)
+    credits = totals["credits"] + sum(component.credit for component in components)
+    best = None
+    for combination in itertools.product(*(band_options(component) for component in components)):
+        weighted = totals["weighted"] + sum(
+            round(grade_point * POINT_SCALE) * component.credit
+            for component, (_, _, grade_point) in zip(components, combination)
+        )
+        if weighted >= round(target_cgpa * POINT_SCALE) * credits:
+            marks = sum(marks for marks, _, _ in combination)
+            best = marks if best is None else min(best, marks)
+    return best
+
+
+@pytest.mark.parametrize("seed", range(60))
+def test_solver_matches_brute_force(seed, full_transcript):
+    rng = random.Random(seed)
+    graded = [component for component in CURRICULUM_INDEX.components if component.credit > 0]
+    semester_marks = {name: dict(marks) for name, marks in full_transcript.items()}
+    for component in rng.sample(graded, 4):
+        del semester_marks[component.semester][component.key]
+    totals = build_running_totals(semester_marks)
+    target = rng.randint(200, 400) / 100
+
+    result = solve_target(totals, semester_marks, target)
+    expected = brute_force(totals, semester_marks, target)
+    assert result["reachable"] == (expected is not None)
+    if expected is not None:
+        assert result["total_marks"] == expected
+        assert result["projected_cgpa"] >= target